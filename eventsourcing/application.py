@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import logging
 import os
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import suppress
 from copy import deepcopy
 from dataclasses import dataclass
+from functools import partial
 from itertools import chain
-from threading import Event, Lock
+from queue import Full, Queue
+from threading import Event, Lock, Thread
+from time import monotonic
 from typing import (
-    TYPE_CHECKING,
     Any,
     Callable,
     ClassVar,
@@ -23,12 +28,14 @@ from typing import (
     TypeVar,
     cast,
 )
+from uuid import UUID
 from warnings import warn
 
 from eventsourcing.domain import (
     Aggregate,
     CanMutateProtocol,
     CollectEventsProtocol,
+    DeltaSnapshot,
     DomainEventProtocol,
     EventSourcingError,
     MutableOrImmutableAggregate,
@@ -41,21 +48,25 @@ from eventsourcing.domain import (
 )
 from eventsourcing.persistence import (
     ApplicationRecorder,
+    AsyncApplicationRecorder,
+    AsyncEventStore,
     DatetimeAsISO,
     DecimalAsStr,
     EventStore,
     InfrastructureFactory,
+    IntegrityError,
     Mapper,
     Notification,
     Recording,
+    StoredEvent,
+    Subscription,
     Tracking,
     Transcoder,
     UUIDAsHex,
 )
 from eventsourcing.utils import Environment, EnvType, strtobool
 
-if TYPE_CHECKING:  # pragma: nocover
-    from uuid import UUID
+logger = logging.getLogger(__name__)
 
 ProjectorFunction = Callable[
     [Optional[TMutableOrImmutableAggregate], Iterable[TDomainEvent]],
@@ -88,6 +99,8 @@ T = TypeVar("T")
 
 
 class Cache(Generic[S, T]):
+    copies_values = False
+
     def __init__(self) -> None:
         self.cache: Dict[S, Any] = {}
 
@@ -101,6 +114,11 @@ class Cache(Generic[S, T]):
             self.cache[key] = value
         return None
 
+    def close(self) -> None:
+        """
+        Closes any database connections used by the cache.
+        """
+
 
 class LRUCache(Cache[S, T]):
     """
@@ -202,6 +220,310 @@ class LRUCache(Cache[S, T]):
         return evicted_key, evicted_value
 
 
+class SizedLRUCache(Cache[S, T]):
+    """
+    Caching that tracks accesses by recency, and which is limited by the
+    total approximate size of the cached values, as returned by the given
+    'sizer' function, and optionally also by the number of cached values.
+
+    The least recently used values are evicted until the cache is within its
+    limits. A value that is larger than 'maxbytes' is not cached, and nor is
+    a value that the 'sizer' function fails to size, so that putting a value
+    in the cache after it has been recorded doesn't fail. The numbers of hits,
+    misses and evictions are counted.
+    """
+
+    def __init__(
+        self,
+        maxbytes: int,
+        sizer: Callable[[T], int],
+        maxsize: int | None = None,
+    ):
+        super().__init__()
+        self.cache: OrderedDict[S, Tuple[T, int]] = OrderedDict()
+        self.maxbytes = maxbytes
+        self.sizer = sizer
+        self.maxsize = maxsize
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = Lock()
+
+    def get(self, key: S, *, evict: bool = False) -> T:
+        with self.lock:
+            try:
+                if evict:
+                    value, size = self.cache.pop(key)
+                    self.size -= size
+                else:
+                    value, _ = self.cache[key]
+                    self.cache.move_to_end(key)
+            except KeyError:
+                self.misses += 1
+                raise
+            self.hits += 1
+            return value
+
+    def put(self, key: S, value: T) -> Any | None:
+        evicted_key = None
+        evicted_value = None
+        try:
+            size = self.sizer(value)
+        except Exception:
+            size = self.maxbytes + 1
+        with self.lock:
+            if key in self.cache:
+                self.size -= self.cache.pop(key)[1]
+            if size <= self.maxbytes:
+                self.cache[key] = (value, size)
+                self.size += size
+            while self.size > self.maxbytes or (
+                self.maxsize is not None and len(self.cache) > self.maxsize
+            ):
+                evicted_key, (evicted_value, evicted_size) = self.cache.popitem(
+                    last=False
+                )
+                self.size -= evicted_size
+                self.evictions += 1
+        return evicted_key, evicted_value
+
+
+class SnapshotCache(Cache[UUID, MutableOrImmutableAggregate]):
+    """
+    Caching that stores aggregates as snapshots in an event store, so that
+    aggregates can be cached in a database, such as an SQLite file, which is
+    shared by the processes of an application.
+
+    Only the latest cached version of an aggregate is got from the cache,
+    and older cached versions are deleted when a new version is put. Since
+    the aggregates got from this cache are reconstructed from their snapshots,
+    they don't need to be copied by the repository.
+
+    If an infrastructure 'factory' is given, it will be closed when the
+    cache is closed.
+    """
+
+    copies_values = True
+
+    def __init__(
+        self,
+        event_store: EventStore,
+        snapshot_class: Type[SnapshotProtocol] = Snapshot,
+        factory: InfrastructureFactory | None = None,
+    ):
+        super().__init__()
+        self.event_store = event_store
+        self.snapshot_class = snapshot_class
+        self.factory = factory
+
+    def get(self, key: UUID, *, evict: bool = False) -> MutableOrImmutableAggregate:
+        aggregate: MutableOrImmutableAggregate | None = project_aggregate(
+            None, self.event_store.get(key, desc=True, limit=1)
+        )
+        if aggregate is None:
+            raise KeyError(key)
+        if evict:
+            self.event_store.recorder.delete_events(key)
+        return aggregate
+
+    def put(self, key: UUID, value: MutableOrImmutableAggregate) -> None:
+        if value is not None:
+            snapshot_class = getattr(type(value), "Snapshot", self.snapshot_class)
+            # Versions that are cached by another process are already pruned.
+            with suppress(IntegrityError):
+                self.event_store.put([snapshot_class.take(value)])
+                self.event_store.recorder.delete_events(key, lt=value.version)
+
+    def close(self) -> None:
+        if self.factory is not None:
+            self.factory.close()
+
+
+def _encoded_aggregate_size(
+    mapper: Mapper,
+    aggregate: MutableOrImmutableAggregate,
+    snapshot_class: Type[SnapshotProtocol],
+) -> int:
+    snapshot_class = getattr(type(aggregate), "Snapshot", snapshot_class)
+    snapshot = snapshot_class.take(aggregate)
+    return len(mapper.transcoder.encode(snapshot.state))
+
+
+def _construct_aggregate_cache(
+    maxsize: int | None,
+    maxbytes: int | None,
+    sizer: Callable[[MutableOrImmutableAggregate], int] | None,
+) -> Cache[UUID, MutableOrImmutableAggregate] | None:
+    if maxbytes is not None:
+        if sizer is None:
+            msg = "A sizer is required to limit the size of the cache in bytes"
+            raise ProgrammingError(msg)
+        if maxsize is not None and maxsize <= 0:
+            maxsize = None
+        return SizedLRUCache(maxbytes=maxbytes, sizer=sizer, maxsize=maxsize)
+    if maxsize is None:
+        return None
+    if maxsize <= 0:
+        return Cache()
+    return LRUCache(maxsize=maxsize)
+
+
+def _copy_from_cache(
+    aggregate: TMutableOrImmutableAggregate, *, copy_on_write: bool
+) -> TMutableOrImmutableAggregate:
+    if copy_on_write and isinstance(aggregate, Aggregate):
+        return cast(TMutableOrImmutableAggregate, aggregate._copy_on_write())
+    return deepcopy(aggregate)
+
+
+def _parse_deepcopy_from_cache(value: str) -> Tuple[bool, bool]:
+    """
+    Returns whether aggregates should be copied from the cache,
+    and whether they should be copied on write, from the value of
+    the DEEPCOPY_FROM_AGGREGATE_CACHE environment variable.
+    """
+    if value.strip().lower() == "copy-on-write":
+        return True, True
+    return strtobool(value), False
+
+
+def _take_snapshot(
+    snapshot_store: EventStore,
+    aggregate: MutableOrImmutableAggregate,
+    snapshot_class: Type[SnapshotProtocol],
+) -> SnapshotProtocol:
+    """
+    Takes a snapshot of an aggregate, using the aggregate's 'Snapshot' class
+    if it has one. Delta snapshots are taken from the last base snapshot.
+    """
+    cls: Type[Any] = getattr(type(aggregate), "Snapshot", snapshot_class)
+    if not issubclass(cls, DeltaSnapshot):
+        return cast(SnapshotProtocol, cls.take(aggregate))
+    base = next(
+        snapshot_store.get(aggregate.id, desc=True, limit=1, lte=aggregate.version - 1),
+        None,
+    )
+    if isinstance(base, DeltaSnapshot) and base.is_delta:
+        base = next(
+            snapshot_store.get(
+                aggregate.id, gt=base.base_version - 1, lte=base.base_version
+            ),
+            None,
+        )
+    if not isinstance(base, DeltaSnapshot):
+        base = None
+    return cls.take(aggregate, base=base)
+
+
+async def _async_take_snapshot(
+    snapshot_store: AsyncEventStore,
+    aggregate: MutableOrImmutableAggregate,
+    snapshot_class: Type[SnapshotProtocol],
+) -> SnapshotProtocol:
+    """
+    Takes a snapshot of an aggregate, using the aggregate's 'Snapshot' class
+    if it has one. Delta snapshots are taken from the last base snapshot.
+    """
+    cls: Type[Any] = getattr(type(aggregate), "Snapshot", snapshot_class)
+    if not issubclass(cls, DeltaSnapshot):
+        return cast(SnapshotProtocol, cls.take(aggregate))
+    snapshots = await snapshot_store.get(
+        aggregate.id, desc=True, limit=1, lte=aggregate.version - 1
+    )
+    base = snapshots[0] if snapshots else None
+    if isinstance(base, DeltaSnapshot) and base.is_delta:
+        snapshots = await snapshot_store.get(
+            aggregate.id, gt=base.base_version - 1, lte=base.base_version
+        )
+        base = snapshots[0] if snapshots else None
+    if not isinstance(base, DeltaSnapshot):
+        base = None
+    return cls.take(aggregate, base=base)
+
+
+def _compose_snapshots(
+    snapshot_store: EventStore, snapshots: List[DomainEventProtocol]
+) -> List[DomainEventProtocol]:
+    """
+    Composes a delta snapshot with its base snapshot. Returns an empty list
+    if the base snapshot isn't found, so that the aggregate will be
+    reconstructed from its events.
+    """
+    if snapshots and isinstance(snapshots[0], DeltaSnapshot) and snapshots[0].is_delta:
+        delta = snapshots[0]
+        base = next(
+            snapshot_store.get(
+                delta.originator_id, gt=delta.base_version - 1, lte=delta.base_version
+            ),
+            None,
+        )
+        if not isinstance(base, DeltaSnapshot):
+            return []
+        return [delta.compose(base)]
+    return snapshots
+
+
+async def _async_compose_snapshots(
+    snapshot_store: AsyncEventStore, snapshots: List[DomainEventProtocol]
+) -> List[DomainEventProtocol]:
+    """
+    Composes a delta snapshot with its base snapshot. Returns an empty list
+    if the base snapshot isn't found, so that the aggregate will be
+    reconstructed from its events.
+    """
+    if snapshots and isinstance(snapshots[0], DeltaSnapshot) and snapshots[0].is_delta:
+        delta = snapshots[0]
+        bases = await snapshot_store.get(
+            delta.originator_id, gt=delta.base_version - 1, lte=delta.base_version
+        )
+        if not bases or not isinstance(bases[0], DeltaSnapshot):
+            return []
+        return [delta.compose(bases[0])]
+    return snapshots
+
+
+class _ReplaySnapshotting:
+    """
+    Decides whether a snapshot should be taken of an aggregate that was
+    reconstructed by replaying more than 'threshold' events, or for longer
+    than 'duration' seconds, no more than once every 'interval' seconds
+    for each aggregate.
+    """
+
+    MAXSIZE = 10000
+
+    def __init__(
+        self,
+        threshold: int | None,
+        duration: float | None,
+        interval: float,
+    ):
+        self.threshold = threshold
+        self.duration = duration
+        self.interval = interval
+        self.lock = Lock()
+        self.times: LRUCache[UUID, float] = LRUCache(maxsize=self.MAXSIZE)
+
+    def is_snapshot_due(
+        self, aggregate_id: UUID, num_events: int, duration: float
+    ) -> bool:
+        if num_events == 0 or not (
+            (self.threshold is not None and num_events > self.threshold)
+            or (self.duration is not None and duration > self.duration)
+        ):
+            return False
+        now = monotonic()
+        with self.lock:
+            try:
+                if now - self.times.get(aggregate_id) < self.interval:
+                    return False
+            except KeyError:
+                pass
+            self.times.put(aggregate_id, now)
+        return True
+
+
 class Repository:
     """Reconstructs aggregates from events in an
     :class:`~eventsourcing.persistence.EventStore`,
@@ -209,6 +531,7 @@ class Repository:
     all events."""
 
     FASTFORWARD_LOCKS_CACHE_MAXSIZE = 50
+    RECORDED_VERSIONS_CACHE_MAXSIZE = 10000
 
     def __init__(
         self,
@@ -216,9 +539,19 @@ class Repository:
         *,
         snapshot_store: EventStore | None = None,
         cache_maxsize: int | None = None,
+        cache_maxbytes: int | None = None,
+        cache_sizer: Callable[[MutableOrImmutableAggregate], int] | None = None,
+        cache: Cache[UUID, MutableOrImmutableAggregate] | None = None,
         fastforward: bool = True,
         fastforward_skipping: bool = False,
+        fastforward_subscribing: bool = False,
         deepcopy_from_cache: bool = True,
+        copy_on_write: bool = False,
+        snapshotting_replay_threshold: int | None = None,
+        snapshotting_replay_duration: float | None = None,
+        snapshotting_replay_interval: float = 60.0,
+        snapshot_class: Type[SnapshotProtocol] = Snapshot,
+        snapshotting_retention: int | None = None,
     ):
         """
         Initialises repository with given event store (an
@@ -227,19 +560,54 @@ class Repository:
         and optionally a snapshot store (an
         :class:`~eventsourcing.persistence.EventStore` for aggregate
         :class:`~eventsourcing.domain.Snapshot` objects).
+
+        If 'cache_maxbytes' is given, aggregates are cached in a
+        :class:`SizedLRUCache`, which is limited by the total of the sizes
+        of the cached aggregates returned by 'cache_sizer', and also by
+        'cache_maxsize' if that is given. Otherwise, if 'cache_maxsize' is
+        given, aggregates are cached in an :class:`LRUCache`, or without
+        limit if 'cache_maxsize' is not positive. Alternatively, a 'cache'
+        object, such as a :class:`SnapshotCache`, can be given.
+
+        If 'fastforward_subscribing' is true, the repository subscribes to the
+        event notifications of the event store's application recorder, so that
+        the latest recorded versions of aggregates are known, and cached
+        aggregates are fast-forwarded only when new events have been recorded.
+
+        If 'copy_on_write' is true, aggregates got from the cache are copied
+        by sharing the values of their attributes with the cached aggregates
+        until the aggregates are next mutated by domain events, rather than
+        being deep copied every time they are got from the cache.
+
+        If there is a snapshot store, and either 'snapshotting_replay_threshold'
+        or 'snapshotting_replay_duration' is given, a snapshot is taken of an
+        aggregate that was reconstructed by replaying more than that number of
+        events, or for longer than that number of seconds, but no more than once
+        every 'snapshotting_replay_interval' seconds for each aggregate.
+
+        If 'snapshotting_retention' is given, only that number of the latest
+        snapshots of an aggregate are kept in the snapshot store after a snapshot
+        has been taken, along with the base snapshot of a delta snapshot.
         """
         self.event_store = event_store
         self.snapshot_store = snapshot_store
+        self.snapshotting_retention = snapshotting_retention
 
-        if cache_maxsize is None:
-            self.cache: Cache[UUID, MutableOrImmutableAggregate] | None = None
-        elif cache_maxsize <= 0:
-            self.cache = Cache()
-        else:
-            self.cache = LRUCache(maxsize=cache_maxsize)
+        if cache is None:
+            cache = _construct_aggregate_cache(
+                cache_maxsize, cache_maxbytes, cache_sizer
+            )
+        self.cache = cache
         self.fastforward = fastforward
         self.fastforward_skipping = fastforward_skipping
         self.deepcopy_from_cache = deepcopy_from_cache
+        self.copy_on_write = copy_on_write
+        self.snapshot_class = snapshot_class
+        self.replay_snapshotting = _ReplaySnapshotting(
+            threshold=snapshotting_replay_threshold,
+            duration=snapshotting_replay_duration,
+            interval=snapshotting_replay_interval,
+        )
 
         # Because fast-forwarding a cached aggregate isn't thread-safe.
         self._fastforward_locks_lock = Lock()
@@ -248,6 +616,78 @@ class Repository:
         )
         self._fastforward_locks_inuse: Dict[UUID, Tuple[Lock, int]] = {}
 
+        # Latest recorded versions, so that fresh cached aggregates aren't queried.
+        self.fastforward_subscribing = False
+        self._recorded_versions_lock = Lock()
+        self._recorded_versions: LRUCache[UUID, int] = LRUCache(
+            maxsize=self.RECORDED_VERSIONS_CACHE_MAXSIZE
+        )
+        self._fastforward_subscription: Subscription | None = None
+        self._fastforward_subscription_thread: Thread | None = None
+        if self.cache and fastforward and fastforward_subscribing:
+            recorder = event_store.recorder
+            if not isinstance(recorder, ApplicationRecorder):
+                msg = "Fast-forward subscribing needs an application recorder"
+                raise ProgrammingError(msg)
+            self._fastforward_subscription = recorder.subscribe(
+                gt=recorder.max_notification_id()
+            )
+            self._fastforward_subscription_thread = Thread(
+                target=self._follow_recorded_versions,
+                args=(self._fastforward_subscription,),
+                daemon=True,
+            )
+            self.fastforward_subscribing = True
+            self._fastforward_subscription_thread.start()
+
+    def close(self) -> None:
+        """
+        Stops the repository's subscription to the event notifications
+        of its application recorder, if it has one, and closes its cache.
+        """
+        if self._fastforward_subscription is not None:
+            self._fastforward_subscription.stop()
+        if self._fastforward_subscription_thread is not None:
+            self._fastforward_subscription_thread.join()
+        if self.cache is not None:
+            self.cache.close()
+
+    def _follow_recorded_versions(self, subscription: Subscription) -> None:
+        try:
+            for notification in subscription:
+                self._note_recorded_version(
+                    notification.originator_id, notification.originator_version
+                )
+        finally:
+            # Query for new events again if the subscription fails or is stopped.
+            self.fastforward_subscribing = False
+
+    def _note_recordings(self, recordings: Sequence[Recording]) -> None:
+        if self.fastforward_subscribing:
+            for recording in recordings:
+                self._note_recorded_version(
+                    recording.notification.originator_id,
+                    recording.notification.originator_version,
+                )
+
+    def _note_recorded_version(self, aggregate_id: UUID, version: int) -> None:
+        with self._recorded_versions_lock:
+            with suppress(KeyError):
+                version = max(version, self._recorded_versions.get(aggregate_id))
+            self._recorded_versions.put(aggregate_id, version)
+
+    def _is_fastforward_needed(self, aggregate_id: UUID, version: int) -> bool:
+        if not self.fastforward:
+            return False
+        if not self.fastforward_subscribing:
+            return True
+        with self._recorded_versions_lock:
+            try:
+                return self._recorded_versions.get(aggregate_id) > version
+            except KeyError:
+                # The latest recorded version isn't known.
+                return True
+
     def get(
         self,
         aggregate_id: UUID,
@@ -276,16 +716,19 @@ class Repository:
                 )
                 # Put aggregate in the cache.
                 self.cache.put(aggregate_id, aggregate)
+                if self.fastforward_subscribing:
+                    self._note_recorded_version(aggregate_id, aggregate.version)
             else:
-                if self.fastforward:
+                if self._is_fastforward_needed(aggregate_id, aggregate.version):
                     # Fast-forward cached aggregate.
                     fastforward_lock = self._use_fastforward_lock(aggregate_id)
                     blocking = not (fastforward_skipping or self.fastforward_skipping)
                     try:
                         if fastforward_lock.acquire(blocking=blocking):
                             try:
+                                cached_version = aggregate.version
                                 new_events = self.event_store.get(
-                                    originator_id=aggregate_id, gt=aggregate.version
+                                    originator_id=aggregate_id, gt=cached_version
                                 )
                                 _aggregate = projector_func(
                                     aggregate, cast(Iterable[TDomainEvent], new_events)
@@ -293,14 +736,27 @@ class Repository:
                                 if _aggregate is None:
                                     raise AggregateNotFoundError(aggregate_id)
                                 aggregate = _aggregate
+                                self._put_fastforwarded_aggregate(
+                                    aggregate_id, aggregate, cached_version
+                                )
+                                if self.fastforward_subscribing:
+                                    self._note_recorded_version(
+                                        aggregate_id, aggregate.version
+                                    )
                             finally:
                                 fastforward_lock.release()
                     finally:
                         self._disuse_fastforward_lock(aggregate_id)
 
             # Copy mutable aggregates for commands, so bad mutations don't corrupt.
-            if deepcopy_from_cache and self.deepcopy_from_cache:
-                aggregate = deepcopy(aggregate)
+            if (
+                deepcopy_from_cache
+                and self.deepcopy_from_cache
+                and not self.cache.copies_values
+            ):
+                aggregate = _copy_from_cache(
+                    aggregate, copy_on_write=self.copy_on_write
+                )
         else:
             # Reconstruct historical version of aggregate from stored events.
             aggregate = self._reconstruct_aggregate(
@@ -308,12 +764,168 @@ class Repository:
             )
         return aggregate
 
+    def get_many(
+        self,
+        aggregate_ids: Sequence[UUID],
+        *,
+        projector_func: ProjectorFunction[
+            TMutableOrImmutableAggregate, TDomainEvent
+        ] = project_aggregate,
+        fastforward_skipping: bool = False,
+        deepcopy_from_cache: bool = True,
+    ) -> List[TMutableOrImmutableAggregate]:
+        """
+        Reconstructs the :class:`~eventsourcing.domain.Aggregate` objects
+        for the given IDs, in the same order as the IDs.
+
+        Rather than querying for each aggregate in turn, the snapshots
+        of all the aggregates are selected at once, and then the events
+        of all the aggregates are selected at once. Aggregates found in
+        the cache are fast-forwarded using the same selection of events.
+        """
+        cached: Dict[UUID, TMutableOrImmutableAggregate] = {}
+        not_cached: List[UUID] = []
+        for aggregate_id in dict.fromkeys(aggregate_ids):
+            try:
+                if not self.cache:
+                    raise KeyError(aggregate_id)
+                cached[aggregate_id] = cast(
+                    TMutableOrImmutableAggregate, self.cache.get(aggregate_id)
+                )
+            except KeyError:  # noqa: PERF203
+                not_cached.append(aggregate_id)
+
+        # Try to get snapshots of aggregates not found in the cache.
+        snapshots: Dict[UUID, List[DomainEventProtocol]] = {}
+        if self.snapshot_store is not None and not_cached:
+            snapshots = self.snapshot_store.get_many(not_cached, desc=True, limit=1)
+            for aggregate_id, aggregate_snapshots in snapshots.items():
+                snapshots[aggregate_id] = _compose_snapshots(
+                    self.snapshot_store, aggregate_snapshots
+                )
+
+        # Get events of aggregates not found in the cache,
+        # and new events of cached aggregates to fast-forward.
+        gt_versions: Dict[UUID, int] = {
+            aggregate_id: snapshots[aggregate_id][0].originator_version
+            for aggregate_id in not_cached
+            if snapshots.get(aggregate_id)
+        }
+        selected_ids = list(not_cached)
+        fastforward_ids = [
+            aggregate_id
+            for aggregate_id, aggregate in cached.items()
+            if self._is_fastforward_needed(aggregate_id, aggregate.version)
+        ]
+        for aggregate_id in fastforward_ids:
+            gt_versions[aggregate_id] = cached[aggregate_id].version
+            selected_ids.append(aggregate_id)
+        events = self.event_store.get_many(selected_ids, gt_versions=gt_versions)
+
+        aggregates: Dict[UUID, TMutableOrImmutableAggregate] = {}
+        for aggregate_id in not_cached:
+            # Reconstruct the aggregate from its events. Since the events of the
+            # aggregates are selected together, only the replay of each aggregate's
+            # events is timed when deciding whether to take a snapshot.
+            started = monotonic()
+            initial: TMutableOrImmutableAggregate | None = None
+            reconstructed = projector_func(
+                initial,
+                chain(
+                    cast(Iterable[TDomainEvent], snapshots.get(aggregate_id, [])),
+                    cast(Iterable[TDomainEvent], events[aggregate_id]),
+                ),
+            )
+            if reconstructed is None:
+                raise AggregateNotFoundError((aggregate_id, None))
+            if self.replay_snapshotting.is_snapshot_due(
+                aggregate_id, len(events[aggregate_id]), monotonic() - started
+            ):
+                self._take_replay_snapshot(reconstructed)
+            if self.cache:
+                self.cache.put(aggregate_id, reconstructed)
+                if self.fastforward_subscribing:
+                    self._note_recorded_version(aggregate_id, reconstructed.version)
+            aggregates[aggregate_id] = reconstructed
+
+        for aggregate_id in fastforward_ids:
+            cached[aggregate_id] = self._fastforward_cached_aggregate(
+                aggregate_id,
+                cached[aggregate_id],
+                events[aggregate_id],
+                projector_func,
+                blocking=not (fastforward_skipping or self.fastforward_skipping),
+            )
+        aggregates.update(cached)
+
+        # Copy mutable aggregates for commands, so bad mutations don't corrupt.
+        if (
+            self.cache
+            and deepcopy_from_cache
+            and self.deepcopy_from_cache
+            and not self.cache.copies_values
+        ):
+            aggregates = {
+                k: _copy_from_cache(v, copy_on_write=self.copy_on_write)
+                for k, v in aggregates.items()
+            }
+
+        return [aggregates[aggregate_id] for aggregate_id in aggregate_ids]
+
+    def _fastforward_cached_aggregate(
+        self,
+        aggregate_id: UUID,
+        aggregate: TMutableOrImmutableAggregate,
+        events: List[DomainEventProtocol],
+        projector_func: ProjectorFunction[TMutableOrImmutableAggregate, TDomainEvent],
+        *,
+        blocking: bool,
+    ) -> TMutableOrImmutableAggregate:
+        fastforward_lock = self._use_fastforward_lock(aggregate_id)
+        try:
+            if fastforward_lock.acquire(blocking=blocking):
+                try:
+                    # The cached aggregate may have been fast-forwarded
+                    # by another thread since the events were selected.
+                    cached_version = aggregate.version
+                    new_events = [
+                        e for e in events if e.originator_version > cached_version
+                    ]
+                    _aggregate = projector_func(
+                        aggregate, cast(Iterable[TDomainEvent], new_events)
+                    )
+                    if _aggregate is None:
+                        raise AggregateNotFoundError(aggregate_id)
+                    aggregate = _aggregate
+                    self._put_fastforwarded_aggregate(
+                        aggregate_id, aggregate, cached_version
+                    )
+                    if self.fastforward_subscribing:
+                        self._note_recorded_version(aggregate_id, aggregate.version)
+                finally:
+                    fastforward_lock.release()
+        finally:
+            self._disuse_fastforward_lock(aggregate_id)
+        return aggregate
+
+    def _put_fastforwarded_aggregate(
+        self,
+        aggregate_id: UUID,
+        aggregate: MutableOrImmutableAggregate,
+        cached_version: int,
+    ) -> None:
+        # Caches that copy values don't have the fast-forwarded aggregate.
+        assert self.cache is not None
+        if self.cache.copies_values and aggregate.version > cached_version:
+            self.cache.put(aggregate_id, aggregate)
+
     def _reconstruct_aggregate(
         self,
         aggregate_id: UUID,
         version: int | None,
         projector_func: ProjectorFunction[TMutableOrImmutableAggregate, TDomainEvent],
     ) -> TMutableOrImmutableAggregate:
+        started = monotonic()
         gt: int | None = None
 
         if self.snapshot_store is not None:
@@ -326,6 +938,7 @@ class Repository:
                     lte=version,
                 ),
             )
+            snapshots = _compose_snapshots(self.snapshot_store, snapshots)
             if snapshots:
                 gt = snapshots[0].originator_version
         else:
@@ -338,22 +951,69 @@ class Repository:
             lte=version,
         )
 
+        # Count the aggregate events as they are replayed.
+        num_events = 0
+
+        def replay() -> Iterator[DomainEventProtocol]:
+            nonlocal num_events
+            for aggregate_event in aggregate_events:
+                num_events += 1
+                yield aggregate_event
+
         # Reconstruct the aggregate from its events.
         initial: TMutableOrImmutableAggregate | None = None
         aggregate = projector_func(
             initial,
             chain(
                 cast(Iterable[TDomainEvent], snapshots),
-                cast(Iterable[TDomainEvent], aggregate_events),
+                cast(Iterable[TDomainEvent], replay()),
             ),
         )
 
         # Raise exception if "not found".
         if aggregate is None:
             raise AggregateNotFoundError((aggregate_id, version))
+
+        # Take a snapshot if replaying the events was too costly.
+        if self.replay_snapshotting.is_snapshot_due(
+            aggregate_id, num_events, monotonic() - started
+        ):
+            self._take_replay_snapshot(aggregate)
+
         # Return the aggregate.
         return aggregate
 
+    def _take_replay_snapshot(self, aggregate: MutableOrImmutableAggregate) -> None:
+        if self.snapshot_store is not None:
+            snapshot = _take_snapshot(
+                self.snapshot_store, aggregate, self.snapshot_class
+            )
+            try:
+                self.snapshot_store.put([snapshot])
+            except IntegrityError:
+                # The snapshot has already been taken.
+                pass
+            else:
+                self._delete_old_snapshots(snapshot)
+
+    def _delete_old_snapshots(self, snapshot: SnapshotProtocol) -> None:
+        if self.snapshot_store is None or not self.snapshotting_retention:
+            return
+        recorder = self.snapshot_store.recorder
+        keep = self.snapshotting_retention
+        if isinstance(snapshot, DeltaSnapshot) and snapshot.is_delta:
+            # Keep the base snapshot of a delta snapshot.
+            recorder.delete_events(
+                snapshot.originator_id, gt=snapshot.base_version, keep=keep
+            )
+            recorder.delete_events(
+                snapshot.originator_id, lt=snapshot.base_version, keep=keep
+            )
+        else:
+            recorder.delete_events(
+                snapshot.originator_id, lt=snapshot.originator_version, keep=keep
+            )
+
     def _use_fastforward_lock(self, aggregate_id: UUID) -> Lock:
         with self._fastforward_locks_lock:
             try:
@@ -392,89 +1052,284 @@ class Repository:
             return True
 
 
-@dataclass(frozen=True)
-class Section:
-    """
-    Frozen dataclass that represents a section from a :class:`NotificationLog`.
-    The :data:`items` attribute contains a list of
-    :class:`~eventsourcing.persistence.Notification` objects.
-    The :data:`id` attribute is the section ID, two integers
-    separated by a comma that described the first and last
-    notification ID that are included in the section.
-    The :data:`next_id` attribute describes the section ID
-    of the next section, and will be set if the section contains
-    as many notifications as were requested.
-
-    Constructor arguments:
-
-    :param Optional[str] id: section ID of this section e.g. "1,10"
-    :param List[Notification] items: a list of event notifications
-    :param Optional[str] next_id: section ID of the following section
-    """
-
-    id: str | None
-    items: List[Notification]
-    next_id: str | None
-
-
-class NotificationLog(ABC):
-    """
-    Abstract base class for notification logs.
-    """
-
-    @abstractmethod
-    def __getitem__(self, section_id: str) -> Section:
-        """
-        Returns a :class:`Section` of
-        :class:`~eventsourcing.persistence.Notification` objects
-        from the notification log.
-        """
-
-    @abstractmethod
-    def select(
-        self,
-        start: int,
-        limit: int,
-        stop: int | None = None,
-        topics: Sequence[str] = (),
-    ) -> List[Notification]:
-        """
-        Returns a selection of
-        :class:`~eventsourcing.persistence.Notification` objects
-        from the notification log.
-        """
-
-
-class LocalNotificationLog(NotificationLog):
-    """
-    Notification log that presents sections of event notifications
-    retrieved from an :class:`~eventsourcing.persistence.ApplicationRecorder`.
-    """
-
-    DEFAULT_SECTION_SIZE = 10
+class AsyncRepository:
+    """Reconstructs aggregates from events in an
+    :class:`~eventsourcing.persistence.AsyncEventStore`,
+    possibly using snapshot store to avoid replaying
+    all events."""
 
     def __init__(
         self,
-        recorder: ApplicationRecorder,
-        section_size: int = DEFAULT_SECTION_SIZE,
+        event_store: AsyncEventStore,
+        *,
+        snapshot_store: AsyncEventStore | None = None,
+        cache_maxsize: int | None = None,
+        cache_maxbytes: int | None = None,
+        cache_sizer: Callable[[MutableOrImmutableAggregate], int] | None = None,
+        fastforward: bool = True,
+        deepcopy_from_cache: bool = True,
+        copy_on_write: bool = False,
+        snapshotting_replay_threshold: int | None = None,
+        snapshotting_replay_duration: float | None = None,
+        snapshotting_replay_interval: float = 60.0,
+        snapshot_class: Type[SnapshotProtocol] = Snapshot,
     ):
         """
-        Initialises a local notification object with given
-        :class:`~eventsourcing.persistence.ApplicationRecorder`
-        and an optional section size.
+        Initialises repository with given event store (an
+        :class:`~eventsourcing.persistence.AsyncEventStore` for aggregate
+        :class:`~eventsourcing.domain.AggregateEvent` objects)
+        and optionally a snapshot store (an
+        :class:`~eventsourcing.persistence.AsyncEventStore` for aggregate
+        :class:`~eventsourcing.domain.Snapshot` objects).
 
-        Constructor arguments:
+        If 'cache_maxbytes' is given, aggregates are cached in a
+        :class:`SizedLRUCache`, which is limited by the total of the sizes
+        of the cached aggregates returned by 'cache_sizer', and also by
+        'cache_maxsize' if that is given. Otherwise, if 'cache_maxsize' is
+        given, aggregates are cached in an :class:`LRUCache`, or without
+        limit if 'cache_maxsize' is not positive.
 
-        :param ApplicationRecorder recorder: application recorder from which event
-            notifications will be selected
-        :param int section_size: number of notifications to include in a section
+        If 'copy_on_write' is true, aggregates got from the cache are copied
+        by sharing the values of their attributes with the cached aggregates
+        until the aggregates are next mutated by domain events, rather than
+        being deep copied every time they are got from the cache.
 
+        If there is a snapshot store, and either 'snapshotting_replay_threshold'
+        or 'snapshotting_replay_duration' is given, a snapshot is taken of an
+        aggregate that was reconstructed by replaying more than that number of
+        events, or for longer than that number of seconds, but no more than once
+        every 'snapshotting_replay_interval' seconds for each aggregate.
         """
-        self.recorder = recorder
-        self.section_size = section_size
+        self.event_store = event_store
+        self.snapshot_store = snapshot_store
 
-    def __getitem__(self, requested_section_id: str) -> Section:
-        """
+        self.cache = _construct_aggregate_cache(
+            cache_maxsize, cache_maxbytes, cache_sizer
+        )
+        self.fastforward = fastforward
+        self.deepcopy_from_cache = deepcopy_from_cache
+        self.copy_on_write = copy_on_write
+        self.snapshot_class = snapshot_class
+        self.replay_snapshotting = _ReplaySnapshotting(
+            threshold=snapshotting_replay_threshold,
+            duration=snapshotting_replay_duration,
+            interval=snapshotting_replay_interval,
+        )
+
+    async def get(
+        self,
+        aggregate_id: UUID,
+        *,
+        version: int | None = None,
+        projector_func: ProjectorFunction[
+            TMutableOrImmutableAggregate, TDomainEvent
+        ] = project_aggregate,
+        deepcopy_from_cache: bool = True,
+    ) -> TMutableOrImmutableAggregate:
+        """
+        Reconstructs an :class:`~eventsourcing.domain.Aggregate` for a
+        given ID from stored events, optionally at a particular version.
+        """
+        if self.cache and version is None:
+            try:
+                # Look for aggregate in the cache.
+                aggregate = cast(
+                    TMutableOrImmutableAggregate, self.cache.get(aggregate_id)
+                )
+            except KeyError:
+                # Reconstruct aggregate from stored events.
+                aggregate = await self._reconstruct_aggregate(
+                    aggregate_id, None, projector_func
+                )
+                # Put aggregate in the cache.
+                self.cache.put(aggregate_id, aggregate)
+            else:
+                if self.fastforward:
+                    # Fast-forward cached aggregate. Locks aren't needed, because
+                    # projecting doesn't await, but other tasks may have already
+                    # fast-forwarded the cached aggregate whilst events were
+                    # being selected.
+                    new_events = [
+                        e
+                        for e in await self.event_store.get(
+                            originator_id=aggregate_id, gt=aggregate.version
+                        )
+                        if e.originator_version > aggregate.version
+                    ]
+                    _aggregate = projector_func(
+                        aggregate, cast(Iterable[TDomainEvent], new_events)
+                    )
+                    if _aggregate is None:
+                        raise AggregateNotFoundError(aggregate_id)
+                    aggregate = _aggregate
+
+            # Copy mutable aggregates for commands, so bad mutations don't corrupt.
+            if deepcopy_from_cache and self.deepcopy_from_cache:
+                aggregate = _copy_from_cache(
+                    aggregate, copy_on_write=self.copy_on_write
+                )
+        else:
+            # Reconstruct historical version of aggregate from stored events.
+            aggregate = await self._reconstruct_aggregate(
+                aggregate_id, version, projector_func
+            )
+        return aggregate
+
+    async def _reconstruct_aggregate(
+        self,
+        aggregate_id: UUID,
+        version: int | None,
+        projector_func: ProjectorFunction[TMutableOrImmutableAggregate, TDomainEvent],
+    ) -> TMutableOrImmutableAggregate:
+        started = monotonic()
+        gt: int | None = None
+
+        snapshots: List[DomainEventProtocol] = []
+        if self.snapshot_store is not None:
+            # Try to get a snapshot.
+            snapshots = await self.snapshot_store.get(
+                originator_id=aggregate_id,
+                desc=True,
+                limit=1,
+                lte=version,
+            )
+            snapshots = await _async_compose_snapshots(self.snapshot_store, snapshots)
+            if snapshots:
+                gt = snapshots[0].originator_version
+
+        # Get aggregate events.
+        aggregate_events = await self.event_store.get(
+            originator_id=aggregate_id,
+            gt=gt,
+            lte=version,
+        )
+
+        # Reconstruct the aggregate from its events.
+        initial: TMutableOrImmutableAggregate | None = None
+        aggregate = projector_func(
+            initial,
+            chain(
+                cast(Iterable[TDomainEvent], snapshots),
+                cast(Iterable[TDomainEvent], aggregate_events),
+            ),
+        )
+
+        # Raise exception if "not found".
+        if aggregate is None:
+            raise AggregateNotFoundError((aggregate_id, version))
+
+        # Take a snapshot if replaying the events was too costly.
+        if (
+            self.snapshot_store is not None
+            and self.replay_snapshotting.is_snapshot_due(
+                aggregate_id, len(aggregate_events), monotonic() - started
+            )
+        ):
+            snapshot = await _async_take_snapshot(
+                self.snapshot_store, aggregate, self.snapshot_class
+            )
+            # The snapshot may have already been taken.
+            with suppress(IntegrityError):
+                await self.snapshot_store.put([snapshot])
+
+        # Return the aggregate.
+        return aggregate
+
+    async def contains(self, aggregate_id: UUID) -> bool:
+        """
+        Tests to see if an aggregate exists in the repository.
+        """
+        try:
+            await self.get(aggregate_id=aggregate_id)
+        except AggregateNotFoundError:
+            return False
+        else:
+            return True
+
+
+@dataclass(frozen=True)
+class Section:
+    """
+    Frozen dataclass that represents a section from a :class:`NotificationLog`.
+    The :data:`items` attribute contains a list of
+    :class:`~eventsourcing.persistence.Notification` objects.
+    The :data:`id` attribute is the section ID, two integers
+    separated by a comma that described the first and last
+    notification ID that are included in the section.
+    The :data:`next_id` attribute describes the section ID
+    of the next section, and will be set if the section contains
+    as many notifications as were requested.
+
+    Constructor arguments:
+
+    :param Optional[str] id: section ID of this section e.g. "1,10"
+    :param List[Notification] items: a list of event notifications
+    :param Optional[str] next_id: section ID of the following section
+    """
+
+    id: str | None
+    items: List[Notification]
+    next_id: str | None
+
+
+class NotificationLog(ABC):
+    """
+    Abstract base class for notification logs.
+    """
+
+    @abstractmethod
+    def __getitem__(self, section_id: str) -> Section:
+        """
+        Returns a :class:`Section` of
+        :class:`~eventsourcing.persistence.Notification` objects
+        from the notification log.
+        """
+
+    @abstractmethod
+    def select(
+        self,
+        start: int,
+        limit: int,
+        stop: int | None = None,
+        topics: Sequence[str] = (),
+    ) -> List[Notification]:
+        """
+        Returns a selection of
+        :class:`~eventsourcing.persistence.Notification` objects
+        from the notification log.
+        """
+
+
+class LocalNotificationLog(NotificationLog):
+    """
+    Notification log that presents sections of event notifications
+    retrieved from an :class:`~eventsourcing.persistence.ApplicationRecorder`.
+    """
+
+    DEFAULT_SECTION_SIZE = 10
+
+    def __init__(
+        self,
+        recorder: ApplicationRecorder,
+        section_size: int = DEFAULT_SECTION_SIZE,
+    ):
+        """
+        Initialises a local notification object with given
+        :class:`~eventsourcing.persistence.ApplicationRecorder`
+        and an optional section size.
+
+        Constructor arguments:
+
+        :param ApplicationRecorder recorder: application recorder from which event
+            notifications will be selected
+        :param int section_size: number of notifications to include in a section
+
+        """
+        self.recorder = recorder
+        self.section_size = section_size
+
+    def __getitem__(self, requested_section_id: str) -> Section:
+        """
         Returns a :class:`Section` of event notifications
         based on the requested section ID. The section ID of
         the returned section will describe the event
@@ -545,6 +1400,63 @@ class LocalNotificationLog(NotificationLog):
         return f"{first_id},{last_id}"
 
 
+class SnapshottingWorker:
+    """
+    Calls functions that take snapshots and put them in a snapshot store,
+    in order, on a background thread, so that saving aggregates isn't delayed
+    by snapshotting. Since snapshots are only an optimisation, functions are
+    discarded rather than waiting when the bounded queue is full, and errors
+    raised by the functions are counted and logged rather than raised.
+    """
+
+    def __init__(self, maxsize: int):
+        self.queue: Queue[Callable[[], Any] | None] = Queue(maxsize=maxsize)
+        self.discarded = 0
+        self.errors = 0
+        self.thread = Thread(target=self._call_functions, daemon=True)
+        self.thread.start()
+
+    def put(self, func: Callable[[], Any]) -> None:
+        """
+        Puts a function on the queue, or discards it if the queue is full.
+        """
+        try:
+            self.queue.put_nowait(func)
+        except Full:
+            self.discarded += 1
+
+    def join(self) -> None:
+        """
+        Blocks until all the functions on the queue have been called.
+        """
+        self.queue.join()
+
+    def close(self) -> None:
+        """
+        Stops the background thread after the functions on the queue
+        have been called.
+        """
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+
+    def _call_functions(self) -> None:
+        while True:
+            func = self.queue.get()
+            try:
+                if func is None:
+                    break
+                func()
+            except IntegrityError:
+                # The snapshot has already been taken.
+                pass
+            except Exception:
+                self.errors += 1
+                logger.exception("Error calling snapshotting function")
+            finally:
+                self.queue.task_done()
+
+
 class ProcessingEvent:
     """
     Keeps together a :class:`~eventsourcing.persistence.Tracking`
@@ -609,12 +1521,14 @@ class RecordingEvent:
         self.previous_max_notification_id = previous_max_notification_id
 
 
-class Application:
+class BaseApplication:
     """
-    Base class for event-sourced applications.
+    Base class for :class:`Application` and :class:`AsyncApplication`,
+    which configures the environment, the infrastructure factory, and
+    the mapper, and which decides when snapshots are to be taken.
     """
 
-    name = "Application"
+    name = "BaseApplication"
     env: ClassVar[Dict[str, str]] = {}
     is_snapshotting_enabled: bool = False
     snapshotting_intervals: ClassVar[
@@ -624,68 +1538,27 @@ class Application:
         Dict[Type[MutableOrImmutableAggregate], ProjectorFunction[Any, Any]] | None
     ] = None
     snapshot_class: Type[SnapshotProtocol] = Snapshot
-    log_section_size = 10
-    notify_topics: Sequence[str] = []
+    factory: InfrastructureFactory
 
     AGGREGATE_CACHE_MAXSIZE = "AGGREGATE_CACHE_MAXSIZE"
+    AGGREGATE_CACHE_MAXBYTES = "AGGREGATE_CACHE_MAXBYTES"
+    AGGREGATE_CACHE_SQLITE_DBNAME = "AGGREGATE_CACHE_SQLITE_DBNAME"
     AGGREGATE_CACHE_FASTFORWARD = "AGGREGATE_CACHE_FASTFORWARD"
     AGGREGATE_CACHE_FASTFORWARD_SKIPPING = "AGGREGATE_CACHE_FASTFORWARD_SKIPPING"
+    AGGREGATE_CACHE_FASTFORWARD_SUBSCRIBING = "AGGREGATE_CACHE_FASTFORWARD_SUBSCRIBING"
     DEEPCOPY_FROM_AGGREGATE_CACHE = "DEEPCOPY_FROM_AGGREGATE_CACHE"
+    SNAPSHOTTING_REPLAY_THRESHOLD = "SNAPSHOTTING_REPLAY_THRESHOLD"
+    SNAPSHOTTING_REPLAY_DURATION = "SNAPSHOTTING_REPLAY_DURATION"
+    SNAPSHOTTING_REPLAY_INTERVAL = "SNAPSHOTTING_REPLAY_INTERVAL"
+    SNAPSHOTTING_IN_BACKGROUND = "SNAPSHOTTING_IN_BACKGROUND"
+    SNAPSHOTTING_QUEUE_MAXSIZE = "SNAPSHOTTING_QUEUE_MAXSIZE"
+    SNAPSHOTTING_RETENTION = "SNAPSHOTTING_RETENTION"
+    EVENT_STORE_PAGE_SIZE = "EVENT_STORE_PAGE_SIZE"
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         if "name" not in cls.__dict__:
             cls.name = cls.__name__
 
-    def __init__(self, env: EnvType | None = None) -> None:
-        """
-        Initialises an application with an
-        :class:`~eventsourcing.persistence.InfrastructureFactory`,
-        a :class:`~eventsourcing.persistence.Mapper`,
-        an :class:`~eventsourcing.persistence.ApplicationRecorder`,
-        an :class:`~eventsourcing.persistence.EventStore`,
-        a :class:`~eventsourcing.application.Repository`, and
-        a :class:`~eventsourcing.application.LocalNotificationLog`.
-        """
-        self.env = self.construct_env(self.name, env)  # type: ignore[misc]
-        self.factory = self.construct_factory(self.env)
-        self.mapper = self.construct_mapper()
-        self.recorder = self.construct_recorder()
-        self.events = self.construct_event_store()
-        self.snapshots: EventStore | None = None
-        if self.factory.is_snapshotting_enabled():
-            self.snapshots = self.construct_snapshot_store()
-        self._repository = self.construct_repository()
-        self._notification_log = self.construct_notification_log()
-        self.closing = Event()
-        self.previous_max_notification_id: int | None = (
-            self.recorder.max_notification_id()
-        )
-
-    @property
-    def repository(self) -> Repository:
-        """
-        An application's repository reconstructs aggregates from stored events.
-        """
-        return self._repository
-
-    @property
-    def notification_log(self) -> LocalNotificationLog:
-        """
-        An application's notification log presents all the aggregate events
-        of an application in the order they were recorded as a sequence of event
-        notifications.
-        """
-        return self._notification_log
-
-    @property
-    def log(self) -> LocalNotificationLog:
-        warn(
-            "'log' is deprecated, use 'notifications' instead",
-            DeprecationWarning,
-            stacklevel=2,
-        )
-        return self._notification_log
-
     def construct_env(self, name: str, env: EnvType | None = None) -> Environment:
         """
         Constructs environment from which application will be configured.
@@ -730,12 +1603,137 @@ class Application:
         transcoder.register(DecimalAsStr())
         transcoder.register(DatetimeAsISO())
 
-    def construct_recorder(self) -> ApplicationRecorder:
-        """
-        Constructs an :class:`~eventsourcing.persistence.ApplicationRecorder`
-        for use by the application.
-        """
-        return self.factory.application_recorder()
+    def _snapshots_to_take(
+        self, processing_event: ProcessingEvent
+    ) -> Iterator[Tuple[UUID, int, ProjectorFunction[Any, Any]]]:
+        # Decide snapshots using IDs and types.
+        if self.snapshotting_intervals:
+            for event in processing_event.events:
+                try:
+                    aggregate = processing_event.aggregates[event.originator_id]
+                except KeyError:
+                    continue
+                interval = self.snapshotting_intervals.get(type(aggregate))
+                if interval is not None and event.originator_version % interval == 0:
+                    if (
+                        self.snapshotting_projectors
+                        and type(aggregate) in self.snapshotting_projectors
+                    ):
+                        projector_func = self.snapshotting_projectors[type(aggregate)]
+                    else:
+                        projector_func = project_aggregate
+                    if projector_func is project_aggregate and not isinstance(
+                        event, CanMutateProtocol
+                    ):
+                        msg = (
+                            f"Cannot take snapshot for {type(aggregate)} with "
+                            "default project_aggregate() function, because its "
+                            f"domain event {type(event)} does not implement "
+                            "the 'can mutate' protocol (see CanMutateProtocol)."
+                            f" Please define application class {type(self)}"
+                            " with class variable 'snapshotting_projectors', "
+                            f"to be a dict that has {type(aggregate)} as a key "
+                            "with the aggregate projector function for "
+                            f"{type(aggregate)} as the value for that key."
+                        )
+                        raise ProgrammingError(msg)
+                    yield event.originator_id, event.originator_version, projector_func
+
+    def _get_saved_aggregate(
+        self, processing_event: ProcessingEvent, aggregate_id: UUID, version: int
+    ) -> MutableOrImmutableAggregate | None:
+        """
+        Returns a saved aggregate object, if the aggregate has the given
+        version, so that snapshots can be taken without reconstructing
+        the aggregate.
+        """
+        aggregate = processing_event.aggregates.get(aggregate_id)
+        if aggregate is None or aggregate.version != version:
+            return None
+        return aggregate
+
+    def _check_snapshots_enabled(self, snapshots: object | None) -> None:
+        if snapshots is None:
+            msg = (
+                "Can't take snapshot without snapshots store. Please "
+                "set environment variable IS_SNAPSHOTTING_ENABLED to "
+                "a true value (e.g. 'y'), or set 'is_snapshotting_enabled' "
+                "on application class, or set 'snapshotting_intervals' on "
+                "application class."
+            )
+            raise AssertionError(msg)
+
+
+class Application(BaseApplication):
+    """
+    Base class for event-sourced applications.
+    """
+
+    name = "Application"
+    log_section_size = 10
+    notify_topics: Sequence[str] = []
+
+    def __init__(self, env: EnvType | None = None) -> None:
+        """
+        Initialises an application with an
+        :class:`~eventsourcing.persistence.InfrastructureFactory`,
+        a :class:`~eventsourcing.persistence.Mapper`,
+        an :class:`~eventsourcing.persistence.ApplicationRecorder`,
+        an :class:`~eventsourcing.persistence.EventStore`,
+        a :class:`~eventsourcing.application.Repository`, and
+        a :class:`~eventsourcing.application.LocalNotificationLog`.
+        """
+        self.env = self.construct_env(self.name, env)  # type: ignore[misc]
+        self.factory = self.construct_factory(self.env)
+        self.mapper = self.construct_mapper()
+        self.recorder = self.construct_recorder()
+        self.events = self.construct_event_store()
+        self.snapshots: EventStore | None = None
+        self.snapshotting_worker: SnapshottingWorker | None = None
+        if self.factory.is_snapshotting_enabled():
+            self.snapshots = self.construct_snapshot_store()
+            if strtobool(self.env.get(self.SNAPSHOTTING_IN_BACKGROUND, "n")):
+                self.snapshotting_worker = SnapshottingWorker(
+                    maxsize=int(self.env.get(self.SNAPSHOTTING_QUEUE_MAXSIZE, "100"))
+                )
+        self._repository = self.construct_repository()
+        self._notification_log = self.construct_notification_log()
+        self.closing = Event()
+        self.previous_max_notification_id: int | None = (
+            self.recorder.max_notification_id()
+        )
+
+    @property
+    def repository(self) -> Repository:
+        """
+        An application's repository reconstructs aggregates from stored events.
+        """
+        return self._repository
+
+    @property
+    def notification_log(self) -> LocalNotificationLog:
+        """
+        An application's notification log presents all the aggregate events
+        of an application in the order they were recorded as a sequence of event
+        notifications.
+        """
+        return self._notification_log
+
+    @property
+    def log(self) -> LocalNotificationLog:
+        warn(
+            "'log' is deprecated, use 'notifications' instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self._notification_log
+
+    def construct_recorder(self) -> ApplicationRecorder:
+        """
+        Constructs an :class:`~eventsourcing.persistence.ApplicationRecorder`
+        for use by the application.
+        """
+        return self.factory.application_recorder()
 
     def construct_event_store(self) -> EventStore:
         """
@@ -743,9 +1741,12 @@ class Application:
         for use by the application to store and retrieve aggregate
         :class:`~eventsourcing.domain.AggregateEvent` objects.
         """
+        page_size_envvar = self.env.get(self.EVENT_STORE_PAGE_SIZE)
+        page_size = int(page_size_envvar) if page_size_envvar else None
         return self.factory.event_store(
             mapper=self.mapper,
             recorder=self.recorder,
+            page_size=page_size,
         )
 
     def construct_snapshot_store(self) -> EventStore:
@@ -760,25 +1761,94 @@ class Application:
             recorder=recorder,
         )
 
+    def aggregate_size(self, aggregate: MutableOrImmutableAggregate) -> int:
+        """
+        Returns the approximate size in bytes of the given aggregate, which is
+        used to limit the size of the aggregate cache when the environment
+        variable AGGREGATE_CACHE_MAXBYTES is set. By default, this is the length
+        of the state of a snapshot of the aggregate, encoded by the application's
+        transcoder. Since this is done each time an aggregate is put in the cache,
+        it costs about as much as taking a snapshot. This method may be overridden
+        to size aggregates differently, for example more cheaply.
+        """
+        return _encoded_aggregate_size(
+            self.mapper, aggregate, type(self).snapshot_class
+        )
+
     def construct_repository(self) -> Repository:
         """
         Constructs a :class:`Repository` for use by the application.
         """
         cache_maxsize_envvar = self.env.get(self.AGGREGATE_CACHE_MAXSIZE)
         cache_maxsize = int(cache_maxsize_envvar) if cache_maxsize_envvar else None
+        cache_maxbytes_envvar = self.env.get(self.AGGREGATE_CACHE_MAXBYTES)
+        cache_maxbytes = int(cache_maxbytes_envvar) if cache_maxbytes_envvar else None
+        deepcopy_from_cache, copy_on_write = _parse_deepcopy_from_cache(
+            self.env.get(self.DEEPCOPY_FROM_AGGREGATE_CACHE, "y")
+        )
+        replay_threshold_envvar = self.env.get(self.SNAPSHOTTING_REPLAY_THRESHOLD)
+        replay_duration_envvar = self.env.get(self.SNAPSHOTTING_REPLAY_DURATION)
+        retention_envvar = self.env.get(self.SNAPSHOTTING_RETENTION)
         return Repository(
             event_store=self.events,
             snapshot_store=self.snapshots,
             cache_maxsize=cache_maxsize,
+            cache_maxbytes=cache_maxbytes,
+            cache_sizer=self.aggregate_size,
+            cache=self.construct_aggregate_cache(),
             fastforward=strtobool(self.env.get(self.AGGREGATE_CACHE_FASTFORWARD, "y")),
             fastforward_skipping=strtobool(
                 self.env.get(self.AGGREGATE_CACHE_FASTFORWARD_SKIPPING, "n")
             ),
-            deepcopy_from_cache=strtobool(
-                self.env.get(self.DEEPCOPY_FROM_AGGREGATE_CACHE, "y")
+            fastforward_subscribing=strtobool(
+                self.env.get(self.AGGREGATE_CACHE_FASTFORWARD_SUBSCRIBING, "n")
+            ),
+            deepcopy_from_cache=deepcopy_from_cache,
+            copy_on_write=copy_on_write,
+            snapshotting_replay_threshold=(
+                int(replay_threshold_envvar) if replay_threshold_envvar else None
+            ),
+            snapshotting_replay_duration=(
+                float(replay_duration_envvar) if replay_duration_envvar else None
+            ),
+            snapshotting_replay_interval=float(
+                self.env.get(self.SNAPSHOTTING_REPLAY_INTERVAL, "60")
+            ),
+            snapshot_class=type(self).snapshot_class,
+            snapshotting_retention=(
+                int(retention_envvar) if retention_envvar else None
             ),
         )
 
+    def construct_aggregate_cache(
+        self,
+    ) -> Cache[UUID, MutableOrImmutableAggregate] | None:
+        """
+        Constructs a :class:`SnapshotCache` for use by the application's
+        repository, if the environment variable AGGREGATE_CACHE_SQLITE_DBNAME
+        is set, which caches aggregates in an SQLite database that can be shared
+        by the processes of the application. Otherwise returns None, and the
+        repository will construct its own cache, if caching is enabled.
+        """
+        dbname = self.env.get(self.AGGREGATE_CACHE_SQLITE_DBNAME)
+        if not dbname:
+            return None
+        factory = InfrastructureFactory.construct(
+            Environment(
+                self.name,
+                {
+                    InfrastructureFactory.PERSISTENCE_MODULE: "eventsourcing.sqlite",
+                    "SQLITE_DBNAME": dbname,
+                },
+            )
+        )
+        recorder = factory.aggregate_recorder(purpose="aggregate_cache")
+        return SnapshotCache(
+            event_store=factory.event_store(mapper=self.mapper, recorder=recorder),
+            snapshot_class=type(self).snapshot_class,
+            factory=factory,
+        )
+
     def construct_notification_log(self) -> LocalNotificationLog:
         """
         Constructs a :class:`LocalNotificationLog` for use by the application.
@@ -814,45 +1884,37 @@ class Application:
         if self.repository.cache and not self.repository.fastforward:
             for aggregate_id, aggregate in processing_event.aggregates.items():
                 self.repository.cache.put(aggregate_id, aggregate)
+        self.repository._note_recordings(recordings)
         return recordings
 
     def _take_snapshots(self, processing_event: ProcessingEvent) -> None:
-        # Take snapshots using IDs and types.
-        if self.snapshots and self.snapshotting_intervals:
-            for event in processing_event.events:
-                try:
-                    aggregate = processing_event.aggregates[event.originator_id]
-                except KeyError:
-                    continue
-                interval = self.snapshotting_intervals.get(type(aggregate))
-                if interval is not None and event.originator_version % interval == 0:
-                    if (
-                        self.snapshotting_projectors
-                        and type(aggregate) in self.snapshotting_projectors
-                    ):
-                        projector_func = self.snapshotting_projectors[type(aggregate)]
-                    else:
-                        projector_func = project_aggregate
-                    if projector_func is project_aggregate and not isinstance(
-                        event, CanMutateProtocol
-                    ):
-                        msg = (
-                            f"Cannot take snapshot for {type(aggregate)} with "
-                            "default project_aggregate() function, because its "
-                            f"domain event {type(event)} does not implement "
-                            "the 'can mutate' protocol (see CanMutateProtocol)."
-                            f" Please define application class {type(self)}"
-                            " with class variable 'snapshotting_projectors', "
-                            f"to be a dict that has {type(aggregate)} as a key "
-                            "with the aggregate projector function for "
-                            f"{type(aggregate)} as the value for that key."
-                        )
-                        raise ProgrammingError(msg)
-                    self.take_snapshot(
-                        aggregate_id=event.originator_id,
-                        version=event.originator_version,
+        if self.snapshots:
+            for aggregate_id, version, projector_func in self._snapshots_to_take(
+                processing_event
+            ):
+                aggregate = self._get_saved_aggregate(
+                    processing_event, aggregate_id, version
+                )
+                if aggregate is None:
+                    take_snapshot = partial(
+                        self.take_snapshot,
+                        aggregate_id=aggregate_id,
+                        version=version,
                         projector_func=projector_func,
                     )
+                else:
+                    # Encode now, because the aggregate may be changed again.
+                    snapshot = _take_snapshot(
+                        self.snapshots, aggregate, type(self).snapshot_class
+                    )
+                    stored_snapshot = self.snapshots.mapper.to_stored_event(snapshot)
+                    take_snapshot = partial(
+                        self._record_snapshot, snapshot, stored_snapshot
+                    )
+                if self.snapshotting_worker is not None:
+                    self.snapshotting_worker.put(take_snapshot)
+                else:
+                    take_snapshot()
 
     def take_snapshot(
         self,
@@ -866,21 +1928,42 @@ class Application:
         Takes a snapshot of the recorded state of the aggregate,
         and puts the snapshot in the snapshot store.
         """
-        if self.snapshots is None:
-            msg = (
-                "Can't take snapshot without snapshots store. Please "
-                "set environment variable IS_SNAPSHOTTING_ENABLED to "
-                "a true value (e.g. 'y'), or set 'is_snapshotting_enabled' "
-                "on application class, or set 'snapshotting_intervals' on "
-                "application class."
-            )
-            raise AssertionError(msg)
+        self._check_snapshots_enabled(self.snapshots)
+        assert self.snapshots is not None
         aggregate = self.repository.get(
             aggregate_id, version=version, projector_func=projector_func
         )
-        snapshot_class = getattr(type(aggregate), "Snapshot", type(self).snapshot_class)
-        snapshot = snapshot_class.take(aggregate)
+        snapshot = _take_snapshot(self.snapshots, aggregate, type(self).snapshot_class)
         self.snapshots.put([snapshot])
+        self.repository._delete_old_snapshots(snapshot)
+
+    def _record_snapshot(
+        self, snapshot: SnapshotProtocol, stored_snapshot: StoredEvent
+    ) -> None:
+        assert self.snapshots is not None
+        self.snapshots.recorder.insert_events([stored_snapshot])
+        self.repository._delete_old_snapshots(snapshot)
+
+    def compact_snapshots(self, batch_size: int = 1000) -> int:
+        """
+        Deletes all except the latest snapshots of each aggregate from the
+        snapshot store, keeping the number of snapshots given by the
+        SNAPSHOTTING_RETENTION environment variable, or otherwise only the
+        latest snapshot, and returns the number of snapshots that were deleted.
+
+        Since the base snapshot of a delta snapshot may be older than the
+        latest snapshots, snapshots can't be compacted when the application's
+        snapshot class is a :class:`~eventsourcing.domain.DeltaSnapshot`.
+        """
+        self._check_snapshots_enabled(self.snapshots)
+        assert self.snapshots is not None
+        if issubclass(type(self).snapshot_class, DeltaSnapshot):
+            msg = "Delta snapshots can't be compacted"
+            raise ProgrammingError(msg)
+        return self.snapshots.recorder.compact_events(
+            keep=self.repository.snapshotting_retention or 1,
+            batch_size=batch_size,
+        )
 
     def notify(self, new_events: List[DomainEventProtocol]) -> None:
         """
@@ -902,12 +1985,215 @@ class Application:
 
     def close(self) -> None:
         self.closing.set()
+        if self.snapshotting_worker is not None:
+            self.snapshotting_worker.close()
+        self.repository.close()
         self.factory.close()
 
 
 TApplication = TypeVar("TApplication", bound=Application)
 
 
+class AsyncApplication(BaseApplication):
+    """
+    Base class for event-sourced applications that use asyncio.
+
+    Uses the same domain model and mapper as :class:`Application`, with
+    an :class:`~eventsourcing.persistence.AsyncApplicationRecorder`, an
+    :class:`~eventsourcing.persistence.AsyncEventStore`, and an
+    :class:`AsyncRepository`, so that commands can be awaited.
+    """
+
+    name = "AsyncApplication"
+
+    def __init__(self, env: EnvType | None = None) -> None:
+        """
+        Initialises an application with an
+        :class:`~eventsourcing.persistence.InfrastructureFactory`,
+        a :class:`~eventsourcing.persistence.Mapper`,
+        an :class:`~eventsourcing.persistence.AsyncApplicationRecorder`,
+        an :class:`~eventsourcing.persistence.AsyncEventStore`, and
+        an :class:`~eventsourcing.application.AsyncRepository`.
+
+        Nothing is awaited, so the application should then be
+        opened with :func:`open`, for example to create tables.
+        """
+        self.env = self.construct_env(self.name, env)  # type: ignore[misc]
+        self.factory = self.construct_factory(self.env)
+        self.mapper = self.construct_mapper()
+        self.recorder = self.construct_recorder()
+        self.events = self.construct_event_store()
+        self.snapshots: AsyncEventStore | None = None
+        if self.factory.is_snapshotting_enabled():
+            self.snapshots = self.construct_snapshot_store()
+        self._repository = self.construct_repository()
+
+    @property
+    def repository(self) -> AsyncRepository:
+        """
+        An application's repository reconstructs aggregates from stored events.
+        """
+        return self._repository
+
+    def construct_recorder(self) -> AsyncApplicationRecorder:
+        """
+        Constructs an :class:`~eventsourcing.persistence.AsyncApplicationRecorder`
+        for use by the application.
+        """
+        return self.factory.async_application_recorder()
+
+    def construct_event_store(self) -> AsyncEventStore:
+        """
+        Constructs an :class:`~eventsourcing.persistence.AsyncEventStore`
+        for use by the application to store and retrieve aggregate
+        :class:`~eventsourcing.domain.AggregateEvent` objects.
+        """
+        return self.factory.async_event_store(
+            mapper=self.mapper,
+            recorder=self.recorder,
+        )
+
+    def construct_snapshot_store(self) -> AsyncEventStore:
+        """
+        Constructs an :class:`~eventsourcing.persistence.AsyncEventStore`
+        for use by the application to store and retrieve aggregate
+        :class:`~eventsourcing.domain.Snapshot` objects.
+        """
+        recorder = self.factory.async_aggregate_recorder(purpose="snapshots")
+        return self.factory.async_event_store(
+            mapper=self.mapper,
+            recorder=recorder,
+        )
+
+    def aggregate_size(self, aggregate: MutableOrImmutableAggregate) -> int:
+        """
+        Returns the approximate size in bytes of the given aggregate, which is
+        used to limit the size of the aggregate cache when the environment
+        variable AGGREGATE_CACHE_MAXBYTES is set. By default, this is the length
+        of the state of a snapshot of the aggregate, encoded by the application's
+        transcoder. Since this is done each time an aggregate is put in the cache,
+        it costs about as much as taking a snapshot. This method may be overridden
+        to size aggregates differently, for example more cheaply.
+        """
+        return _encoded_aggregate_size(
+            self.mapper, aggregate, type(self).snapshot_class
+        )
+
+    def construct_repository(self) -> AsyncRepository:
+        """
+        Constructs an :class:`AsyncRepository` for use by the application.
+        """
+        cache_maxsize_envvar = self.env.get(self.AGGREGATE_CACHE_MAXSIZE)
+        cache_maxsize = int(cache_maxsize_envvar) if cache_maxsize_envvar else None
+        cache_maxbytes_envvar = self.env.get(self.AGGREGATE_CACHE_MAXBYTES)
+        cache_maxbytes = int(cache_maxbytes_envvar) if cache_maxbytes_envvar else None
+        deepcopy_from_cache, copy_on_write = _parse_deepcopy_from_cache(
+            self.env.get(self.DEEPCOPY_FROM_AGGREGATE_CACHE, "y")
+        )
+        replay_threshold_envvar = self.env.get(self.SNAPSHOTTING_REPLAY_THRESHOLD)
+        replay_duration_envvar = self.env.get(self.SNAPSHOTTING_REPLAY_DURATION)
+        return AsyncRepository(
+            event_store=self.events,
+            snapshot_store=self.snapshots,
+            cache_maxsize=cache_maxsize,
+            cache_maxbytes=cache_maxbytes,
+            cache_sizer=self.aggregate_size,
+            fastforward=strtobool(self.env.get(self.AGGREGATE_CACHE_FASTFORWARD, "y")),
+            deepcopy_from_cache=deepcopy_from_cache,
+            copy_on_write=copy_on_write,
+            snapshotting_replay_threshold=(
+                int(replay_threshold_envvar) if replay_threshold_envvar else None
+            ),
+            snapshotting_replay_duration=(
+                float(replay_duration_envvar) if replay_duration_envvar else None
+            ),
+            snapshotting_replay_interval=float(
+                self.env.get(self.SNAPSHOTTING_REPLAY_INTERVAL, "60")
+            ),
+            snapshot_class=type(self).snapshot_class,
+        )
+
+    async def open(self) -> None:
+        """
+        Prepares the application's infrastructure for use,
+        for example by creating database tables.
+        """
+        await self.factory.async_open()
+
+    async def save(
+        self,
+        *objs: MutableOrImmutableAggregate | DomainEventProtocol | None,
+        **kwargs: Any,
+    ) -> List[Recording]:
+        """
+        Collects pending events from given aggregates and
+        puts them in the application's event store.
+        """
+        processing_event = ProcessingEvent()
+        processing_event.collect_events(*objs, **kwargs)
+        recordings = await self.events.put(
+            processing_event.events, **processing_event.saved_kwargs
+        )
+        if self.repository.cache and not self.repository.fastforward:
+            for aggregate_id, aggregate in processing_event.aggregates.items():
+                self.repository.cache.put(aggregate_id, aggregate)
+        if self.snapshots:
+            for aggregate_id, version, projector_func in self._snapshots_to_take(
+                processing_event
+            ):
+                saved_aggregate = self._get_saved_aggregate(
+                    processing_event, aggregate_id, version
+                )
+                if saved_aggregate is None:
+                    await self.take_snapshot(
+                        aggregate_id=aggregate_id,
+                        version=version,
+                        projector_func=projector_func,
+                    )
+                else:
+                    snapshot = await _async_take_snapshot(
+                        self.snapshots, saved_aggregate, type(self).snapshot_class
+                    )
+                    await self.snapshots.put([snapshot])
+        return recordings
+
+    async def take_snapshot(
+        self,
+        aggregate_id: UUID,
+        version: int | None = None,
+        projector_func: ProjectorFunction[
+            TMutableOrImmutableAggregate, TDomainEvent
+        ] = project_aggregate,
+    ) -> None:
+        """
+        Takes a snapshot of the recorded state of the aggregate,
+        and puts the snapshot in the snapshot store.
+        """
+        self._check_snapshots_enabled(self.snapshots)
+        assert self.snapshots is not None
+        aggregate = await self.repository.get(
+            aggregate_id, version=version, projector_func=projector_func
+        )
+        snapshot = await _async_take_snapshot(
+            self.snapshots, aggregate, type(self).snapshot_class
+        )
+        await self.snapshots.put([snapshot])
+
+    async def close(self) -> None:
+        await self.factory.async_close()
+        self.factory.close()
+
+    async def __aenter__(self: TAsyncApplication) -> TAsyncApplication:
+        await self.open()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
+
+
+TAsyncApplication = TypeVar("TAsyncApplication", bound=AsyncApplication)
+
+
 class AggregateNotFoundError(EventSourcingError):
     """
     Raised when an :class:`~eventsourcing.domain.Aggregate`
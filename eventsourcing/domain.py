@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import inspect
 import os
+from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime, tzinfo
 from functools import lru_cache
@@ -16,6 +17,7 @@ from typing import (
     List,
     Protocol,
     Sequence,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -25,6 +27,7 @@ from typing import (
     runtime_checkable,
 )
 from uuid import UUID, uuid4
+from weakref import finalize
 
 from eventsourcing.utils import get_method_name, get_topic, resolve_topic
 
@@ -228,6 +231,10 @@ class CanMutateAggregate(HasOriginatorIDVersion, CanCreateTimestamp):
         if self.originator_version != next_version:
             raise OriginatorVersionError(self.originator_version, next_version)
 
+        # Copy values shared with other aggregate objects before mutating values.
+        if isinstance(aggregate, Aggregate):
+            aggregate._unshare_state()
+
         # Call apply() before mutating values, in case exception is raised.
         self.apply(aggregate)
 
@@ -1274,6 +1281,20 @@ class MetaAggregate(type, Generic[TAggregate]):
         return uuid4()
 
 
+class _SharedStatePendingEvents(List[CanMutateAggregate]):
+    """
+    List of pending events of an aggregate object that may share
+    the values of its attributes with other aggregate objects.
+
+    The 'sharing' set has the IDs of the aggregate objects that share
+    the values and have neither copied them nor been garbage collected.
+    """
+
+    def __init__(self, pending_events: Iterable[CanMutateAggregate], sharing: Set[int]):
+        super().__init__(pending_events)
+        self.sharing = sharing
+
+
 class Aggregate(metaclass=MetaAggregate):
     """
     Base class for aggregate roots.
@@ -1440,6 +1461,44 @@ class Aggregate(metaclass=MetaAggregate):
             collected.append(self._pending_events.pop(0))
         return collected
 
+    def _copy_on_write(self: TAggregate) -> TAggregate:
+        """
+        Returns a shallow copy of the aggregate, which shares the values of its
+        attributes with this aggregate until either of them is next mutated by
+        a domain event, when the mutated aggregate will first deep copy the
+        values of its attributes, unless it is the last object sharing them.
+        """
+        copy = object.__new__(type(self))
+        copy.__dict__.update(self.__dict__)
+        pending_events = self._pending_events
+        if type(pending_events) is _SharedStatePendingEvents:
+            sharing = pending_events.sharing
+        else:
+            sharing = {id(self)}
+            finalize(self, sharing.discard, id(self))
+            self._pending_events = _SharedStatePendingEvents(pending_events, sharing)
+        sharing.add(id(copy))
+        finalize(copy, sharing.discard, id(copy))
+        copy._pending_events = _SharedStatePendingEvents((), sharing)
+        return copy
+
+    def _unshare_state(self) -> None:
+        """
+        Deep copies the values of the aggregate's attributes, if they
+        are shared with other aggregate objects.
+        """
+        pending_events = self._pending_events
+        if type(pending_events) is _SharedStatePendingEvents:
+            sharing = pending_events.sharing
+            sharing.discard(id(self))
+            if sharing:
+                self.__dict__.update(
+                    deepcopy({
+                        k: v for k, v in self.__dict__.items() if k != "_pending_events"
+                    })
+                )
+            self._pending_events = list(pending_events)
+
 
 # @overload
 # def aggregate(*, created_event_name: str) -> Callable[[Any], Type[Aggregate]]:
@@ -1562,6 +1621,16 @@ class CanSnapshotAggregate(HasOriginatorIDVersion, CanCreateTimestamp):
         """
         Creates a snapshot of the given :class:`Aggregate` object.
         """
+        return cls(  # type: ignore
+            originator_id=aggregate.id,
+            originator_version=aggregate.version,
+            timestamp=cls.create_timestamp(),
+            topic=get_topic(type(aggregate)),
+            state=cls._get_aggregate_state(aggregate),
+        )
+
+    @staticmethod
+    def _get_aggregate_state(aggregate: MutableOrImmutableAggregate) -> Dict[str, Any]:
         aggregate_state = dict(aggregate.__dict__)
         class_version = getattr(type(aggregate), "class_version", 1)
         if class_version > 1:
@@ -1570,13 +1639,7 @@ class CanSnapshotAggregate(HasOriginatorIDVersion, CanCreateTimestamp):
             aggregate_state.pop("_id")
             aggregate_state.pop("_version")
             aggregate_state.pop("_pending_events")
-        return cls(  # type: ignore
-            originator_id=aggregate.id,
-            originator_version=aggregate.version,
-            timestamp=cls.create_timestamp(),
-            topic=get_topic(type(aggregate)),
-            state=aggregate_state,
-        )
+        return aggregate_state
 
     def mutate(self, _: None) -> Aggregate:
         """
@@ -1616,3 +1679,138 @@ class Snapshot(CanSnapshotAggregate, DomainEvent):
 
     topic: str
     state: Dict[str, Any]
+
+
+TDeltaSnapshot = TypeVar("TDeltaSnapshot", bound="DeltaSnapshot")
+
+
+class DeltaSnapshot(Snapshot):
+    """
+    Snapshots that can represent the state of an aggregate at a particular
+    version as the changes since a "base" snapshot, so that snapshots of
+    large aggregates don't need to include attributes that haven't changed.
+
+    Constructor arguments:
+
+    :param UUID originator_id: ID of originating aggregate.
+    :param int originator_version: version of originating aggregate.
+    :param datetime timestamp: date-time of the event
+    :param str topic: string that includes a class and its module
+    :param dict state: attributes that have changed since the base snapshot
+    :param int base_version: version of the base snapshot
+    :param list deleted: names of attributes deleted since the base snapshot
+
+    A delta snapshot is "composed" with its base snapshot before it is used
+    to reconstruct an aggregate. A base snapshot has a ``base_version`` equal
+    to its ``originator_version``.
+    """
+
+    base_version: int
+    deleted: List[str]
+
+    if TYPE_CHECKING:  # pragma: nocover
+        # The metaclass makes a dataclass, but type checkers can't see that.
+        def __init__(
+            self,
+            originator_id: UUID,
+            originator_version: int,
+            timestamp: datetime,
+            topic: str,
+            state: Dict[str, Any],
+            base_version: int,
+            deleted: List[str],
+        ) -> None:
+            pass
+
+    rebasing_interval = 1000
+    """
+    Number of versions after which a new base snapshot will be taken
+    instead of a delta snapshot.
+    """
+
+    @property
+    def is_delta(self) -> bool:
+        """
+        Returns ``True`` if the snapshot needs to be composed with a base snapshot.
+        """
+        return self.base_version != self.originator_version
+
+    @classmethod
+    def take(
+        cls: Type[TDeltaSnapshot],
+        aggregate: MutableOrImmutableAggregate,
+        base: DeltaSnapshot | None = None,
+    ) -> TDeltaSnapshot:
+        """
+        Creates a snapshot of the given :class:`Aggregate` object. If a base
+        snapshot is given, the snapshot will be a delta snapshot, unless a new
+        base snapshot is due because the base snapshot is older than the
+        ``rebasing_interval``, or because the base snapshot has a different
+        class version, or because all attributes of the aggregate have changed.
+        """
+        state = cls._get_aggregate_state(aggregate)
+        base_version = aggregate.version
+        deleted: List[str] = []
+        if (
+            base is not None
+            and not base.is_delta
+            and base.topic == get_topic(type(aggregate))
+            and 0 < aggregate.version - base.originator_version < cls.rebasing_interval
+            and base.state.get("class_version", 1) == state.get("class_version", 1)
+        ):
+            changed = {
+                name: value
+                for name, value in state.items()
+                if name not in base.state or base.state[name] != value
+            }
+            if len(changed) < len(state):
+                deleted = [name for name in base.state if name not in state]
+                state = changed
+                base_version = base.originator_version
+        return cls(
+            originator_id=aggregate.id,
+            originator_version=aggregate.version,
+            timestamp=cls.create_timestamp(),
+            topic=get_topic(type(aggregate)),
+            state=state,
+            base_version=base_version,
+            deleted=deleted,
+        )
+
+    def compose(self: TDeltaSnapshot, base: DeltaSnapshot) -> TDeltaSnapshot:
+        """
+        Returns a base snapshot of the aggregate at the version of this
+        delta snapshot, by applying the changes to the given base snapshot.
+        """
+        if base.is_delta or base.originator_version != self.base_version:
+            msg = (
+                f"Snapshot at version {base.originator_version} is not the base "
+                f"of delta snapshot at version {self.originator_version}"
+            )
+            raise ProgrammingError(msg)
+        state = dict(base.state)
+        state.update(self.state)
+        for name in self.deleted:
+            state.pop(name, None)
+        return type(self)(
+            originator_id=self.originator_id,
+            originator_version=self.originator_version,
+            timestamp=self.timestamp,
+            topic=self.topic,
+            state=state,
+            base_version=self.originator_version,
+            deleted=[],
+        )
+
+    def mutate(self, _: None) -> Aggregate:
+        """
+        Reconstructs the snapshotted :class:`Aggregate` object. Delta
+        snapshots must be composed with their base snapshot beforehand.
+        """
+        if self.is_delta:
+            msg = (
+                f"Delta snapshot at version {self.originator_version} has not "
+                f"been composed with its base snapshot at version {self.base_version}"
+            )
+            raise ProgrammingError(msg)
+        return super().mutate(_)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from typing import Any
+
+import msgpack
+
+from eventsourcing.persistence import JSONTranscoder, Transcoder, Transcoding
+
+
+class MsgPackTranscoder(Transcoder):
+    """
+    Extensible transcoder that uses the MessagePack binary format.
+
+    Objects of types that have a registered :class:`Transcoding` are
+    encoded as MessagePack extension types, so that only extension
+    types need to be considered when decoding.
+
+    Data encoded by :class:`~eventsourcing.persistence.JSONTranscoder`
+    as a JSON object can also be decoded, so that an application with
+    stored events that were encoded with JSON can begin to use this
+    transcoder without migrating its existing records.
+    """
+
+    EXT_CODE = 1
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.json_transcoder = JSONTranscoder()
+
+    def register(self, transcoding: Transcoding) -> None:
+        """
+        Registers given transcoding with the transcoder.
+        """
+        super().register(transcoding)
+        self.json_transcoder.register(transcoding)
+
+    def encode(self, obj: Any) -> bytes:
+        """
+        Encodes given object as a bytes array.
+        """
+        return msgpack.packb(obj, default=self._encode_obj, use_bin_type=True)
+
+    def decode(self, data: bytes) -> Any:
+        """
+        Decodes bytes array as previously encoded object.
+        """
+        # A MessagePack encoding never starts with "{", unless
+        # it is of the integer 123, so data that starts with "{"
+        # was encoded by the JSON transcoder as a JSON object.
+        if data[:1] == b"{":
+            return self.json_transcoder.decode(data)
+        return msgpack.unpackb(
+            data, ext_hook=self._decode_ext, raw=False, strict_map_key=False
+        )
+
+    def _encode_obj(self, o: Any) -> msgpack.ExtType:
+        try:
+            transcoding = self.types[type(o)]
+        except KeyError:
+            msg = (
+                f"Object of type {type(o)} is not "
+                "serializable. Please define and register "
+                "a custom transcoding for this type."
+            )
+            raise TypeError(msg) from None
+        else:
+            return msgpack.ExtType(
+                self.EXT_CODE, self.encode((transcoding.name, transcoding.encode(o)))
+            )
+
+    def _decode_ext(self, code: int, data: bytes) -> Any:
+        if code != self.EXT_CODE:
+            return msgpack.ExtType(code, data)
+        name, encoded = msgpack.unpackb(
+            data, ext_hook=self._decode_ext, raw=False, strict_map_key=False
+        )
+        try:
+            transcoding = self.names[name]
+        except KeyError:
+            msg = (
+                f"Data serialized with name '{name}' is not "
+                "deserializable. Please register a "
+                "custom transcoding for this type."
+            )
+            raise TypeError(msg) from None
+        else:
+            return transcoding.decode(encoded)
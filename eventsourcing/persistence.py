@@ -7,13 +7,17 @@ from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from itertools import chain, islice
 from threading import Condition, Event, Lock, Semaphore, Timer
 from time import time
 from types import ModuleType
 from typing import (
     Any,
+    Callable,
+    Deque,
     Dict,
     Generic,
+    Iterable,
     Iterator,
     List,
     Mapping,
@@ -257,6 +261,42 @@ class Cipher(ABC):
         """
 
 
+Upcaster = Callable[[Dict[str, Any]], None]
+
+
+class _EventClassCodec:
+    """
+    Holds what a :class:`Mapper` needs to know about a domain event
+    class, so that it is worked out once rather than for every event.
+    """
+
+    __slots__ = ("topic", "cls", "class_version", "_upcast_chains")
+
+    def __init__(self, topic: str, cls: type):
+        self.topic = topic
+        self.cls = cls
+        self.class_version: int = getattr(cls, "class_version", 1)
+        self._upcast_chains: Dict[int, List[Upcaster]] = {}
+
+    def upcast(self, event_state: Dict[str, Any]) -> None:
+        """
+        Upcasts given event state from its recorded class version
+        to the current class version of the domain event class.
+        """
+        from_version = event_state.pop("class_version", 1)
+        if from_version < self.class_version:
+            try:
+                upcast_chain = self._upcast_chains[from_version]
+            except KeyError:
+                upcast_chain = [
+                    getattr(self.cls, f"upcast_v{v}_v{v + 1}")
+                    for v in range(from_version, self.class_version)
+                ]
+                self._upcast_chains[from_version] = upcast_chain
+            for upcast in upcast_chain:
+                upcast(event_state)
+
+
 class Mapper:
     """
     Converts between domain event objects and :class:`StoredEvent` objects.
@@ -273,18 +313,43 @@ class Mapper:
         self.transcoder = transcoder
         self.compressor = compressor
         self.cipher = cipher
+        self._codecs_by_class: Dict[type, _EventClassCodec] = {}
+        self._codecs_by_topic: Dict[str, _EventClassCodec] = {}
+
+    def _get_codec_for_class(self, cls: type) -> _EventClassCodec:
+        try:
+            return self._codecs_by_class[cls]
+        except KeyError:
+            codec = _EventClassCodec(get_topic(cls), cls)
+            self._codecs_by_class[cls] = codec
+            return codec
+
+    def _get_codec_for_topic(self, topic: str) -> _EventClassCodec:
+        # Always resolve the topic, so that the codec is renewed
+        # whenever the topic cache is changed to resolve the topic
+        # to a different class (for example, after it is cleared).
+        cls = resolve_topic(topic)
+        try:
+            codec = self._codecs_by_topic[topic]
+        except KeyError:
+            pass
+        else:
+            if codec.cls is cls:
+                return codec
+        codec = _EventClassCodec(topic, cls)
+        self._codecs_by_topic[topic] = codec
+        return codec
 
     def to_stored_event(self, domain_event: DomainEventProtocol) -> StoredEvent:
         """
         Converts the given domain event to a :class:`StoredEvent` object.
         """
-        topic = get_topic(domain_event.__class__)
+        codec = self._get_codec_for_class(type(domain_event))
         event_state = domain_event.__dict__.copy()
         originator_id = event_state.pop("originator_id")
         originator_version = event_state.pop("originator_version")
-        class_version = getattr(type(domain_event), "class_version", 1)
-        if class_version > 1:
-            event_state["class_version"] = class_version
+        if codec.class_version > 1:
+            event_state["class_version"] = codec.class_version
         stored_state = self.transcoder.encode(event_state)
         if self.compressor:
             stored_state = self.compressor.compress(stored_state)
@@ -293,7 +358,7 @@ class Mapper:
         return StoredEvent(
             originator_id=originator_id,
             originator_version=originator_version,
-            topic=topic,
+            topic=codec.topic,
             state=stored_state,
         )
 
@@ -318,17 +383,91 @@ class Mapper:
         event_state: Dict[str, Any] = self.transcoder.decode(stored_state)
         event_state["originator_id"] = stored_event.originator_id
         event_state["originator_version"] = stored_event.originator_version
-        cls = resolve_topic(stored_event.topic)
-        class_version = getattr(cls, "class_version", 1)
-        from_version = event_state.pop("class_version", 1)
-        while from_version < class_version:
-            getattr(cls, f"upcast_v{from_version}_v{from_version + 1}")(event_state)
-            from_version += 1
-
-        domain_event = object.__new__(cls)
+        codec = self._get_codec_for_topic(stored_event.topic)
+        codec.upcast(event_state)
+        domain_event: DomainEventProtocol = object.__new__(codec.cls)
         domain_event.__dict__.update(event_state)
         return domain_event
 
+    def to_stored_events(
+        self, domain_events: Iterable[DomainEventProtocol]
+    ) -> List[StoredEvent]:
+        """
+        Converts the given domain events to :class:`StoredEvent` objects.
+
+        Gives the same results as calling :func:`to_stored_event` for each
+        domain event, but avoids repeating work for each event.
+        """
+        if type(self).to_stored_event is not Mapper.to_stored_event:
+            # Respect subclasses that have customised the conversion.
+            return list(map(self.to_stored_event, domain_events))
+
+        get_codec = self._get_codec_for_class
+        encode = self.transcoder.encode
+        compress = self.compressor.compress if self.compressor else None
+        encrypt = self.cipher.encrypt if self.cipher else None
+        stored_events = []
+        for domain_event in domain_events:
+            codec = get_codec(type(domain_event))
+            event_state = domain_event.__dict__.copy()
+            originator_id = event_state.pop("originator_id")
+            originator_version = event_state.pop("originator_version")
+            if codec.class_version > 1:
+                event_state["class_version"] = codec.class_version
+            stored_state = encode(event_state)
+            if compress:
+                stored_state = compress(stored_state)
+            if encrypt:
+                stored_state = encrypt(stored_state)
+            stored_events.append(
+                StoredEvent(
+                    originator_id=originator_id,
+                    originator_version=originator_version,
+                    topic=codec.topic,
+                    state=stored_state,
+                )
+            )
+        return stored_events
+
+    def to_domain_events(
+        self, stored_events: Iterable[StoredEvent]
+    ) -> List[DomainEventProtocol]:
+        """
+        Converts the given :class:`StoredEvent` objects to domain event objects.
+
+        Gives the same results as calling :func:`to_domain_event` for each
+        stored event, but each topic is resolved only once per batch.
+        """
+        if type(self).to_domain_event is not Mapper.to_domain_event:
+            # Respect subclasses that have customised the conversion.
+            return list(map(self.to_domain_event, stored_events))
+
+        decode = self.transcoder.decode
+        decompress = self.compressor.decompress if self.compressor else None
+        decrypt = self.cipher.decrypt if self.cipher else None
+        codecs: Dict[str, _EventClassCodec] = {}
+        domain_events = []
+        for stored_event in stored_events:
+            topic = stored_event.topic
+            try:
+                codec = codecs[topic]
+            except KeyError:
+                codec = self._get_codec_for_topic(topic)
+                codecs[topic] = codec
+            stored_state = stored_event.state
+            if decrypt:
+                stored_state = decrypt(stored_state)
+            if decompress:
+                stored_state = decompress(stored_state)
+            event_state: Dict[str, Any] = decode(stored_state)
+            event_state["originator_id"] = stored_event.originator_id
+            event_state["originator_version"] = stored_event.originator_version
+            codec.upcast(event_state)
+            domain_event: DomainEventProtocol = object.__new__(codec.cls)
+            domain_event.__dict__.update(event_state)
+            domain_events.append(domain_event)
+        return domain_events
+
 
 class RecordConflictError(EventSourcingError):
     """
@@ -406,6 +545,9 @@ class NotSupportedError(DatabaseError):
     """
 
 
+DEFAULT_PAGE_SIZE = 1000
+
+
 class AggregateRecorder(ABC):
     """
     Abstract base class for recorders that record and
@@ -434,6 +576,122 @@ class AggregateRecorder(ABC):
         Reads stored events from database.
         """
 
+    def bulk_insert_events(
+        self, stored_events: Iterable[StoredEvent], **kwargs: Any
+    ) -> Sequence[int] | None:
+        """
+        Writes a large number of stored events into database in one
+        transaction, for example when migrating or backfilling events.
+        Stored events are consumed from the given iterable as they are
+        written. As with :func:`insert_events`, the notification IDs of
+        the stored events are returned by application recorders.
+
+        By default, :func:`insert_events` is called with all the stored events.
+        """
+        return self.insert_events(list(stored_events), **kwargs)
+
+    def select_events_many(
+        self,
+        originator_ids: Sequence[UUID],
+        *,
+        gt_versions: Mapping[UUID, int] | None = None,
+        desc: bool = False,
+        limit: int | None = None,
+    ) -> Dict[UUID, List[StoredEvent]]:
+        """
+        Reads stored events of many aggregates from database. Returns
+        a dict that maps each given originator ID to a list of stored events.
+
+        Only stored events with versions greater than the versions given
+        in ``gt_versions`` are selected for the originator IDs in that mapping.
+        The ``limit`` applies to each originator ID.
+
+        By default, :func:`select_events` is called for each originator ID.
+        """
+        gt_versions = gt_versions or {}
+        return {
+            originator_id: self.select_events(
+                originator_id,
+                gt=gt_versions.get(originator_id),
+                desc=desc,
+                limit=limit,
+            )
+            for originator_id in originator_ids
+        }
+
+    def iter_events(
+        self,
+        originator_id: UUID,
+        *,
+        gt: int | None = None,
+        lte: int | None = None,
+        desc: bool = False,
+        limit: int | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[StoredEvent]:
+        """
+        Reads stored events from database lazily, in pages of the
+        given size, so that not all the selected stored events are
+        held in memory at once.
+
+        By default, each page is selected by calling :func:`select_events`,
+        using the version of the last stored event of the previous page.
+        """
+        if page_size < 1:
+            msg = f"Page size must be greater than zero: {page_size}"
+            raise ValueError(msg)
+        while limit is None or limit > 0:
+            page_limit = page_size if limit is None else min(page_size, limit)
+            stored_events = self.select_events(
+                originator_id, gt=gt, lte=lte, desc=desc, limit=page_limit
+            )
+            yield from stored_events
+            if len(stored_events) < page_limit:
+                break
+            last_version = stored_events[-1].originator_version
+            if desc:
+                lte = last_version - 1
+            else:
+                gt = last_version
+            if limit is not None:
+                limit -= len(stored_events)
+
+    def delete_events(
+        self,
+        originator_id: UUID,
+        *,
+        gt: int | None = None,
+        lt: int | None = None,
+        keep: int = 0,
+    ) -> None:
+        """
+        Deletes stored events of an aggregate from database, except the
+        last ``keep`` stored events of the aggregate. If ``gt`` or ``lt``
+        are given, only stored events with versions greater than ``gt``
+        and less than ``lt`` are deleted.
+
+        This is intended for removing old snapshots from a snapshot
+        store, not for removing the events of an aggregate. Raises a
+        :class:`ProgrammingError` unless overridden by a recorder that
+        supports snapshot retention.
+        """
+        msg = f"Snapshot retention is not supported by {type(self).__name__}"
+        raise ProgrammingError(msg)
+
+    def compact_events(self, *, keep: int, batch_size: int = 1000) -> int:
+        """
+        Deletes all except the last ``keep`` stored events of each aggregate
+        from database, in batches of the stored events of ``batch_size``
+        aggregates, and returns the number of stored events that were deleted.
+
+        This is intended for removing old snapshots from a snapshot
+        store, not for removing the events of aggregates. Raises a
+        :class:`ProgrammingError` unless overridden by a recorder that
+        supports snapshot retention.
+        """
+        msg = f"Snapshot retention is not supported by {type(self).__name__}"
+        raise ProgrammingError(msg)
+
 
 @dataclass(frozen=True)
 class Notification(StoredEvent):
@@ -475,6 +733,107 @@ class ApplicationRecorder(AggregateRecorder):
         Returns the maximum notification ID.
         """
 
+    def subscribe(
+        self, gt: int | None = None, topics: Sequence[str] = ()
+    ) -> Subscription:
+        """
+        Returns a :class:`Subscription` to the event notifications that are
+        recorded after the given notification ID, optionally filtered by topic.
+        By default, the subscription polls the recorder for new notifications.
+        """
+        return Subscription(self, gt=gt, topics=topics)
+
+
+TSubscription = TypeVar("TSubscription", bound="Subscription")
+
+
+class Subscription(Iterator[Notification]):
+    """
+    Iterates over the event notifications of an application recorder, from
+    after the given notification ID, blocking whilst there are no new event
+    notifications until the subscription is stopped.
+
+    Subclasses are woken up when new event notifications are recorded, either
+    by calling :func:`wake` or by overriding :func:`wait`. Otherwise, the
+    recorder is polled every :attr:`poll_interval` seconds.
+    """
+
+    poll_interval = 0.1
+
+    def __init__(
+        self,
+        recorder: ApplicationRecorder,
+        gt: int | None = None,
+        topics: Sequence[str] = (),
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ):
+        self.recorder = recorder
+        self.last_notification_id = gt or 0
+        self.topics = topics
+        self.page_size = page_size
+        self._notifications: Deque[Notification] = deque()
+        self._has_been_woken = Event()
+        self._has_been_stopped = Event()
+
+    def __enter__(self: TSubscription) -> TSubscription:
+        return self
+
+    def __exit__(self, *args: object, **kwargs: Any) -> None:
+        self.stop()
+        self.close()
+
+    def __iter__(self) -> Subscription:
+        return self
+
+    def __next__(self) -> Notification:
+        while not self._notifications:
+            if self._has_been_stopped.is_set():
+                raise StopIteration
+            # Clear before selecting, so that a wake up isn't missed.
+            self._has_been_woken.clear()
+            notifications = self.recorder.select_notifications(
+                start=self.last_notification_id + 1,
+                limit=self.page_size,
+                topics=self.topics,
+            )
+            if notifications:
+                self._notifications.extend(notifications)
+                self.last_notification_id = notifications[-1].id
+            else:
+                self.wait(self.poll_interval)
+        return self._notifications.popleft()
+
+    def wait(self, timeout: float) -> None:
+        """
+        Blocks until the subscription is woken, or the timeout has elapsed.
+        """
+        self._has_been_woken.wait(timeout)
+
+    def wake(self) -> None:
+        """
+        Wakes up the subscription, so that it will select new notifications.
+        """
+        self._has_been_woken.set()
+
+    def stop(self) -> None:
+        """
+        Stops the subscription, so that iteration will stop after the
+        notifications that have already been selected have been returned.
+        """
+        self._has_been_stopped.set()
+        self.wake()
+
+    def close(self) -> None:
+        """
+        Releases any resources held by the subscription, such as a database
+        connection. Called when the subscription's context is exited, and
+        when iteration stops.
+        """
+
+    @property
+    def is_stopped(self) -> bool:
+        return self._has_been_stopped.is_set()
+
 
 class ProcessRecorder(ApplicationRecorder):
     """
@@ -503,6 +862,96 @@ class ProcessRecorder(ApplicationRecorder):
         """
 
 
+class AsyncAggregateRecorder(ABC):
+    """
+    Abstract base class for recorders that record and retrieve
+    stored events for domain model aggregates with asyncio.
+    """
+
+    @abstractmethod
+    async def insert_events(
+        self, stored_events: List[StoredEvent], **kwargs: Any
+    ) -> Sequence[int] | None:
+        """
+        Writes stored events into database.
+        """
+
+    @abstractmethod
+    async def select_events(
+        self,
+        originator_id: UUID,
+        *,
+        gt: int | None = None,
+        lte: int | None = None,
+        desc: bool = False,
+        limit: int | None = None,
+    ) -> List[StoredEvent]:
+        """
+        Reads stored events from database.
+        """
+
+    async def delete_events(
+        self,
+        originator_id: UUID,
+        *,
+        gt: int | None = None,
+        lt: int | None = None,
+        keep: int = 0,
+    ) -> None:
+        """
+        Deletes stored events of an aggregate from database, except the
+        last ``keep`` stored events of the aggregate (see
+        :func:`AggregateRecorder.delete_events`).
+        """
+        msg = f"Snapshot retention is not supported by {type(self).__name__}"
+        raise ProgrammingError(msg)
+
+    async def compact_events(self, *, keep: int, batch_size: int = 1000) -> int:
+        """
+        Deletes all except the last ``keep`` stored events of each aggregate
+        from database (see :func:`AggregateRecorder.compact_events`).
+        """
+        msg = f"Snapshot retention is not supported by {type(self).__name__}"
+        raise ProgrammingError(msg)
+
+    async def create_table(self) -> None:
+        """
+        Creates database tables, if the recorder has any.
+        """
+
+
+class AsyncApplicationRecorder(AsyncAggregateRecorder):
+    """
+    Abstract base class for recorders that record and retrieve
+    stored events for domain model aggregates with asyncio.
+
+    Extends the behaviour of async aggregate recorders by
+    recording aggregate events in a total order that
+    allows the stored events also to be retrieved
+    as event notifications.
+    """
+
+    @abstractmethod
+    async def select_notifications(
+        self,
+        start: int,
+        limit: int,
+        stop: int | None = None,
+        topics: Sequence[str] = (),
+    ) -> List[Notification]:
+        """
+        Returns a list of event notifications
+        from 'start', limited by 'limit' and
+        optionally by 'stop'.
+        """
+
+    @abstractmethod
+    async def max_notification_id(self) -> int:
+        """
+        Returns the maximum notification ID.
+        """
+
+
 @dataclass(frozen=True)
 class Recording:
     domain_event: DomainEventProtocol
@@ -518,9 +967,11 @@ class EventStore:
         self,
         mapper: Mapper,
         recorder: AggregateRecorder,
+        page_size: int | None = None,
     ):
         self.mapper = mapper
         self.recorder = recorder
+        self.page_size = page_size
 
     def put(
         self, domain_events: Sequence[DomainEventProtocol], **kwargs: Any
@@ -528,7 +979,7 @@ class EventStore:
         """
         Stores domain events in aggregate sequence.
         """
-        stored_events = list(map(self.mapper.to_stored_event, domain_events))
+        stored_events = self.mapper.to_stored_events(domain_events)
         recordings = []
         notification_ids = self.recorder.insert_events(stored_events, **kwargs)
         if notification_ids:
@@ -559,16 +1010,155 @@ class EventStore:
     ) -> Iterator[DomainEventProtocol]:
         """
         Retrieves domain events from aggregate sequence.
+
+        Stored events are converted lazily, in batches, as the returned
+        iterator is consumed. If the event store has a page size, stored
+        events will also be selected lazily, one page at a time.
+        """
+        if self.page_size is not None:
+            return self._iter_domain_events(
+                self.recorder.iter_events(
+                    originator_id=originator_id,
+                    gt=gt,
+                    lte=lte,
+                    desc=desc,
+                    limit=limit,
+                    page_size=self.page_size,
+                ),
+                self.page_size,
+            )
+        return self._iter_domain_events(
+            iter(
+                self.recorder.select_events(
+                    originator_id=originator_id,
+                    gt=gt,
+                    lte=lte,
+                    desc=desc,
+                    limit=limit,
+                )
+            ),
+            DEFAULT_PAGE_SIZE,
+        )
+
+    def get_many(
+        self,
+        originator_ids: Sequence[UUID],
+        *,
+        gt_versions: Mapping[UUID, int] | None = None,
+        desc: bool = False,
+        limit: int | None = None,
+    ) -> Dict[UUID, List[DomainEventProtocol]]:
+        """
+        Retrieves domain events from many aggregate sequences at once.
+        Returns a dict that maps each given originator ID to a list of
+        domain events.
+        """
+        stored_events_many = self.recorder.select_events_many(
+            originator_ids=originator_ids,
+            gt_versions=gt_versions,
+            desc=desc,
+            limit=limit,
+        )
+        domain_events = iter(
+            self.mapper.to_domain_events(
+                chain.from_iterable(stored_events_many.values())
+            )
+        )
+        return {
+            originator_id: list(islice(domain_events, len(stored_events)))
+            for originator_id, stored_events in stored_events_many.items()
+        }
+
+    def put_bulk(
+        self, domain_events: Iterable[DomainEventProtocol]
+    ) -> Sequence[int] | None:
+        """
+        Stores a large number of domain events in one transaction, for
+        example when migrating or backfilling an event store. Domain events
+        are converted to stored events one page at a time, as they are
+        recorded. Returns the notification IDs of the recorded events, if
+        the recorder is an application recorder.
+        """
+        return self.recorder.bulk_insert_events(
+            self._iter_stored_events(
+                iter(domain_events), self.page_size or DEFAULT_PAGE_SIZE
+            )
+        )
+
+    def _iter_stored_events(
+        self, domain_events: Iterator[DomainEventProtocol], page_size: int
+    ) -> Iterator[StoredEvent]:
+        while True:
+            page = list(islice(domain_events, page_size))
+            if not page:
+                break
+            yield from self.mapper.to_stored_events(page)
+
+    def _iter_domain_events(
+        self, stored_events: Iterator[StoredEvent], page_size: int
+    ) -> Iterator[DomainEventProtocol]:
+        while True:
+            page = list(islice(stored_events, page_size))
+            if not page:
+                break
+            yield from self.mapper.to_domain_events(page)
+
+
+class AsyncEventStore:
+    """
+    Stores and retrieves domain events with asyncio.
+    """
+
+    def __init__(self, mapper: Mapper, recorder: AsyncAggregateRecorder):
+        self.mapper = mapper
+        self.recorder = recorder
+
+    async def put(
+        self, domain_events: Sequence[DomainEventProtocol], **kwargs: Any
+    ) -> List[Recording]:
+        """
+        Stores domain events in aggregate sequence.
+        """
+        stored_events = self.mapper.to_stored_events(domain_events)
+        notification_ids = await self.recorder.insert_events(stored_events, **kwargs)
+        recordings = []
+        if notification_ids:
+            assert len(notification_ids) == len(stored_events)
+            for d, s, n_id in zip(domain_events, stored_events, notification_ids):
+                recordings.append(
+                    Recording(
+                        d,
+                        Notification(
+                            originator_id=s.originator_id,
+                            originator_version=s.originator_version,
+                            topic=s.topic,
+                            state=s.state,
+                            id=n_id,
+                        ),
+                    )
+                )
+        return recordings
+
+    async def get(
+        self,
+        originator_id: UUID,
+        *,
+        gt: int | None = None,
+        lte: int | None = None,
+        desc: bool = False,
+        limit: int | None = None,
+    ) -> List[DomainEventProtocol]:
+        """
+        Retrieves domain events from aggregate sequence.
         """
-        return map(
-            self.mapper.to_domain_event,
-            self.recorder.select_events(
+        return self.mapper.to_domain_events(
+            await self.recorder.select_events(
                 originator_id=originator_id,
                 gt=gt,
                 lte=lte,
                 desc=desc,
                 limit=limit,
-            ),
+            )
         )
 
 
@@ -583,6 +1173,7 @@ class InfrastructureFactory(ABC):
     """
 
     PERSISTENCE_MODULE = "PERSISTENCE_MODULE"
+    TRANSCODER_TOPIC = "TRANSCODER_TOPIC"
     MAPPER_TOPIC = "MAPPER_TOPIC"
     CIPHER_TOPIC = "CIPHER_TOPIC"
     COMPRESSOR_TOPIC = "COMPRESSOR_TOPIC"
@@ -659,9 +1250,14 @@ class InfrastructureFactory(ABC):
         self,
     ) -> Transcoder:
         """
-        Constructs a transcoder.
+        Constructs a transcoder. Reads environment variable
+        'TRANSCODER_TOPIC' to decide which transcoder class
+        to use, by default :class:`JSONTranscoder`.
         """
-        # TODO: Implement support for TRANSCODER_TOPIC.
+        transcoder_topic = self.env.get(self.TRANSCODER_TOPIC)
+        if transcoder_topic:
+            transcoder_cls: Type[Transcoder] = resolve_topic(transcoder_topic)
+            return transcoder_cls()
         return JSONTranscoder()
 
     def mapper(
@@ -737,6 +1333,44 @@ class InfrastructureFactory(ABC):
         Constructs a process recorder.
         """
 
+    @staticmethod
+    def async_event_store(**kwargs: Any) -> AsyncEventStore:
+        """
+        Constructs an async event store.
+        """
+        return AsyncEventStore(**kwargs)
+
+    def async_aggregate_recorder(
+        self, purpose: str = "events"
+    ) -> AsyncAggregateRecorder:
+        """
+        Constructs an async aggregate recorder. Raises a
+        :class:`ProgrammingError` unless overridden by a factory
+        that supports asyncio.
+        """
+        msg = f"{type(self).__name__} does not support asyncio"
+        raise ProgrammingError(msg)
+
+    def async_application_recorder(self) -> AsyncApplicationRecorder:
+        """
+        Constructs an async application recorder. Raises a
+        :class:`ProgrammingError` unless overridden by a factory
+        that supports asyncio.
+        """
+        msg = f"{type(self).__name__} does not support asyncio"
+        raise ProgrammingError(msg)
+
+    async def async_open(self) -> None:
+        """
+        Prepares the async recorders constructed by this factory
+        for use, for example by creating database tables.
+        """
+
+    async def async_close(self) -> None:
+        """
+        Closes any async database connections.
+        """
+
     def is_snapshotting_enabled(self) -> bool:
         """
         Decides whether or not snapshotting is enabled by
@@ -745,6 +1379,13 @@ class InfrastructureFactory(ABC):
         """
         return strtobool(self.env.get(self.IS_SNAPSHOTTING_ENABLED, "no"))
 
+    def is_shared_between_processes(self) -> bool:
+        """
+        Returns True if the recorders constructed by this factory use a database
+        that can be shared between operating system processes.
+        """
+        return True
+
     def close(self) -> None:
         """
         Closes any database connections, or anything else that needs closing.
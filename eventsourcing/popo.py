@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from threading import Lock
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Sequence
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Sequence
+from weakref import WeakSet
 
 from eventsourcing.persistence import (
     AggregateRecorder,
     ApplicationRecorder,
+    AsyncAggregateRecorder,
+    AsyncApplicationRecorder,
     InfrastructureFactory,
     IntegrityError,
     Notification,
     ProcessRecorder,
     StoredEvent,
+    Subscription,
     Tracking,
 )
 from eventsourcing.utils import reversed_keys
@@ -74,28 +79,125 @@ class POPOAggregateRecorder(AggregateRecorder):
         limit: int | None = None,
     ) -> List[StoredEvent]:
         with self._database_lock:
-            results = []
+            return self._select_events(
+                originator_id, gt=gt, lte=lte, desc=desc, limit=limit
+            )
 
-            index = self._stored_events_index[originator_id]
-            positions: Iterable[int]
-            positions = reversed_keys(index) if desc else index.keys()
-            for p in positions:
-                if gt is not None and not p > gt:
-                    continue
-                if lte is not None and not p <= lte:
-                    continue
-                s = self._stored_events[index[p]]
-                results.append(s)
-                if len(results) == limit:
-                    break
-            return results
+    def select_events_many(
+        self,
+        originator_ids: Sequence[UUID],
+        *,
+        gt_versions: Mapping[UUID, int] | None = None,
+        desc: bool = False,
+        limit: int | None = None,
+    ) -> Dict[UUID, List[StoredEvent]]:
+        gt_versions = gt_versions or {}
+        with self._database_lock:
+            return {
+                originator_id: self._select_events(
+                    originator_id,
+                    gt=gt_versions.get(originator_id),
+                    lte=None,
+                    desc=desc,
+                    limit=limit,
+                )
+                for originator_id in originator_ids
+            }
+
+    def _select_events(
+        self,
+        originator_id: UUID,
+        *,
+        gt: int | None,
+        lte: int | None,
+        desc: bool,
+        limit: int | None,
+    ) -> List[StoredEvent]:
+        results = []
+
+        index = self._stored_events_index[originator_id]
+        positions: Iterable[int]
+        positions = reversed_keys(index) if desc else index.keys()
+        for p in positions:
+            if gt is not None and not p > gt:
+                continue
+            if lte is not None and not p <= lte:
+                continue
+            s = self._stored_events[index[p]]
+            results.append(s)
+            if len(results) == limit:
+                break
+        return results
+
+    def delete_events(
+        self,
+        originator_id: UUID,
+        *,
+        gt: int | None = None,
+        lt: int | None = None,
+        keep: int = 0,
+    ) -> None:
+        with self._database_lock:
+            self._delete_events(originator_id, gt=gt, lt=lt, keep=keep)
+
+    def compact_events(self, *, keep: int, batch_size: int = 1000) -> int:
+        with self._database_lock:
+            return sum(
+                self._delete_events(originator_id, gt=None, lt=None, keep=keep)
+                for originator_id in list(self._stored_events_index)
+            )
+
+    def _delete_events(
+        self, originator_id: UUID, *, gt: int | None, lt: int | None, keep: int
+    ) -> int:
+        # Stored events are removed from the index, so that notification
+        # IDs, which are positions in the list of stored events, don't change.
+        index = self._stored_events_index[originator_id]
+        versions = sorted(index)
+        versions = versions[: len(versions) - keep] if keep > 0 else versions
+        if gt is not None:
+            versions = [v for v in versions if v > gt]
+        if lt is not None:
+            versions = [v for v in versions if v < lt]
+        for v in versions:
+            del index[v]
+        return len(versions)
 
 
 class POPOApplicationRecorder(ApplicationRecorder, POPOAggregateRecorder):
+    def __init__(self) -> None:
+        super().__init__()
+        self._subscriptions: WeakSet[Subscription] = WeakSet()
+        # Notification IDs of stored events, in order, indexed by topic.
+        self._topic_index: Dict[str, List[int]] = defaultdict(list)
+
+    def _update_table(
+        self, stored_events: List[StoredEvent], **kwargs: Any
+    ) -> Sequence[int] | None:
+        notification_ids = super()._update_table(stored_events, **kwargs)
+        assert notification_ids is not None
+        for s, notification_id in zip(stored_events, notification_ids):
+            self._topic_index[s.topic].append(notification_id)
+        return notification_ids
+
     def insert_events(
         self, stored_events: List[StoredEvent], **kwargs: Any
     ) -> Sequence[int] | None:
-        return self._insert_events(stored_events, **kwargs)
+        notification_ids = self._insert_events(stored_events, **kwargs)
+        if stored_events:
+            for subscription in list(self._subscriptions):
+                subscription.wake()
+        return notification_ids
+
+    def subscribe(
+        self, gt: int | None = None, topics: Sequence[str] = ()
+    ) -> Subscription:
+        """
+        Returns a subscription that is woken when events are inserted.
+        """
+        subscription = super().subscribe(gt=gt, topics=topics)
+        self._subscriptions.add(subscription)
+        return subscription
 
     def select_notifications(
         self,
@@ -105,29 +207,34 @@ class POPOApplicationRecorder(ApplicationRecorder, POPOAggregateRecorder):
         topics: Sequence[str] = (),
     ) -> List[Notification]:
         with self._database_lock:
-            results = []
             start = max(start, 1)  # Don't use negative indexes!
-            i = start - 1
-            while True:
-                if stop is not None and i > stop - 1:
-                    break
-                try:
-                    s = self._stored_events[i]
-                except IndexError:
-                    break
-                i += 1
-                if topics and s.topic not in topics:
-                    continue
-                n = Notification(
-                    id=i,
-                    originator_id=s.originator_id,
-                    originator_version=s.originator_version,
-                    topic=s.topic,
-                    state=s.state,
+            last = len(self._stored_events)
+            if stop is not None:
+                last = min(last, stop)
+            notification_ids: Iterable[int]
+            if topics:
+                # Take no more than 'limit' IDs from the index of each topic.
+                selected_ids: List[int] = []
+                for topic in set(topics):
+                    topic_ids = self._topic_index.get(topic, [])
+                    i = bisect_left(topic_ids, start)
+                    j = min(bisect_right(topic_ids, last), i + limit)
+                    selected_ids.extend(topic_ids[i:j])
+                notification_ids = sorted(selected_ids)[:limit]
+            else:
+                notification_ids = range(start, min(last, start + limit - 1) + 1)
+            results = []
+            for notification_id in notification_ids:
+                s = self._stored_events[notification_id - 1]
+                results.append(
+                    Notification(
+                        id=notification_id,
+                        originator_id=s.originator_id,
+                        originator_version=s.originator_version,
+                        topic=s.topic,
+                        state=s.state,
+                    )
                 )
-                results.append(n)
-                if len(results) == limit:
-                    break
             return results
 
     def max_notification_id(self) -> int:
@@ -173,6 +280,72 @@ class POPOProcessRecorder(ProcessRecorder, POPOApplicationRecorder):
             return notification_id in self._tracking_table[application_name]
 
 
+class AsyncPOPOAggregateRecorder(AsyncAggregateRecorder):
+    """
+    Records stored events in memory with asyncio. Since nothing
+    waits for I/O, calls are simply made on a POPO recorder.
+    """
+
+    recorder: POPOAggregateRecorder
+
+    def __init__(self) -> None:
+        self.recorder = POPOAggregateRecorder()
+
+    async def insert_events(
+        self, stored_events: List[StoredEvent], **kwargs: Any
+    ) -> Sequence[int] | None:
+        return self.recorder.insert_events(stored_events, **kwargs)
+
+    async def select_events(
+        self,
+        originator_id: UUID,
+        *,
+        gt: int | None = None,
+        lte: int | None = None,
+        desc: bool = False,
+        limit: int | None = None,
+    ) -> List[StoredEvent]:
+        return self.recorder.select_events(
+            originator_id, gt=gt, lte=lte, desc=desc, limit=limit
+        )
+
+    async def delete_events(
+        self,
+        originator_id: UUID,
+        *,
+        gt: int | None = None,
+        lt: int | None = None,
+        keep: int = 0,
+    ) -> None:
+        self.recorder.delete_events(originator_id, gt=gt, lt=lt, keep=keep)
+
+    async def compact_events(self, *, keep: int, batch_size: int = 1000) -> int:
+        return self.recorder.compact_events(keep=keep, batch_size=batch_size)
+
+
+class AsyncPOPOApplicationRecorder(
+    AsyncPOPOAggregateRecorder, AsyncApplicationRecorder
+):
+    recorder: POPOApplicationRecorder
+
+    def __init__(self) -> None:
+        self.recorder = POPOApplicationRecorder()
+
+    async def select_notifications(
+        self,
+        start: int,
+        limit: int,
+        stop: int | None = None,
+        topics: Sequence[str] = (),
+    ) -> List[Notification]:
+        return self.recorder.select_notifications(
+            start, limit, stop=stop, topics=topics
+        )
+
+    async def max_notification_id(self) -> int:
+        return self.recorder.max_notification_id()
+
+
 class Factory(InfrastructureFactory):
     def aggregate_recorder(self, purpose: str = "events") -> AggregateRecorder:
         return POPOAggregateRecorder()
@@ -182,3 +355,14 @@ class Factory(InfrastructureFactory):
 
     def process_recorder(self) -> ProcessRecorder:
         return POPOProcessRecorder()
+
+    def async_aggregate_recorder(
+        self, purpose: str = "events"
+    ) -> AsyncAggregateRecorder:
+        return AsyncPOPOAggregateRecorder()
+
+    def async_application_recorder(self) -> AsyncApplicationRecorder:
+        return AsyncPOPOApplicationRecorder()
+
+    def is_shared_between_processes(self) -> bool:
+        return False
@@ -1,18 +1,35 @@
 from __future__ import annotations
 
 import logging
-from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Sequence
+from contextlib import asynccontextmanager, contextmanager
+from hashlib import sha1
+from threading import Condition
+from time import sleep
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Sequence,
+    Tuple,
+)
 
 import psycopg
 import psycopg.errors
-from psycopg import Connection, Cursor
+from psycopg import AsyncConnection, AsyncCursor, Connection, Cursor
 from psycopg.rows import DictRow, dict_row
-from psycopg_pool import ConnectionPool
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
 
 from eventsourcing.persistence import (
+    DEFAULT_PAGE_SIZE,
     AggregateRecorder,
     ApplicationRecorder,
+    AsyncAggregateRecorder,
+    AsyncApplicationRecorder,
     DatabaseError,
     DataError,
     InfrastructureFactory,
@@ -26,6 +43,7 @@ from eventsourcing.persistence import (
     ProcessRecorder,
     ProgrammingError,
     StoredEvent,
+    Subscription,
     Tracking,
 )
 from eventsourcing.utils import Environment, retry, strtobool
@@ -37,6 +55,45 @@ logging.getLogger("psycopg.pool").setLevel(logging.CRITICAL)
 logging.getLogger("psycopg").setLevel(logging.CRITICAL)
 
 
+@contextmanager
+def _convert_psycopg_errors() -> Iterator[None]:
+    try:
+        yield
+    except psycopg.InterfaceError as e:
+        # conn.close()
+        raise InterfaceError(str(e)) from e
+    except psycopg.OperationalError as e:
+        # conn.close()
+        raise OperationalError(str(e)) from e
+    except psycopg.DataError as e:
+        raise DataError(str(e)) from e
+    except psycopg.IntegrityError as e:
+        raise IntegrityError(str(e)) from e
+    except psycopg.InternalError as e:
+        raise InternalError(str(e)) from e
+    except psycopg.ProgrammingError as e:
+        raise ProgrammingError(str(e)) from e
+    except psycopg.NotSupportedError as e:
+        raise NotSupportedError(str(e)) from e
+    except psycopg.DatabaseError as e:
+        raise DatabaseError(str(e)) from e
+    except psycopg.Error as e:
+        # conn.close()
+        raise PersistenceError(str(e)) from e
+
+
+def _bounded_identifier(name: str, suffix: str) -> str:
+    # PostgreSQL truncates identifiers to 63 bytes, so that names derived from
+    # long table names would otherwise collide. Long names are truncated and
+    # distinguished by a hash of the full name.
+    identifier = name + suffix
+    if len(identifier.encode()) <= 63:
+        return identifier
+    digest = sha1(identifier.encode()).hexdigest()[:8]  # noqa: S324
+    prefix = name.encode()[: 63 - len(suffix.encode()) - 9].decode(errors="ignore")
+    return f"{prefix}_{digest}{suffix}"
+
+
 class PostgresDatastore:
     def __init__(
         self,
@@ -61,18 +118,21 @@ class PostgresDatastore:
         self.pre_ping = pre_ping
         self.pool_open_timeout = pool_open_timeout
 
+        self.connect_kwargs: Dict[str, Any] = {
+            "dbname": dbname,
+            "host": host,
+            "port": port,
+            "user": user,
+            "password": password,
+            "row_factory": dict_row,
+            "connect_timeout": connect_timeout,
+        }
+
         check = ConnectionPool.check_connection if pre_ping else None
         kwargs: Dict[str, Any] = {"check": check}
         self.pool = ConnectionPool(
             connection_class=Connection[DictRow],
-            kwargs={
-                "dbname": dbname,
-                "host": host,
-                "port": port,
-                "user": user,
-                "password": password,
-                "row_factory": dict_row,
-            },
+            kwargs=self.connect_kwargs,
             min_size=pool_size,
             max_size=pool_size + max_overflow,
             open=False,
@@ -94,37 +154,13 @@ class PostgresDatastore:
 
     @contextmanager
     def get_connection(self) -> Iterator[Connection[DictRow]]:
-        try:
+        with _convert_psycopg_errors():
             wait = self.pool_open_timeout is not None
             timeout = self.pool_open_timeout or 30.0
             self.pool.open(wait, timeout)
 
             with self.pool.connection() as conn:
                 yield conn
-        except psycopg.InterfaceError as e:
-            # conn.close()
-            raise InterfaceError(str(e)) from e
-        except psycopg.OperationalError as e:
-            # conn.close()
-            raise OperationalError(str(e)) from e
-        except psycopg.DataError as e:
-            raise DataError(str(e)) from e
-        except psycopg.IntegrityError as e:
-            raise IntegrityError(str(e)) from e
-        except psycopg.InternalError as e:
-            raise InternalError(str(e)) from e
-        except psycopg.ProgrammingError as e:
-            raise ProgrammingError(str(e)) from e
-        except psycopg.NotSupportedError as e:
-            raise NotSupportedError(str(e)) from e
-        except psycopg.DatabaseError as e:
-            raise DatabaseError(str(e)) from e
-        except psycopg.Error as e:
-            # conn.close()
-            raise PersistenceError(str(e)) from e
-        except Exception:
-            # conn.close()
-            raise
 
     @contextmanager
     def transaction(self, *, commit: bool = False) -> Iterator[Cursor[DictRow]]:
@@ -132,6 +168,16 @@ class PostgresDatastore:
         with self.get_connection() as conn, conn.transaction(force_rollback=not commit):
             yield conn.cursor()
 
+    def connect(self) -> Connection[DictRow]:
+        """
+        Returns a new connection in autocommit mode that is not from the
+        pool, for example to listen for notifications on a channel.
+        """
+        with _convert_psycopg_errors():
+            conn = Connection[DictRow].connect(**self.connect_kwargs)
+            conn.autocommit = True
+            return conn
+
     def close(self) -> None:
         self.pool.close()
 
@@ -139,10 +185,97 @@ class PostgresDatastore:
         self.close()
 
 
-class PostgresAggregateRecorder(AggregateRecorder):
+class AsyncPostgresDatastore:
+    """
+    Provides async connections from a psycopg :class:`AsyncConnectionPool`,
+    which is opened when a connection is first requested. Accepts the
+    same arguments as :class:`PostgresDatastore`.
+    """
+
     def __init__(
         self,
-        datastore: PostgresDatastore,
+        dbname: str,
+        host: str,
+        port: str,
+        user: str,
+        password: str,
+        *,
+        connect_timeout: int = 5,
+        idle_in_transaction_session_timeout: int = 0,
+        pool_size: int = 2,
+        max_overflow: int = 2,
+        pool_timeout: float = 5.0,
+        conn_max_age: float = 60 * 60.0,
+        pre_ping: bool = False,
+        lock_timeout: int = 0,
+        schema: str = "",
+        pool_open_timeout: int | None = None,
+    ):
+        self.idle_in_transaction_session_timeout = idle_in_transaction_session_timeout
+        self.pre_ping = pre_ping
+        self.pool_open_timeout = pool_open_timeout
+        self.pool = AsyncConnectionPool(
+            connection_class=AsyncConnection[DictRow],
+            kwargs={
+                "dbname": dbname,
+                "host": host,
+                "port": port,
+                "user": user,
+                "password": password,
+                "row_factory": dict_row,
+            },
+            min_size=pool_size,
+            max_size=pool_size + max_overflow,
+            open=False,
+            configure=self.after_connect,
+            timeout=connect_timeout,
+            max_waiting=round(pool_timeout),
+            max_lifetime=conn_max_age,
+            check=AsyncConnectionPool.check_connection if pre_ping else None,
+        )
+        self.lock_timeout = lock_timeout
+        self.schema = schema.strip()
+
+    async def after_connect(self, conn: AsyncConnection[DictRow]) -> None:
+        await conn.set_autocommit(True)
+        await conn.execute(
+            "SET idle_in_transaction_session_timeout = "
+            f"'{self.idle_in_transaction_session_timeout}s'"
+        )
+
+    @asynccontextmanager
+    async def get_connection(self) -> AsyncIterator[AsyncConnection[DictRow]]:
+        with _convert_psycopg_errors():
+            wait = self.pool_open_timeout is not None
+            timeout = self.pool_open_timeout or 30.0
+            await self.pool.open(wait, timeout)
+
+            async with self.pool.connection() as conn:
+                yield conn
+
+    @asynccontextmanager
+    async def transaction(
+        self, *, commit: bool = False
+    ) -> AsyncIterator[AsyncCursor[DictRow]]:
+        conn: AsyncConnection[DictRow]
+        async with self.get_connection() as conn, conn.transaction(
+            force_rollback=not commit
+        ):
+            yield conn.cursor()
+
+    async def close(self) -> None:
+        await self.pool.close()
+
+
+class _PostgresAggregateRecorderBase:
+    """
+    Constructs the SQL statements used by both the sync and
+    the async PostgreSQL aggregate recorders.
+    """
+
+    def __init__(
+        self,
+        datastore: PostgresDatastore | AsyncPostgresDatastore,
         events_table_name: str,
     ):
         self.check_table_name_length(events_table_name, datastore.schema)
@@ -157,6 +290,9 @@ class PostgresAggregateRecorder(AggregateRecorder):
         self.notification_id_index_name = (
             f"{unqualified_table_name}_notification_id_idx "
         )
+        self.topic_index_name = _bounded_identifier(
+            unqualified_table_name, "_topic_idx"
+        )
 
         self.create_table_statements = self.construct_create_table_statements()
         self.insert_events_statement = (
@@ -165,7 +301,34 @@ class PostgresAggregateRecorder(AggregateRecorder):
         self.select_events_statement = (
             f"SELECT * FROM {self.events_table_name} WHERE originator_id = %s"
         )
+        self.select_events_many_statement = (
+            f"SELECT * FROM {self.events_table_name} WHERE originator_id = ANY(%s)"
+        )
+        self.delete_events_statement = (
+            f"DELETE FROM {self.events_table_name} WHERE originator_id = %s"
+        )
+        self.select_originator_ids_statement = (
+            f"SELECT DISTINCT originator_id FROM {self.events_table_name}"
+        )
+        self.compact_events_statement = (
+            f"DELETE FROM {self.events_table_name} "
+            "WHERE (originator_id, originator_version) IN ("
+            "SELECT originator_id, originator_version FROM ("
+            "SELECT originator_id, originator_version, "
+            "row_number() OVER (PARTITION BY originator_id "
+            "ORDER BY originator_version DESC) AS row_num "
+            f"FROM {self.events_table_name} "
+            "WHERE originator_id >= %s AND originator_id <= %s) AS e "
+            "WHERE row_num > %s)"
+        )
+        self.vacuum_table_statement = f"VACUUM {self.events_table_name}"
+        self.copy_events_statement = (
+            f"COPY {self.events_table_name} "
+            "(originator_id, originator_version, topic, state) "
+            "FROM STDIN (FORMAT BINARY)"
+        )
         self.lock_table_statements: List[str] = []
+        self.unlock_table_statements: List[str] = []
 
     @staticmethod
     def check_table_name_length(table_name: str, schema_name: str) -> None:
@@ -192,6 +355,69 @@ class PostgresAggregateRecorder(AggregateRecorder):
         )
         return [statement]
 
+    def _construct_select_events_statement(
+        self,
+        originator_id: UUID,
+        *,
+        gt: int | None,
+        lte: int | None,
+        desc: bool,
+        limit: int | None,
+    ) -> Tuple[str, List[Any]]:
+        statement = self.select_events_statement
+        params: List[Any] = [originator_id]
+        if gt is not None:
+            params.append(gt)
+            statement += " AND originator_version > %s"
+        if lte is not None:
+            params.append(lte)
+            statement += " AND originator_version <= %s"
+        statement += " ORDER BY originator_version"
+        if desc is False:
+            statement += " ASC"
+        else:
+            statement += " DESC"
+        if limit is not None:
+            params.append(limit)
+            statement += " LIMIT %s"
+        return statement, params
+
+    def _construct_delete_events_statement(
+        self, originator_id: UUID, *, gt: int | None, lt: int | None, keep: int
+    ) -> Tuple[str, List[Any]]:
+        statement = self.delete_events_statement
+        params: List[Any] = [originator_id]
+        if gt is not None:
+            params.append(gt)
+            statement += " AND originator_version > %s"
+        if lt is not None:
+            params.append(lt)
+            statement += " AND originator_version < %s"
+        if keep > 0:
+            params += [originator_id, keep]
+            statement += (
+                " AND originator_version NOT IN ("
+                f"SELECT originator_version FROM {self.events_table_name} "
+                "WHERE originator_id = %s ORDER BY originator_version DESC LIMIT %s)"
+            )
+        return statement, params
+
+    def _construct_select_originator_ids_statement(
+        self, gt: UUID | None, limit: int
+    ) -> Tuple[str, List[Any]]:
+        statement = self.select_originator_ids_statement
+        params: List[Any] = []
+        if gt is not None:
+            params.append(gt)
+            statement += " WHERE originator_id > %s"
+        params.append(limit)
+        statement += " ORDER BY originator_id LIMIT %s"
+        return statement, params
+
+
+class PostgresAggregateRecorder(_PostgresAggregateRecorderBase, AggregateRecorder):
+    datastore: PostgresDatastore
+
     def create_table(self) -> None:
         with self.datastore.transaction(commit=True) as curs:
             for statement in self.create_table_statements:
@@ -224,10 +450,61 @@ class PostgresAggregateRecorder(AggregateRecorder):
                         # Avoid psycopg emitting a pipeline warning.
                         exc = e
             if exc:
+                # Release any lock that was not released by the failed transaction.
+                with conn.cursor() as curs:
+                    self._unlock_table(curs)
                 # Reraise exception after pipeline context manager has exited.
                 raise exc
         return notification_ids
 
+    def bulk_insert_events(
+        self, stored_events: Iterable[StoredEvent], **kwargs: Any
+    ) -> Sequence[int] | None:
+        """
+        Writes stored events into database with "COPY ... FROM STDIN" in
+        binary format, which is much faster than inserting stored events
+        with parameterised INSERT statements. The table is locked in the
+        same way as when inserting stored events, so notification IDs are
+        issued in order, and the primary key constraint is still enforced,
+        so nothing is written if any stored event conflicts with another.
+        Tracking objects can't be recorded by this method.
+        """
+        if kwargs.get("tracking") is not None:
+            msg = "Can't record tracking object when bulk inserting events"
+            raise ProgrammingError(msg)
+        conn: Connection[DictRow]
+        notification_ids: Sequence[int] | None = None
+        with self.datastore.get_connection() as conn:
+            try:
+                with conn.transaction(), conn.cursor() as curs:
+                    self._lock_table(curs)
+                    count = 0
+                    with curs.copy(self.copy_events_statement) as copy:
+                        copy.set_types(["uuid", "int8", "text", "bytea"])
+                        for stored_event in stored_events:
+                            copy.write_row((
+                                stored_event.originator_id,
+                                stored_event.originator_version,
+                                stored_event.topic,
+                                stored_event.state,
+                            ))
+                            count += 1
+                    notification_ids = self._fetch_ids_after_copy_events(curs, count)
+                    if count:
+                        self._notify_subscribers(curs)
+                    self._unlock_table(curs)
+            except Exception:
+                # Release any lock that was not released by the failed transaction.
+                with conn.cursor() as curs:
+                    self._unlock_table(curs)
+                raise
+        return notification_ids
+
+    def _fetch_ids_after_copy_events(
+        self, c: Cursor[DictRow], count: int
+    ) -> Sequence[int] | None:
+        return None
+
     def _insert_events(
         self,
         c: Cursor[DictRow],
@@ -261,9 +538,19 @@ class PostgresAggregateRecorder(AggregateRecorder):
                 returning="RETURNING" in self.insert_events_statement,
             )
 
+            # Use a different cursor, to keep the results of executemany().
+            with c.connection.cursor() as curs:
+                self._unlock_table(curs)
+
     def _lock_table(self, c: Cursor[DictRow]) -> None:
         pass
 
+    def _unlock_table(self, c: Cursor[DictRow]) -> None:
+        pass
+
+    def _notify_subscribers(self, c: Cursor[DictRow]) -> None:
+        pass
+
     def _fetch_ids_after_insert_events(
         self,
         c: Cursor[DictRow],
@@ -282,23 +569,9 @@ class PostgresAggregateRecorder(AggregateRecorder):
         desc: bool = False,
         limit: int | None = None,
     ) -> List[StoredEvent]:
-        statement = self.select_events_statement
-        params: List[Any] = [originator_id]
-        if gt is not None:
-            params.append(gt)
-            statement += " AND originator_version > %s"
-        if lte is not None:
-            params.append(lte)
-            statement += " AND originator_version <= %s"
-        statement += " ORDER BY originator_version"
-        if desc is False:
-            statement += " ASC"
-        else:
-            statement += " DESC"
-        if limit is not None:
-            params.append(limit)
-            statement += " LIMIT %s"
-
+        statement, params = self._construct_select_events_statement(
+            originator_id, gt=gt, lte=lte, desc=desc, limit=limit
+        )
         with self.datastore.get_connection() as conn, conn.cursor() as curs:
             curs.execute(statement, params, prepare=True)
             return [
@@ -311,11 +584,130 @@ class PostgresAggregateRecorder(AggregateRecorder):
                 for row in curs.fetchall()
             ]
 
+    @retry((InterfaceError, OperationalError), max_attempts=10, wait=0.2)
+    def select_events_many(
+        self,
+        originator_ids: Sequence[UUID],
+        *,
+        gt_versions: Mapping[UUID, int] | None = None,
+        desc: bool = False,
+        limit: int | None = None,
+    ) -> Dict[UUID, List[StoredEvent]]:
+        results: Dict[UUID, List[StoredEvent]] = {
+            originator_id: [] for originator_id in originator_ids
+        }
+        if not results:
+            return results
+        order = "DESC" if desc else "ASC"
+        params: List[Any]
+        if gt_versions is None and limit is None:
+            statement = (
+                self.select_events_many_statement
+                + f" ORDER BY originator_id, originator_version {order}"
+            )
+            params = [list(results)]
+        else:
+            # Select the events of each originator with a lateral join,
+            # so that any "greater than" version and limit can be applied
+            # to each originator using the primary key index.
+            gt_versions = gt_versions or {}
+            statement = (
+                "SELECT e.* FROM unnest(%s::uuid[], %s::bigint[]) "
+                "AS v(originator_id, gt) CROSS JOIN LATERAL ("
+                f"SELECT * FROM {self.events_table_name} "
+                "WHERE originator_id = v.originator_id "
+                "AND (v.gt IS NULL OR originator_version > v.gt) "
+                f"ORDER BY originator_version {order} LIMIT %s) AS e"
+            )
+            params = [
+                list(results),
+                [gt_versions.get(originator_id) for originator_id in results],
+                limit,
+            ]
+
+        with self.datastore.get_connection() as conn, conn.cursor() as curs:
+            curs.execute(statement, params, prepare=True)
+            for row in curs.fetchall():
+                results[row["originator_id"]].append(
+                    StoredEvent(
+                        originator_id=row["originator_id"],
+                        originator_version=row["originator_version"],
+                        topic=row["topic"],
+                        state=bytes(row["state"]),
+                    )
+                )
+        return results
+
+    @retry((InterfaceError, OperationalError), max_attempts=10, wait=0.2)
+    def delete_events(
+        self,
+        originator_id: UUID,
+        *,
+        gt: int | None = None,
+        lt: int | None = None,
+        keep: int = 0,
+    ) -> None:
+        statement, params = self._construct_delete_events_statement(
+            originator_id, gt=gt, lt=lt, keep=keep
+        )
+        with self.datastore.transaction(commit=True) as curs:
+            curs.execute(statement, params, prepare=True)
+
+    def compact_events(self, *, keep: int, batch_size: int = 1000) -> int:
+        """
+        Deletes old stored events in batches, each in its own transaction,
+        so that other writers are not blocked for long. The aggregates of
+        each batch are selected after the last aggregate of the previous
+        batch, so that only the stored events of a batch are read. Since
+        autovacuum is disabled for the tables of stored events, the table
+        is then vacuumed, so that the space of the deleted rows can be reused.
+        """
+        deleted = 0
+        last_originator_id: UUID | None = None
+        while True:
+            statement, params = self._construct_select_originator_ids_statement(
+                last_originator_id, batch_size
+            )
+            with self.datastore.transaction(commit=True) as curs:
+                curs.execute(statement, params, prepare=True)
+                originator_ids = [row["originator_id"] for row in curs.fetchall()]
+                if originator_ids:
+                    curs.execute(
+                        self.compact_events_statement,
+                        [originator_ids[0], originator_ids[-1], keep],
+                        prepare=True,
+                    )
+                    deleted += curs.rowcount
+            if len(originator_ids) < batch_size:
+                break
+            last_originator_id = originator_ids[-1]
+        if deleted:
+            # Connections from the pool are in autocommit mode, which is
+            # needed because VACUUM can't be run inside a transaction block.
+            with self.datastore.get_connection() as conn, conn.cursor() as curs:
+                curs.execute(self.vacuum_table_statement)
+        return deleted
+
+
+class _PostgresApplicationRecorderBase(_PostgresAggregateRecorderBase):
+    """
+    Constructs the SQL statements used by both the sync and
+    the async PostgreSQL application recorders.
+    """
+
+    gap_tolerant = False
+    listen_notify = False
+    topic_index = False
+
+    # Transactions with IDs less than the "xmin" of the current snapshot have
+    # either committed or aborted, so their notification IDs are safe to read.
+    transaction_horizon_condition = (
+        "transaction_id < pg_snapshot_xmin(pg_current_snapshot())"
+    )
 
-class PostgresApplicationRecorder(PostgresAggregateRecorder, ApplicationRecorder):
     def __init__(
         self,
-        datastore: PostgresDatastore,
+        datastore: PostgresDatastore | AsyncPostgresDatastore,
         events_table_name: str = "stored_events",
     ):
         super().__init__(datastore, events_table_name)
@@ -323,13 +715,42 @@ class PostgresApplicationRecorder(PostgresAggregateRecorder, ApplicationRecorder
         self.max_notification_id_statement = (
             f"SELECT MAX(notification_id) FROM {self.events_table_name}"
         )
-        self.lock_table_statements = [
-            f"SET LOCAL lock_timeout = '{self.datastore.lock_timeout}s'",
-            f"LOCK TABLE {self.events_table_name} IN EXCLUSIVE MODE",
-        ]
+        self.last_notification_id_statement = (
+            "SELECT currval(pg_get_serial_sequence("
+            f"'{self.events_table_name}', 'notification_id'))"
+        )
+        # Notifications are only delivered to listeners when (and if) the
+        # transaction commits, and duplicates in a transaction are discarded.
+        # Channel names are identifiers, so are bounded to 63 bytes.
+        self.channel_name = _bounded_identifier(
+            self.events_table_name.replace(".", "_"), ""
+        )
+        self.notify_statement = f"SELECT pg_notify('{self.channel_name}', '')"
+        self.listen_statement = f'LISTEN "{self.channel_name}"'
+        if self.gap_tolerant:
+            self.max_notification_id_statement += (
+                f" WHERE {self.transaction_horizon_condition}"
+            )
+            # Hold a session lock whilst the transaction ID and the notification
+            # IDs are issued, but release it before the transaction commits.
+            lock_key = f"'{self.events_table_name}'::regclass::oid::bigint"
+            self.lock_table_statements = [
+                f"SET LOCAL lock_timeout = '{self.datastore.lock_timeout}s'",
+                f"SELECT pg_advisory_lock({lock_key})",
+                "SELECT pg_current_xact_id()",
+            ]
+            self.unlock_table_statements = [f"SELECT pg_advisory_unlock({lock_key})"]
+        else:
+            self.lock_table_statements = [
+                f"SET LOCAL lock_timeout = '{self.datastore.lock_timeout}s'",
+                f"LOCK TABLE {self.events_table_name} IN EXCLUSIVE MODE",
+            ]
 
     def construct_create_table_statements(self) -> List[str]:
-        return [
+        transaction_id_column = (
+            "transaction_id xid8 NOT NULL DEFAULT pg_current_xact_id()"
+        )
+        statements = [
             (
                 "CREATE TABLE IF NOT EXISTS "
                 f"{self.events_table_name} ("
@@ -338,7 +759,8 @@ class PostgresApplicationRecorder(PostgresAggregateRecorder, ApplicationRecorder
                 "topic text, "
                 "state bytea, "
                 "notification_id bigserial, "
-                "PRIMARY KEY "
+                + (f"{transaction_id_column}, " if self.gap_tolerant else "")
+                + "PRIMARY KEY "
                 "(originator_id, originator_version)) "
                 "WITH (autovacuum_enabled=false)"
             ),
@@ -348,34 +770,269 @@ class PostgresApplicationRecorder(PostgresAggregateRecorder, ApplicationRecorder
                 f"ON {self.events_table_name} (notification_id ASC);"
             ),
         ]
+        if self.gap_tolerant:
+            # Add the column to a table that was created without it. Since this
+            # locks and rewrites the table, first check the column doesn't exist.
+            statements.append(
+                "DO $$ BEGIN IF NOT EXISTS ("
+                "SELECT FROM pg_attribute "
+                f"WHERE attrelid = '{self.events_table_name}'::regclass "
+                "AND attname = 'transaction_id' AND NOT attisdropped"
+                f") THEN ALTER TABLE {self.events_table_name} "
+                f"ADD COLUMN {transaction_id_column}; "
+                "END IF; END $$"
+            )
+        if self.topic_index:
+            statements.append(
+                f"CREATE INDEX IF NOT EXISTS {self.topic_index_name} "
+                f"ON {self.events_table_name} (topic, notification_id)"
+            )
+        return statements
 
-    @retry((InterfaceError, OperationalError), max_attempts=10, wait=0.2)
-    def select_notifications(
+    def _construct_select_notifications_statement(
         self,
         start: int,
         limit: int,
-        stop: int | None = None,
-        topics: Sequence[str] = (),
-    ) -> List[Notification]:
-        """
-        Returns a list of event notifications
-        from 'start', limited by 'limit'.
-        """
+        stop: int | None,
+        topics: Sequence[str],
+    ) -> Tuple[str, List[Any]]:
+        if topics and self.topic_index:
+            # Select from the topic index once for each topic, so that no more
+            # than 'limit' rows are read for each topic, and then merge the
+            # results in the order of their notification IDs.
+            params: List[Any] = []
+            statements = []
+            for topic in dict.fromkeys(topics):
+                statement, topic_params = self._construct_select_notifications_range(
+                    start, limit, stop, "topic = %s"
+                )
+                statements.append(statement)
+                params += [topic, *topic_params]
+            if len(statements) == 1:
+                return statements[0], params
+            params.append(limit)
+            union = " UNION ALL ".join(f"({statement})" for statement in statements)
+            statement = (
+                f"SELECT * FROM ({union}) AS t ORDER BY notification_id LIMIT %s"
+            )
+            return statement, params
+
+        condition = ""
+        params = []
+        if topics:
+            condition = "topic = ANY(%s)"
+            params.append(topics)
+        statement, range_params = self._construct_select_notifications_range(
+            start, limit, stop, condition
+        )
+        return statement, params + range_params
 
-        params: List[int | str | Sequence[str]] = [start]
-        statement = f"SELECT * FROM {self.events_table_name} WHERE notification_id>=%s"
+    def _construct_select_notifications_range(
+        self, start: int, limit: int, stop: int | None, condition: str
+    ) -> Tuple[str, List[Any]]:
+        params: List[Any] = [start]
+        statement = f"SELECT * FROM {self.events_table_name} WHERE "
+        if condition:
+            statement += f"{condition} AND "
+        statement += "notification_id>=%s"
 
         if stop is not None:
             params.append(stop)
             statement += " AND notification_id <= %s"
 
-        if topics:
-            params.append(topics)
-            statement += " AND topic = ANY(%s)"
+        if self.gap_tolerant:
+            statement += f" AND {self.transaction_horizon_condition}"
 
         params.append(limit)
         statement += " ORDER BY notification_id LIMIT %s"
+        return statement, params
+
+
+class _GroupCommitRequest:
+    """
+    A call to :func:`PostgresApplicationRecorder.insert_events`
+    that is waiting to be committed with other calls.
+    """
+
+    def __init__(self, stored_events: List[StoredEvent], kwargs: Dict[str, Any]):
+        self.stored_events = stored_events
+        self.kwargs = kwargs
+        self.notification_ids: Sequence[int] | None = None
+        self.error: Exception | None = None
+        self.is_done = False
+
+
+class PostgresApplicationRecorder(
+    PostgresAggregateRecorder, _PostgresApplicationRecorderBase, ApplicationRecorder
+):
+    def __init__(
+        self,
+        datastore: PostgresDatastore,
+        events_table_name: str = "stored_events",
+        *,
+        gap_tolerant: bool = False,
+        group_commit: bool = False,
+        group_commit_window: float = 0.0,
+        listen_notify: bool = False,
+        topic_index: bool = False,
+    ):
+        """
+        If 'gap_tolerant' is True, the table is not locked when inserting stored
+        events, so that transactions which insert stored events can commit
+        concurrently. Instead, each stored event records the ID of the transaction
+        that inserted it, and :func:`select_notifications` only returns stored
+        events that were inserted by transactions with IDs that are less than the
+        "xmin" of the current snapshot, which have all either committed or aborted.
+        Transaction IDs and notification IDs are issued in the same order, so that
+        readers that are tailing the notification log will never skip over
+        notification IDs that are committed later. A long-running transaction
+        will however delay readers until it has ended.
+
+        If 'group_commit' is True, concurrent calls to :func:`insert_events`
+        are committed together in one transaction, which locks the table once,
+        so that the throughput of writers which contend for the table lock is
+        increased. Each call is recorded within its own savepoint, so that each
+        caller receives its own notification IDs, or its own integrity error.
+
+        The 'group_commit_window' is the number of seconds a transaction waits
+        for other calls to join it. By default, transactions do not wait, and
+        calls that are made whilst a transaction is being committed are
+        committed together in the next transaction.
+
+        If 'listen_notify' is True, transactions that insert stored events
+        send a notification (with NOTIFY) on a channel named after the table
+        when they commit, and :func:`subscribe` returns a
+        :class:`PostgresSubscription` that listens on the channel (with LISTEN),
+        so that subscribers in other processes are woken without polling.
+
+        If 'topic_index' is True, the table is indexed by topic and notification
+        ID, and :func:`select_notifications` selects notifications with topics
+        by scanning that index once for each topic, so that only the rows which
+        have those topics are read, rather than every row in the range.
+        """
+        self.gap_tolerant = gap_tolerant
+        self.listen_notify = listen_notify
+        self.topic_index = topic_index
+        super().__init__(datastore, events_table_name)
+        self.group_commit = group_commit
+        self.group_commit_window = group_commit_window
+        self._group_commit_condition = Condition()
+        self._group_commit_requests: List[_GroupCommitRequest] = []
+        self._group_commit_is_leading = False
+
+    def insert_events(
+        self, stored_events: List[StoredEvent], **kwargs: Any
+    ) -> Sequence[int] | None:
+        if self.group_commit and len(stored_events) > 0:
+            return self._group_insert_events(stored_events, **kwargs)
+        return super().insert_events(stored_events, **kwargs)
+
+    @retry((InterfaceError, OperationalError), max_attempts=10, wait=0.2)
+    def _group_insert_events(
+        self, stored_events: List[StoredEvent], **kwargs: Any
+    ) -> Sequence[int] | None:
+        request = _GroupCommitRequest(stored_events, kwargs)
+        with self._group_commit_condition:
+            self._group_commit_requests.append(request)
+            # Wait until the request has been committed by another thread,
+            # or until no other thread is committing requests.
+            while not request.is_done and self._group_commit_is_leading:
+                self._group_commit_condition.wait()
+            if not request.is_done:
+                self._group_commit_is_leading = True
+
+        if not request.is_done:
+            requests: List[_GroupCommitRequest] = []
+            try:
+                if self.group_commit_window:
+                    sleep(self.group_commit_window)
+                with self._group_commit_condition:
+                    requests = self._group_commit_requests
+                    self._group_commit_requests = []
+                self._commit_group(requests)
+            finally:
+                with self._group_commit_condition:
+                    for r in requests:
+                        r.is_done = True
+                    self._group_commit_is_leading = False
+                    self._group_commit_condition.notify_all()
+
+        if request.error is not None:
+            raise request.error
+        return request.notification_ids
+
+    def _commit_group(self, requests: List[_GroupCommitRequest]) -> None:
+        conn: Connection[DictRow]
+        try:
+            with self.datastore.get_connection() as conn:
+                try:
+                    with conn.transaction():
+                        with conn.cursor() as curs:
+                            self._lock_table(curs)
+                        for request in requests:
+                            self._insert_group_commit_request(conn, request)
+                        with conn.cursor() as curs:
+                            self._unlock_table(curs)
+                except Exception:
+                    # Release any lock not released by the failed transaction.
+                    with conn.cursor() as curs:
+                        self._unlock_table(curs)
+                    raise
+        except Exception as e:
+            # Nothing was committed, so every request has failed.
+            for request in requests:
+                request.notification_ids = None
+                if request.error is None:
+                    request.error = e
+
+    def _insert_group_commit_request(
+        self, conn: Connection[DictRow], request: _GroupCommitRequest
+    ) -> None:
+        # Use a savepoint, so a conflict only fails this request.
+        try:
+            with _convert_psycopg_errors(), conn.transaction():
+                with conn.cursor() as curs:
+                    self._insert_events(curs, request.stored_events, **request.kwargs)
+                with conn.cursor() as curs:
+                    curs.executemany(
+                        query=self.insert_events_statement,
+                        params_seq=[
+                            (
+                                stored_event.originator_id,
+                                stored_event.originator_version,
+                                stored_event.topic,
+                                stored_event.state,
+                            )
+                            for stored_event in request.stored_events
+                        ],
+                        returning=True,
+                    )
+                    notification_ids = []
+                    for _ in request.stored_events:
+                        row = curs.fetchone()
+                        assert row is not None
+                        notification_ids.append(row["notification_id"])
+                        curs.nextset()
+        except IntegrityError as e:
+            request.error = e
+        else:
+            request.notification_ids = notification_ids
 
+    @retry((InterfaceError, OperationalError), max_attempts=10, wait=0.2)
+    def select_notifications(
+        self,
+        start: int,
+        limit: int,
+        stop: int | None = None,
+        topics: Sequence[str] = (),
+    ) -> List[Notification]:
+        """
+        Returns a list of event notifications
+        from 'start', limited by 'limit'.
+        """
+        statement, params = self._construct_select_notifications_statement(
+            start, limit, stop, topics
+        )
         connection = self.datastore.get_connection()
         with connection as conn, conn.cursor() as curs:
             curs.execute(statement, params, prepare=True)
@@ -402,6 +1059,31 @@ class PostgresApplicationRecorder(PostgresAggregateRecorder, ApplicationRecorder
             assert fetchone is not None
             return fetchone["max"] or 0
 
+    def subscribe(
+        self, gt: int | None = None, topics: Sequence[str] = ()
+    ) -> Subscription:
+        """
+        Returns a :class:`PostgresSubscription` if 'listen_notify' is True,
+        otherwise returns a subscription that polls the recorder.
+        """
+        if not self.listen_notify:
+            return super().subscribe(gt=gt, topics=topics)
+        return PostgresSubscription(self, gt=gt, topics=topics)
+
+    def _insert_events(
+        self,
+        c: Cursor[DictRow],
+        stored_events: List[StoredEvent],
+        **kwargs: Any,
+    ) -> None:
+        super()._insert_events(c, stored_events, **kwargs)
+        if stored_events:
+            self._notify_subscribers(c)
+
+    def _notify_subscribers(self, c: Cursor[DictRow]) -> None:
+        if self.listen_notify:
+            c.execute(self.notify_statement, prepare=True)
+
     def _lock_table(self, c: Cursor[DictRow]) -> None:
         # Acquire "EXCLUSIVE" table lock, to serialize transactions that insert
         # stored events, so that readers don't pass over gaps that are filled in
@@ -423,9 +1105,31 @@ class PostgresApplicationRecorder(PostgresAggregateRecorder, ApplicationRecorder
         # https://www.postgresql.org/docs/9.1/sql-lock.html
         # https://stackoverflow.com/questions/45866187/guarantee-monotonicity-of
         # -postgresql-serial-column-values-by-commit-order
+        #
+        # Alternatively, when 'gap_tolerant' is True, a session-level advisory lock
+        # is held only whilst the transaction ID and the notification IDs are issued,
+        # and readers select only those stored events that were inserted by ended
+        # transactions (see __init__).
         for lock_statement in self.lock_table_statements:
             c.execute(lock_statement, prepare=True)
 
+    def _unlock_table(self, c: Cursor[DictRow]) -> None:
+        for unlock_statement in self.unlock_table_statements:
+            c.execute(unlock_statement, prepare=True)
+
+    def _fetch_ids_after_copy_events(
+        self, c: Cursor[DictRow], count: int
+    ) -> Sequence[int] | None:
+        if not count:
+            return []
+        # Whilst the table is locked, the copied stored events
+        # are issued with a contiguous range of notification IDs.
+        c.execute(self.last_notification_id_statement, prepare=True)
+        fetchone = c.fetchone()
+        assert fetchone is not None
+        last_notification_id = fetchone["currval"]
+        return list(range(last_notification_id - count + 1, last_notification_id + 1))
+
     def _fetch_ids_after_insert_events(
         self,
         c: Cursor[DictRow],
@@ -435,10 +1139,9 @@ class PostgresApplicationRecorder(PostgresAggregateRecorder, ApplicationRecorder
         notification_ids: List[int] = []
         len_events = len(stored_events)
         if len_events:
-            if (
-                (c.statusmessage == "SET")
-                and c.nextset()
-                and (c.statusmessage == "LOCK TABLE")
+            # Skip over the results of the lock statements.
+            if (c.statusmessage == "SET") and all(
+                c.nextset() for _ in self.lock_table_statements[1:]
             ):
                 while c.nextset() and len(notification_ids) != len_events:
                     row = c.fetchone()
@@ -450,16 +1153,74 @@ class PostgresApplicationRecorder(PostgresAggregateRecorder, ApplicationRecorder
         return notification_ids
 
 
+class PostgresSubscription(Subscription):
+    """
+    Subscription to the event notifications of a PostgreSQL application
+    recorder, which listens (with LISTEN) on the recorder's channel with a
+    connection that is not from the pool, and is woken when transactions that
+    insert stored events commit. The recorder is also polled every
+    :attr:`poll_interval` seconds, which also limits how long it takes for a
+    subscription that is stopped by another thread to stop iterating.
+    """
+
+    poll_interval = 1.0
+
+    def __init__(
+        self,
+        recorder: PostgresApplicationRecorder,
+        gt: int | None = None,
+        topics: Sequence[str] = (),
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ):
+        super().__init__(recorder, gt=gt, topics=topics, page_size=page_size)
+        self._connection: Connection[DictRow] | None = recorder.datastore.connect()
+        with _convert_psycopg_errors():
+            self._connection.execute(recorder.listen_statement)
+
+    def wait(self, timeout: float) -> None:
+        if self._has_been_woken.is_set() or self._connection is None:
+            return
+        with _convert_psycopg_errors():
+            for _ in self._connection.notifies(timeout=timeout, stop_after=1):
+                pass
+            # Discard other pending notifications, since we will select anyway.
+            for _ in self._connection.notifies(timeout=0):
+                pass
+
+    def __next__(self) -> Notification:
+        try:
+            return super().__next__()
+        except StopIteration:
+            # Close in the iterating thread, which might be using the connection.
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
 class PostgresProcessRecorder(PostgresApplicationRecorder, ProcessRecorder):
     def __init__(
         self,
         datastore: PostgresDatastore,
         events_table_name: str,
         tracking_table_name: str,
+        *,
+        gap_tolerant: bool = False,
+        listen_notify: bool = False,
+        topic_index: bool = False,
     ):
         self.check_table_name_length(tracking_table_name, datastore.schema)
         self.tracking_table_name = tracking_table_name
-        super().__init__(datastore, events_table_name)
+        super().__init__(
+            datastore,
+            events_table_name,
+            gap_tolerant=gap_tolerant,
+            listen_notify=listen_notify,
+            topic_index=topic_index,
+        )
         self.insert_tracking_statement = (
             f"INSERT INTO {self.tracking_table_name} VALUES (%s, %s)"
         )
@@ -517,6 +1278,25 @@ class PostgresProcessRecorder(PostgresApplicationRecorder, ProcessRecorder):
         stored_events: List[StoredEvent],
         **kwargs: Any,
     ) -> None:
+        # When gap tolerant, the transaction ID must not be issued before the
+        # advisory lock is acquired, so insert the tracking record afterwards.
+        if not (self.gap_tolerant and stored_events):
+            self._insert_tracking(c, **kwargs)
+        super()._insert_events(c, stored_events, **kwargs)
+
+    def _insert_stored_events(
+        self,
+        c: Cursor[DictRow],
+        stored_events: List[StoredEvent],
+        **kwargs: Any,
+    ) -> None:
+        super()._insert_stored_events(c, stored_events, **kwargs)
+        if self.gap_tolerant and stored_events:
+            # Use a different cursor, to keep the results of executemany().
+            with c.connection.cursor() as curs:
+                self._insert_tracking(curs, **kwargs)
+
+    def _insert_tracking(self, c: Cursor[DictRow], **kwargs: Any) -> None:
         tracking: Tracking | None = kwargs.get("tracking", None)
         if tracking is not None:
             c.execute(
@@ -527,7 +1307,216 @@ class PostgresProcessRecorder(PostgresApplicationRecorder, ProcessRecorder):
                 ),
                 prepare=True,
             )
-        super()._insert_events(c, stored_events, **kwargs)
+
+
+class AsyncPostgresAggregateRecorder(
+    _PostgresAggregateRecorderBase, AsyncAggregateRecorder
+):
+    datastore: AsyncPostgresDatastore
+
+    async def create_table(self) -> None:
+        async with self.datastore.transaction(commit=True) as curs:
+            for statement in self.create_table_statements:
+                await curs.execute(statement, prepare=False)
+
+    @retry((InterfaceError, OperationalError), max_attempts=10, wait=0.2)
+    async def insert_events(
+        self, stored_events: List[StoredEvent], **kwargs: Any
+    ) -> Sequence[int] | None:
+        conn: AsyncConnection[DictRow]
+        exc: Exception | None = None
+        notification_ids: Sequence[int] | None = None
+        async with self.datastore.get_connection() as conn:
+            async with conn.pipeline() as pipeline:
+                try:
+                    # Let an error roll back the transaction before it is caught,
+                    # otherwise committing the aborted pipeline raises an error.
+                    async with conn.transaction(), conn.cursor() as curs:
+                        await self._insert_stored_events(curs, stored_events)
+                        # Sync now, so any uniqueness constraint violation causes an
+                        # IntegrityError to be raised here, rather an InternalError
+                        # being raised sometime later e.g. when commit() is called.
+                        await pipeline.sync()
+                        notification_ids = await self._fetch_ids_after_insert_events(
+                            curs, stored_events
+                        )
+                except Exception as e:
+                    # Avoid psycopg emitting a pipeline warning.
+                    exc = e
+            if exc:
+                # Reraise exception after pipeline context manager has exited.
+                raise exc
+        return notification_ids
+
+    async def _insert_stored_events(
+        self, c: AsyncCursor[DictRow], stored_events: List[StoredEvent]
+    ) -> None:
+        # Only do something if there is something to do.
+        if len(stored_events) > 0:
+            await self._lock_table(c)
+
+            # Insert events.
+            await c.executemany(
+                query=self.insert_events_statement,
+                params_seq=[
+                    (
+                        stored_event.originator_id,
+                        stored_event.originator_version,
+                        stored_event.topic,
+                        stored_event.state,
+                    )
+                    for stored_event in stored_events
+                ],
+                returning="RETURNING" in self.insert_events_statement,
+            )
+
+    async def _lock_table(self, c: AsyncCursor[DictRow]) -> None:
+        pass
+
+    async def _fetch_ids_after_insert_events(
+        self, c: AsyncCursor[DictRow], stored_events: List[StoredEvent]
+    ) -> Sequence[int] | None:
+        return None
+
+    @retry((InterfaceError, OperationalError), max_attempts=10, wait=0.2)
+    async def select_events(
+        self,
+        originator_id: UUID,
+        *,
+        gt: int | None = None,
+        lte: int | None = None,
+        desc: bool = False,
+        limit: int | None = None,
+    ) -> List[StoredEvent]:
+        statement, params = self._construct_select_events_statement(
+            originator_id, gt=gt, lte=lte, desc=desc, limit=limit
+        )
+        async with self.datastore.get_connection() as conn, conn.cursor() as curs:
+            await curs.execute(statement, params, prepare=True)
+            return [
+                StoredEvent(
+                    originator_id=row["originator_id"],
+                    originator_version=row["originator_version"],
+                    topic=row["topic"],
+                    state=bytes(row["state"]),
+                )
+                for row in await curs.fetchall()
+            ]
+
+    @retry((InterfaceError, OperationalError), max_attempts=10, wait=0.2)
+    async def delete_events(
+        self,
+        originator_id: UUID,
+        *,
+        gt: int | None = None,
+        lt: int | None = None,
+        keep: int = 0,
+    ) -> None:
+        statement, params = self._construct_delete_events_statement(
+            originator_id, gt=gt, lt=lt, keep=keep
+        )
+        async with self.datastore.transaction(commit=True) as curs:
+            await curs.execute(statement, params, prepare=True)
+
+    async def compact_events(self, *, keep: int, batch_size: int = 1000) -> int:
+        """
+        Deletes old stored events in batches (see
+        :func:`PostgresAggregateRecorder.compact_events`).
+        """
+        deleted = 0
+        last_originator_id: UUID | None = None
+        while True:
+            statement, params = self._construct_select_originator_ids_statement(
+                last_originator_id, batch_size
+            )
+            async with self.datastore.transaction(commit=True) as curs:
+                await curs.execute(statement, params, prepare=True)
+                originator_ids = [row["originator_id"] for row in await curs.fetchall()]
+                if originator_ids:
+                    await curs.execute(
+                        self.compact_events_statement,
+                        [originator_ids[0], originator_ids[-1], keep],
+                        prepare=True,
+                    )
+                    deleted += curs.rowcount
+            if len(originator_ids) < batch_size:
+                break
+            last_originator_id = originator_ids[-1]
+        if deleted:
+            async with self.datastore.get_connection() as conn, conn.cursor() as curs:
+                await curs.execute(self.vacuum_table_statement)
+        return deleted
+
+
+class AsyncPostgresApplicationRecorder(
+    AsyncPostgresAggregateRecorder,
+    _PostgresApplicationRecorderBase,
+    AsyncApplicationRecorder,
+):
+    @retry((InterfaceError, OperationalError), max_attempts=10, wait=0.2)
+    async def select_notifications(
+        self,
+        start: int,
+        limit: int,
+        stop: int | None = None,
+        topics: Sequence[str] = (),
+    ) -> List[Notification]:
+        """
+        Returns a list of event notifications
+        from 'start', limited by 'limit'.
+        """
+        statement, params = self._construct_select_notifications_statement(
+            start, limit, stop, topics
+        )
+        async with self.datastore.get_connection() as conn, conn.cursor() as curs:
+            await curs.execute(statement, params, prepare=True)
+            return [
+                Notification(
+                    id=row["notification_id"],
+                    originator_id=row["originator_id"],
+                    originator_version=row["originator_version"],
+                    topic=row["topic"],
+                    state=bytes(row["state"]),
+                )
+                for row in await curs.fetchall()
+            ]
+
+    @retry((InterfaceError, OperationalError), max_attempts=10, wait=0.2)
+    async def max_notification_id(self) -> int:
+        """
+        Returns the maximum notification ID.
+        """
+        async with self.datastore.get_connection() as conn, conn.cursor() as curs:
+            await curs.execute(self.max_notification_id_statement)
+            fetchone = await curs.fetchone()
+            assert fetchone is not None
+            return fetchone["max"] or 0
+
+    async def _lock_table(self, c: AsyncCursor[DictRow]) -> None:
+        # Acquire "EXCLUSIVE" table lock, so that the insert order is
+        # the same as the commit order (see PostgresApplicationRecorder).
+        for lock_statement in self.lock_table_statements:
+            await c.execute(lock_statement, prepare=True)
+
+    async def _fetch_ids_after_insert_events(
+        self, c: AsyncCursor[DictRow], stored_events: List[StoredEvent]
+    ) -> Sequence[int] | None:
+        notification_ids: List[int] = []
+        len_events = len(stored_events)
+        if len_events:
+            if (
+                (c.statusmessage == "SET")
+                and c.nextset()
+                and (c.statusmessage == "LOCK TABLE")
+            ):
+                while c.nextset() and len(notification_ids) != len_events:
+                    row = await c.fetchone()
+                    assert row is not None
+                    notification_ids.append(row["notification_id"])
+            if len(notification_ids) != len(stored_events):
+                msg = "Couldn't get all notification IDs"
+                raise ProgrammingError(msg)
+        return notification_ids
 
 
 class Factory(InfrastructureFactory):
@@ -547,11 +1536,18 @@ class Factory(InfrastructureFactory):
         "POSTGRES_IDLE_IN_TRANSACTION_SESSION_TIMEOUT"
     )
     POSTGRES_SCHEMA = "POSTGRES_SCHEMA"
+    POSTGRES_GAP_TOLERANT = "POSTGRES_GAP_TOLERANT"
+    POSTGRES_GROUP_COMMIT = "POSTGRES_GROUP_COMMIT"
+    POSTGRES_GROUP_COMMIT_WINDOW = "POSTGRES_GROUP_COMMIT_WINDOW"
+    POSTGRES_LISTEN_NOTIFY = "POSTGRES_LISTEN_NOTIFY"
+    POSTGRES_TOPIC_INDEX = "POSTGRES_TOPIC_INDEX"
     CREATE_TABLE = "CREATE_TABLE"
 
     aggregate_recorder_class = PostgresAggregateRecorder
     application_recorder_class = PostgresApplicationRecorder
     process_recorder_class = PostgresProcessRecorder
+    async_aggregate_recorder_class = AsyncPostgresAggregateRecorder
+    async_application_recorder_class = AsyncPostgresApplicationRecorder
 
     def __init__(self, env: Environment):
         super().__init__(env)
@@ -697,23 +1693,50 @@ class Factory(InfrastructureFactory):
 
         schema = self.env.get(self.POSTGRES_SCHEMA) or ""
 
-        self.datastore = PostgresDatastore(
-            dbname=dbname,
-            host=host,
-            port=port,
-            user=user,
-            password=password,
-            connect_timeout=connect_timeout,
-            idle_in_transaction_session_timeout=idle_in_transaction_session_timeout,
-            pool_size=pool_size,
-            max_overflow=pool_max_overflow,
-            pool_timeout=pool_timeout,
-            conn_max_age=conn_max_age,
-            pre_ping=pre_ping,
-            lock_timeout=lock_timeout,
-            schema=schema,
+        self.gap_tolerant = strtobool(self.env.get(self.POSTGRES_GAP_TOLERANT) or "no")
+
+        self.group_commit = strtobool(self.env.get(self.POSTGRES_GROUP_COMMIT) or "no")
+
+        self.listen_notify = strtobool(
+            self.env.get(self.POSTGRES_LISTEN_NOTIFY) or "no"
         )
 
+        self.topic_index = strtobool(self.env.get(self.POSTGRES_TOPIC_INDEX) or "no")
+
+        self.group_commit_window = 0.0
+        group_commit_window_str = self.env.get(self.POSTGRES_GROUP_COMMIT_WINDOW)
+        if group_commit_window_str:
+            try:
+                self.group_commit_window = float(group_commit_window_str)
+            except ValueError:
+                msg = (
+                    "Postgres environment value for key "
+                    f"'{self.POSTGRES_GROUP_COMMIT_WINDOW}' is invalid. "
+                    "If set, a float or empty string is expected: "
+                    f"'{group_commit_window_str}'"
+                )
+                raise OSError(msg) from None
+
+        self.datastore_kwargs: Dict[str, Any] = {
+            "dbname": dbname,
+            "host": host,
+            "port": port,
+            "user": user,
+            "password": password,
+            "connect_timeout": connect_timeout,
+            "idle_in_transaction_session_timeout": idle_in_transaction_session_timeout,
+            "pool_size": pool_size,
+            "max_overflow": pool_max_overflow,
+            "pool_timeout": pool_timeout,
+            "conn_max_age": conn_max_age,
+            "pre_ping": pre_ping,
+            "lock_timeout": lock_timeout,
+            "schema": schema,
+        }
+        self.datastore = PostgresDatastore(**self.datastore_kwargs)
+        self._async_datastore: AsyncPostgresDatastore | None = None
+        self._async_recorders_to_create: List[AsyncPostgresAggregateRecorder] = []
+
     def aggregate_recorder(self, purpose: str = "events") -> AggregateRecorder:
         prefix = self.env.name.lower() or "stored"
         events_table_name = prefix + "_" + purpose
@@ -735,6 +1758,13 @@ class Factory(InfrastructureFactory):
         recorder = type(self).application_recorder_class(
             datastore=self.datastore,
             events_table_name=events_table_name,
+            **self._recorder_kwargs(
+                "gap_tolerant",
+                "group_commit",
+                "group_commit_window",
+                "listen_notify",
+                "topic_index",
+            ),
         )
         if self.env_create_table():
             recorder.create_table()
@@ -752,11 +1782,62 @@ class Factory(InfrastructureFactory):
             datastore=self.datastore,
             events_table_name=events_table_name,
             tracking_table_name=tracking_table_name,
+            **self._recorder_kwargs("gap_tolerant", "listen_notify", "topic_index"),
         )
         if self.env_create_table():
             recorder.create_table()
         return recorder
 
+    def _recorder_kwargs(self, *names: str) -> Dict[str, Any]:
+        # Only pass the named options that are set, so that recorder
+        # classes that don't have all the options can still be configured.
+        return {name: getattr(self, name) for name in names if getattr(self, name)}
+
+    @property
+    def async_datastore(self) -> AsyncPostgresDatastore:
+        """
+        Datastore for async recorders, constructed when first used.
+        """
+        if self._async_datastore is None:
+            self._async_datastore = AsyncPostgresDatastore(**self.datastore_kwargs)
+        return self._async_datastore
+
+    def async_aggregate_recorder(
+        self, purpose: str = "events"
+    ) -> AsyncAggregateRecorder:
+        prefix = self.env.name.lower() or "stored"
+        events_table_name = prefix + "_" + purpose
+        if self.async_datastore.schema:
+            events_table_name = f"{self.async_datastore.schema}.{events_table_name}"
+        recorder = type(self).async_aggregate_recorder_class(
+            datastore=self.async_datastore,
+            events_table_name=events_table_name,
+        )
+        if self.env_create_table():
+            self._async_recorders_to_create.append(recorder)
+        return recorder
+
+    def async_application_recorder(self) -> AsyncApplicationRecorder:
+        prefix = self.env.name.lower() or "stored"
+        events_table_name = prefix + "_events"
+        if self.async_datastore.schema:
+            events_table_name = f"{self.async_datastore.schema}.{events_table_name}"
+        recorder = type(self).async_application_recorder_class(
+            datastore=self.async_datastore,
+            events_table_name=events_table_name,
+        )
+        if self.env_create_table():
+            self._async_recorders_to_create.append(recorder)
+        return recorder
+
+    async def async_open(self) -> None:
+        while self._async_recorders_to_create:
+            await self._async_recorders_to_create.pop(0).create_table()
+
+    async def async_close(self) -> None:
+        if self._async_datastore is not None:
+            await self._async_datastore.close()
+
     def env_create_table(self) -> bool:
         return strtobool(self.env.get(self.CREATE_TABLE) or "yes")
 
@@ -1,13 +1,33 @@
 from __future__ import annotations
 
+import asyncio
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, Iterator, List, Sequence, Type
+from functools import partial
+from time import monotonic
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
 from uuid import UUID
+from weakref import WeakSet
 
 from eventsourcing.persistence import (
+    DEFAULT_PAGE_SIZE,
     AggregateRecorder,
     ApplicationRecorder,
+    AsyncAggregateRecorder,
+    AsyncApplicationRecorder,
     Connection,
     ConnectionPool,
     Cursor,
@@ -24,6 +44,7 @@ from eventsourcing.persistence import (
     ProcessRecorder,
     ProgrammingError,
     StoredEvent,
+    Subscription,
     Tracking,
 )
 from eventsourcing.utils import Environment, strtobool
@@ -33,6 +54,12 @@ if TYPE_CHECKING:  # pragma: nocover
 
 SQLITE3_DEFAULT_LOCK_TIMEOUT = 5
 
+# Two variables per originator ID, plus one for the limit, must not exceed
+# the limit of 999 variables in a statement of SQLite before version 3.32.
+SQLITE3_MAX_SELECT_MANY_IDS = 400
+
+T = TypeVar("T")
+
 
 class SQLiteCursor(Cursor):
     def __init__(self, sqlite_cursor: sqlite3.Cursor):
@@ -56,10 +83,17 @@ class SQLiteCursor(Cursor):
     def fetchone(self) -> Any:
         return self.sqlite_cursor.fetchone()
 
+    def fetchmany(self, size: int) -> Any:
+        return self.sqlite_cursor.fetchmany(size)
+
     @property
     def lastrowid(self) -> Any:
         return self.sqlite_cursor.lastrowid
 
+    @property
+    def rowcount(self) -> int:
+        return self.sqlite_cursor.rowcount
+
 
 class SQLiteConnection(Connection[SQLiteCursor]):
     def __init__(self, sqlite_conn: sqlite3.Connection, max_age: float | None):
@@ -242,6 +276,32 @@ class SQLiteDatastore:
         self.close()
 
 
+class AsyncSQLiteDatastore:
+    """
+    Adapts a :class:`SQLiteDatastore` for use with asyncio, in the manner
+    of aiosqlite: calls are made in a thread that is dedicated to this
+    datastore, and awaited by the event loop.
+    """
+
+    def __init__(self, datastore: SQLiteDatastore):
+        self.datastore = datastore
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="AsyncSQLiteDatastore"
+        )
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Calls given function with given args in the datastore's thread.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
+    async def close(self) -> None:
+        # Wait for the datastore's thread without blocking the event loop.
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.executor.shutdown)
+
+
 class SQLiteAggregateRecorder(AggregateRecorder):
     def __init__(
         self,
@@ -258,6 +318,23 @@ class SQLiteAggregateRecorder(AggregateRecorder):
         self.select_events_statement = (
             f"SELECT * FROM {self.events_table_name} WHERE originator_id=? "
         )
+        self.delete_events_statement = (
+            f"DELETE FROM {self.events_table_name} WHERE originator_id=? "
+        )
+        self.select_originator_ids_statement = (
+            f"SELECT DISTINCT originator_id FROM {self.events_table_name} "
+            "WHERE originator_id>? ORDER BY originator_id LIMIT ?"
+        )
+        self.compact_events_statement = (
+            f"DELETE FROM {self.events_table_name} "
+            "WHERE (originator_id, originator_version) IN ("
+            "SELECT originator_id, originator_version FROM ("
+            "SELECT originator_id, originator_version, "
+            "ROW_NUMBER() OVER (PARTITION BY originator_id "
+            "ORDER BY originator_version DESC) AS row_num "
+            f"FROM {self.events_table_name} "
+            "WHERE originator_id>=? AND originator_id<=?) WHERE row_num>?)"
+        )
 
     def construct_create_table_statements(self) -> List[str]:
         statement = (
@@ -311,6 +388,110 @@ class SQLiteAggregateRecorder(AggregateRecorder):
         desc: bool = False,
         limit: int | None = None,
     ) -> List[StoredEvent]:
+        statement, params = self._construct_select_events_statement(
+            originator_id, gt=gt, lte=lte, desc=desc, limit=limit
+        )
+        with self.datastore.transaction(commit=False) as c:
+            c.execute(statement, params)
+            return [
+                StoredEvent(
+                    originator_id=UUID(row["originator_id"]),
+                    originator_version=row["originator_version"],
+                    topic=row["topic"],
+                    state=row["state"],
+                )
+                for row in c.fetchall()
+            ]
+
+    def select_events_many(
+        self,
+        originator_ids: Sequence[UUID],
+        *,
+        gt_versions: Mapping[UUID, int] | None = None,
+        desc: bool = False,
+        limit: int | None = None,
+    ) -> Dict[UUID, List[StoredEvent]]:
+        results: Dict[UUID, List[StoredEvent]] = {
+            originator_id: [] for originator_id in originator_ids
+        }
+        if not results:
+            return results
+        originator_ids = list(results)
+        with self.datastore.transaction(commit=False) as c:
+            # Select in batches, so as not to exceed SQLite's
+            # limit on the number of variables in a statement.
+            for i in range(0, len(originator_ids), SQLITE3_MAX_SELECT_MANY_IDS):
+                batch = originator_ids[i : i + SQLITE3_MAX_SELECT_MANY_IDS]
+                statement, params = self._construct_select_events_many_statement(
+                    batch, gt_versions=gt_versions, desc=desc, limit=limit
+                )
+                c.execute(statement, params)
+                for row in c.fetchall():
+                    originator_id = UUID(row["originator_id"])
+                    results[originator_id].append(
+                        StoredEvent(
+                            originator_id=originator_id,
+                            originator_version=row["originator_version"],
+                            topic=row["topic"],
+                            state=row["state"],
+                        )
+                    )
+        return results
+
+    def _construct_select_events_many_statement(
+        self,
+        originator_ids: Sequence[UUID],
+        *,
+        gt_versions: Mapping[UUID, int] | None,
+        desc: bool,
+        limit: int | None,
+    ) -> Tuple[str, List[Any]]:
+        order = "DESC" if desc else "ASC"
+        params: List[Any]
+        if gt_versions is None:
+            statement = (
+                "SELECT originator_id, originator_version, topic, state "
+                f"FROM {self.events_table_name} "
+                f"WHERE originator_id IN ({','.join('?' * len(originator_ids))})"
+            )
+            params = [originator_id.hex for originator_id in originator_ids]
+        else:
+            # Join with the given versions, so the "greater
+            # than" version is applied to each originator.
+            statement = (
+                "WITH v(id, gt) AS (VALUES "
+                f"{','.join(['(?,?)'] * len(originator_ids))}) "
+                "SELECT e.originator_id, e.originator_version, e.topic, e.state "
+                f"FROM {self.events_table_name} AS e JOIN v "
+                "ON e.originator_id=v.id "
+                "AND (v.gt IS NULL OR e.originator_version>v.gt)"
+            )
+            params = []
+            for originator_id in originator_ids:
+                params.append(originator_id.hex)
+                params.append(gt_versions.get(originator_id))
+        if limit is not None:
+            # Number the events of each originator, so the limit
+            # can be applied to each originator.
+            statement = (
+                "SELECT originator_id, originator_version, topic, state FROM ("
+                "SELECT *, ROW_NUMBER() OVER (PARTITION BY originator_id "
+                f"ORDER BY originator_version {order}) AS row_num "
+                f"FROM ({statement})) WHERE row_num<=?"
+            )
+            params.append(limit)
+        statement += f" ORDER BY originator_id, originator_version {order}"
+        return statement, params
+
+    def _construct_select_events_statement(
+        self,
+        originator_id: UUID,
+        *,
+        gt: int | None,
+        lte: int | None,
+        desc: bool,
+        limit: int | None,
+    ) -> Tuple[str, List[Any]]:
         statement = self.select_events_statement
         params: List[Any] = [originator_id.hex]
         if gt is not None:
@@ -327,17 +508,60 @@ class SQLiteAggregateRecorder(AggregateRecorder):
         if limit is not None:
             statement += "LIMIT ? "
             params.append(limit)
-        with self.datastore.transaction(commit=False) as c:
+        return statement, params
+
+    def delete_events(
+        self,
+        originator_id: UUID,
+        *,
+        gt: int | None = None,
+        lt: int | None = None,
+        keep: int = 0,
+    ) -> None:
+        statement = self.delete_events_statement
+        params: List[Any] = [originator_id.hex]
+        if gt is not None:
+            statement += "AND originator_version>? "
+            params.append(gt)
+        if lt is not None:
+            statement += "AND originator_version<? "
+            params.append(lt)
+        if keep > 0:
+            statement += (
+                "AND originator_version NOT IN ("
+                f"SELECT originator_version FROM {self.events_table_name} "
+                "WHERE originator_id=? ORDER BY originator_version DESC LIMIT ?)"
+            )
+            params += [originator_id.hex, keep]
+        with self.datastore.transaction(commit=True) as c:
             c.execute(statement, params)
-            return [
-                StoredEvent(
-                    originator_id=UUID(row["originator_id"]),
-                    originator_version=row["originator_version"],
-                    topic=row["topic"],
-                    state=row["state"],
+
+    def compact_events(self, *, keep: int, batch_size: int = 1000) -> int:
+        """
+        Deletes old stored events in batches, each in its own transaction,
+        so that other writers are not blocked for long. The aggregates of
+        each batch are selected after the last aggregate of the previous
+        batch, so that only the stored events of a batch are read.
+        """
+        deleted = 0
+        last_originator_id = ""
+        while True:
+            with self.datastore.transaction(commit=True) as c:
+                c.execute(
+                    self.select_originator_ids_statement,
+                    [last_originator_id, batch_size],
                 )
-                for row in c.fetchall()
-            ]
+                originator_ids = [row["originator_id"] for row in c.fetchall()]
+                if not originator_ids:
+                    return deleted
+                c.execute(
+                    self.compact_events_statement,
+                    [originator_ids[0], originator_ids[-1], keep],
+                )
+                deleted += c.rowcount
+            if len(originator_ids) < batch_size:
+                return deleted
+            last_originator_id = originator_ids[-1]
 
 
 class SQLiteApplicationRecorder(
@@ -348,11 +572,21 @@ class SQLiteApplicationRecorder(
         self,
         datastore: SQLiteDatastore,
         events_table_name: str = "stored_events",
+        *,
+        topic_index: bool = False,
     ):
+        """
+        If 'topic_index' is True, the stored events table is indexed by topic,
+        so that selecting notifications with topics reads only the stored events
+        that have those topics, rather than every stored event in the range.
+        """
+        self.topic_index = topic_index
+        self.topic_index_name = f"{events_table_name}_topic_idx"
         super().__init__(datastore, events_table_name)
         self.select_max_notification_id_statement = (
             f"SELECT MAX(rowid) FROM {self.events_table_name}"
         )
+        self._subscriptions: WeakSet[Subscription] = WeakSet()
 
     def construct_create_table_statements(self) -> List[str]:
         statement = (
@@ -365,7 +599,15 @@ class SQLiteApplicationRecorder(
             "PRIMARY KEY "
             "(originator_id, originator_version))"
         )
-        return [statement]
+        statements = [statement]
+        if self.topic_index:
+            # Entries of indexes on rowid tables are ordered by rowid after the
+            # indexed columns, so this is effectively an index on (topic, rowid).
+            statements.append(
+                f"CREATE INDEX IF NOT EXISTS {self.topic_index_name} "
+                f"ON {self.events_table_name} (topic)"
+            )
+        return statements
 
     def _insert_events(
         self,
@@ -398,20 +640,9 @@ class SQLiteApplicationRecorder(
         Returns a list of event notifications
         from 'start', limited by 'limit'.
         """
-        params: List[int | str] = [start]
-        statement = f"SELECT rowid, * FROM {self.events_table_name} WHERE rowid>=? "
-
-        if stop is not None:
-            params.append(stop)
-            statement += "AND rowid<=? "
-
-        if topics:
-            params += list(topics)
-            statement += "AND topic IN (%s) " % ",".join("?" * len(topics))
-
-        params.append(limit)
-        statement += "ORDER BY rowid LIMIT ?"
-
+        statement, params = self._construct_select_notifications_statement(
+            start, limit, stop, topics
+        )
         with self.datastore.transaction(commit=False) as c:
             c.execute(statement, params)
             return [
@@ -425,6 +656,56 @@ class SQLiteApplicationRecorder(
                 for row in c.fetchall()
             ]
 
+    def _construct_select_notifications_statement(
+        self,
+        start: int,
+        limit: int,
+        stop: int | None,
+        topics: Sequence[str],
+    ) -> Tuple[str, List[int | str]]:
+        if topics and self.topic_index:
+            # Select from the topic index once for each topic, so that no more
+            # than 'limit' stored events are read for each topic, and then
+            # merge the results in the order of their notification IDs.
+            params: List[int | str] = []
+            statements = []
+            for topic in dict.fromkeys(topics):
+                statement, topic_params = self._construct_select_notifications_range(
+                    start, limit, stop, "topic=? "
+                )
+                statements.append(f"SELECT * FROM ({statement})")
+                params += [topic, *topic_params]
+            params.append(limit)
+            statement = " UNION ALL ".join(statements) + " ORDER BY rowid LIMIT ?"
+            return statement, params
+
+        condition = ""
+        params = []
+        if topics:
+            condition = "topic IN (%s) " % ",".join("?" * len(topics))
+            params += list(topics)
+        statement, range_params = self._construct_select_notifications_range(
+            start, limit, stop, condition
+        )
+        return statement, params + range_params
+
+    def _construct_select_notifications_range(
+        self, start: int, limit: int, stop: int | None, condition: str
+    ) -> Tuple[str, List[int | str]]:
+        params: List[int | str] = [start]
+        statement = f"SELECT rowid, * FROM {self.events_table_name} WHERE "
+        if condition:
+            statement += f"{condition}AND "
+        statement += "rowid>=? "
+
+        if stop is not None:
+            params.append(stop)
+            statement += "AND rowid<=? "
+
+        params.append(limit)
+        statement += "ORDER BY rowid LIMIT ?"
+        return statement, params
+
     def max_notification_id(self) -> int:
         """
         Returns the maximum notification ID.
@@ -432,11 +713,104 @@ class SQLiteApplicationRecorder(
         with self.datastore.transaction(commit=False) as c:
             return self._max_notification_id(c)
 
+    def insert_events(
+        self, stored_events: List[StoredEvent], **kwargs: Any
+    ) -> Sequence[int] | None:
+        notification_ids = super().insert_events(stored_events, **kwargs)
+        if stored_events:
+            for subscription in list(self._subscriptions):
+                subscription.wake()
+        return notification_ids
+
+    def subscribe(
+        self, gt: int | None = None, topics: Sequence[str] = ()
+    ) -> Subscription:
+        """
+        Returns an :class:`SQLiteSubscription`, which is woken when events
+        are inserted by this recorder, and also when events are committed
+        to a file-based database by other connections, including connections
+        in other processes.
+        """
+        subscription = SQLiteSubscription(self, gt=gt, topics=topics)
+        self._subscriptions.add(subscription)
+        return subscription
+
     def _max_notification_id(self, c: SQLiteCursor) -> int:
         c.execute(self.select_max_notification_id_statement)
         return c.fetchone()[0] or 0
 
 
+class SQLiteSubscription(Subscription):
+    """
+    Subscription to the event notifications of an SQLite application recorder.
+
+    As well as being woken by its recorder, if the database is file-based, the
+    subscription checks every :attr:`data_version_interval` seconds whether
+    changes have been committed by other connections, using "PRAGMA data_version",
+    which is much cheaper than selecting notifications.
+    """
+
+    data_version_interval = 0.005
+
+    def __init__(
+        self,
+        recorder: SQLiteApplicationRecorder,
+        gt: int | None = None,
+        topics: Sequence[str] = (),
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ):
+        super().__init__(recorder, gt=gt, topics=topics, page_size=page_size)
+        self._connection: sqlite3.Connection | None = None
+        self._data_version: int | None = None
+        pool = recorder.datastore.pool
+        if not pool.is_sqlite_memory_mode:
+            try:
+                self._connection = sqlite3.connect(
+                    database=pool.db_name,
+                    uri=True,
+                    check_same_thread=False,
+                    isolation_level=None,
+                )
+            except (sqlite3.Error, TypeError) as e:
+                raise InterfaceError(e) from e
+            self._data_version = self._select_data_version()
+
+    def wait(self, timeout: float) -> None:
+        if self._connection is None:
+            super().wait(timeout)
+            return
+        deadline = monotonic() + timeout
+        while not self._has_been_woken.wait(
+            max(0.0, min(self.data_version_interval, deadline - monotonic()))
+        ):
+            data_version = self._select_data_version()
+            if data_version != self._data_version:
+                self._data_version = data_version
+                return
+            if monotonic() >= deadline:
+                return
+
+    def _select_data_version(self) -> int:
+        assert self._connection is not None
+        try:
+            return self._connection.execute("PRAGMA data_version").fetchone()[0]
+        except sqlite3.Error as e:
+            raise OperationalError(e) from e
+
+    def __next__(self) -> Notification:
+        try:
+            return super().__next__()
+        except StopIteration:
+            # Close in the iterating thread, which might be using the connection.
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
 class SQLiteProcessRecorder(
     SQLiteApplicationRecorder,
     ProcessRecorder,
@@ -445,8 +819,10 @@ class SQLiteProcessRecorder(
         self,
         datastore: SQLiteDatastore,
         events_table_name: str = "stored_events",
+        *,
+        topic_index: bool = False,
     ):
-        super().__init__(datastore, events_table_name)
+        super().__init__(datastore, events_table_name, topic_index=topic_index)
         self.insert_tracking_statement = "INSERT INTO tracking VALUES (?,?)"
         self.select_max_tracking_id_statement = (
             "SELECT MAX(notification_id) FROM tracking WHERE application_name=?"
@@ -499,14 +875,102 @@ class SQLiteProcessRecorder(
         return returning
 
 
+class AsyncSQLiteAggregateRecorder(AsyncAggregateRecorder):
+    """
+    Records stored events in SQLite with asyncio, by making
+    calls on a :class:`SQLiteAggregateRecorder` in the thread
+    of an :class:`AsyncSQLiteDatastore`.
+    """
+
+    recorder_class: Type[SQLiteAggregateRecorder] = SQLiteAggregateRecorder
+
+    def __init__(
+        self,
+        datastore: AsyncSQLiteDatastore,
+        events_table_name: str = "stored_events",
+    ):
+        self.datastore = datastore
+        self.recorder = self.recorder_class(datastore.datastore, events_table_name)
+
+    async def create_table(self) -> None:
+        await self.datastore.run(self.recorder.create_table)
+
+    async def insert_events(
+        self, stored_events: List[StoredEvent], **kwargs: Any
+    ) -> Sequence[int] | None:
+        return await self.datastore.run(
+            self.recorder.insert_events, stored_events, **kwargs
+        )
+
+    async def select_events(
+        self,
+        originator_id: UUID,
+        *,
+        gt: int | None = None,
+        lte: int | None = None,
+        desc: bool = False,
+        limit: int | None = None,
+    ) -> List[StoredEvent]:
+        return await self.datastore.run(
+            self.recorder.select_events,
+            originator_id,
+            gt=gt,
+            lte=lte,
+            desc=desc,
+            limit=limit,
+        )
+
+    async def delete_events(
+        self,
+        originator_id: UUID,
+        *,
+        gt: int | None = None,
+        lt: int | None = None,
+        keep: int = 0,
+    ) -> None:
+        await self.datastore.run(
+            self.recorder.delete_events, originator_id, gt=gt, lt=lt, keep=keep
+        )
+
+    async def compact_events(self, *, keep: int, batch_size: int = 1000) -> int:
+        return await self.datastore.run(
+            self.recorder.compact_events, keep=keep, batch_size=batch_size
+        )
+
+
+class AsyncSQLiteApplicationRecorder(
+    AsyncSQLiteAggregateRecorder,
+    AsyncApplicationRecorder,
+):
+    recorder_class: Type[SQLiteApplicationRecorder] = SQLiteApplicationRecorder
+    recorder: SQLiteApplicationRecorder
+
+    async def select_notifications(
+        self,
+        start: int,
+        limit: int,
+        stop: int | None = None,
+        topics: Sequence[str] = (),
+    ) -> List[Notification]:
+        return await self.datastore.run(
+            self.recorder.select_notifications, start, limit, stop=stop, topics=topics
+        )
+
+    async def max_notification_id(self) -> int:
+        return await self.datastore.run(self.recorder.max_notification_id)
+
+
 class Factory(InfrastructureFactory):
     SQLITE_DBNAME = "SQLITE_DBNAME"
     SQLITE_LOCK_TIMEOUT = "SQLITE_LOCK_TIMEOUT"
+    SQLITE_TOPIC_INDEX = "SQLITE_TOPIC_INDEX"
     CREATE_TABLE = "CREATE_TABLE"
 
     aggregate_recorder_class = SQLiteAggregateRecorder
     application_recorder_class = SQLiteApplicationRecorder
     process_recorder_class = SQLiteProcessRecorder
+    async_aggregate_recorder_class = AsyncSQLiteAggregateRecorder
+    async_application_recorder_class = AsyncSQLiteApplicationRecorder
 
     def __init__(self, env: Environment):
         super().__init__(env)
@@ -536,7 +1000,11 @@ class Factory(InfrastructureFactory):
                 )
                 raise OSError(msg) from None
 
+        self.topic_index = strtobool(self.env.get(self.SQLITE_TOPIC_INDEX) or "no")
+
         self.datastore = SQLiteDatastore(db_name=db_name, lock_timeout=lock_timeout)
+        self._async_datastore: AsyncSQLiteDatastore | None = None
+        self._async_recorders_to_create: List[AsyncSQLiteAggregateRecorder] = []
 
     def aggregate_recorder(self, purpose: str = "events") -> AggregateRecorder:
         events_table_name = "stored_" + purpose
@@ -549,17 +1017,61 @@ class Factory(InfrastructureFactory):
         return recorder
 
     def application_recorder(self) -> ApplicationRecorder:
-        recorder = self.application_recorder_class(datastore=self.datastore)
+        kwargs: Dict[str, Any] = {}
+        if self.topic_index:
+            kwargs["topic_index"] = True
+        recorder = self.application_recorder_class(datastore=self.datastore, **kwargs)
         if self.env_create_table():
             recorder.create_table()
         return recorder
 
     def process_recorder(self) -> ProcessRecorder:
-        recorder = self.process_recorder_class(datastore=self.datastore)
+        kwargs: Dict[str, Any] = {}
+        if self.topic_index:
+            kwargs["topic_index"] = True
+        recorder = self.process_recorder_class(datastore=self.datastore, **kwargs)
         if self.env_create_table():
             recorder.create_table()
         return recorder
 
+    @property
+    def async_datastore(self) -> AsyncSQLiteDatastore:
+        """
+        Datastore for async recorders, constructed when first used.
+        """
+        if self._async_datastore is None:
+            self._async_datastore = AsyncSQLiteDatastore(self.datastore)
+        return self._async_datastore
+
+    def async_aggregate_recorder(
+        self, purpose: str = "events"
+    ) -> AsyncAggregateRecorder:
+        events_table_name = "stored_" + purpose
+        recorder = self.async_aggregate_recorder_class(
+            datastore=self.async_datastore,
+            events_table_name=events_table_name,
+        )
+        if self.env_create_table():
+            self._async_recorders_to_create.append(recorder)
+        return recorder
+
+    def async_application_recorder(self) -> AsyncApplicationRecorder:
+        recorder = self.async_application_recorder_class(datastore=self.async_datastore)
+        if self.env_create_table():
+            self._async_recorders_to_create.append(recorder)
+        return recorder
+
+    def is_shared_between_processes(self) -> bool:
+        return not self.datastore.pool.is_sqlite_memory_mode
+
+    async def async_open(self) -> None:
+        while self._async_recorders_to_create:
+            await self._async_recorders_to_create.pop(0).create_table()
+
+    async def async_close(self) -> None:
+        if self._async_datastore is not None:
+            await self._async_datastore.close()
+
     def env_create_table(self) -> bool:
         default = "yes"
         return bool(strtobool(self.env.get(self.CREATE_TABLE, default) or default))
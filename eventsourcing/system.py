@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 import inspect
+import multiprocessing
 import traceback
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from queue import Full, Queue
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import suppress
+from copy import copy
+from itertools import groupby
+from queue import Empty, Full, Queue
 from threading import Event, Lock, RLock, Thread
+from time import monotonic
 from types import FrameType, ModuleType
 from typing import (
+    TYPE_CHECKING,
     ClassVar,
     Dict,
     Iterable,
@@ -15,6 +22,7 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     Union,
@@ -23,6 +31,7 @@ from typing import (
 
 from eventsourcing.application import (
     Application,
+    LocalNotificationLog,
     NotificationLog,
     ProcessingEvent,
     RecordingEvent,
@@ -35,10 +44,16 @@ from eventsourcing.persistence import (
     Mapper,
     Notification,
     ProcessRecorder,
+    ProgrammingError,
     Recording,
     Tracking,
 )
-from eventsourcing.utils import EnvType, get_topic, resolve_topic
+from eventsourcing.utils import EnvType, get_topic, resolve_topic, strtobool
+
+if TYPE_CHECKING:  # pragma: nocover
+    from multiprocessing.context import DefaultContext
+    from multiprocessing.process import BaseProcess
+    from multiprocessing.synchronize import Event as EventType
 
 ProcessingJob = Tuple[DomainEventProtocol, Tracking]
 ConvertingJob = Optional[Union[RecordingEvent, List[Notification]]]
@@ -50,10 +65,53 @@ class Follower(Application):
     by using a process recorder as its application recorder, by keeping
     track of the applications it is following, and pulling and processing
     new domain event notifications through its :func:`policy` method.
+
+    If :attr:`processing_partitions` is greater than one, the domain events
+    are divided into that number of partitions by their originator IDs, and
+    the partitions are processed concurrently in separate threads. The domain
+    events of each aggregate are always processed in order, in the same
+    partition, and the position of each partition is tracked separately, so
+    the policy must be safe to call concurrently for different aggregates.
+    After each batch has been processed by all the partitions, the position
+    of the batch is also tracked with the leader's name, so that partitions
+    which had nothing to process don't hold back the tracking position. The
+    number of partitions used for a leader is also recorded, and can't be
+    changed after the leader's notifications have been processed in partitions.
+
+    If :attr:`is_batch_processing_enabled` is true, the domain events of each
+    pulled batch of notifications are processed with one processing event, so
+    that the new domain events and only the tracking object of the last domain
+    event are recorded in one transaction. The policy will then see the state
+    of aggregates as it was before the batch was processed.
+
+    If :attr:`pull_section_size_max` is set, the number of notifications
+    pulled in each batch is adapted between :attr:`pull_section_size_min`
+    and :attr:`pull_section_size_max`, starting from :attr:`pull_section_size`
+    (see :class:`NotificationLogReader`).
+
+    If :attr:`pull_prefetch_sections` is greater than zero, up to that number
+    of batches of notifications are pulled in a background thread whilst the
+    previous batches are being processed (see
+    :class:`PrefetchingNotificationLogReader`).
     """
 
     follow_topics: ClassVar[Sequence[str]] = []
     pull_section_size = 10
+    pull_section_size_min = 1
+    pull_section_size_max: int | None = None
+    pull_section_max_duration = 1.0
+    pull_section_max_bytes: int | None = None
+    pull_prefetch_sections = 0
+    processing_partitions = 1
+    is_batch_processing_enabled = False
+
+    PULL_SECTION_SIZE_MIN = "PULL_SECTION_SIZE_MIN"
+    PULL_SECTION_SIZE_MAX = "PULL_SECTION_SIZE_MAX"
+    PULL_SECTION_MAX_DURATION = "PULL_SECTION_MAX_DURATION"
+    PULL_SECTION_MAX_BYTES = "PULL_SECTION_MAX_BYTES"
+    PULL_PREFETCH_SECTIONS = "PULL_PREFETCH_SECTIONS"
+    PROCESSING_PARTITIONS = "PROCESSING_PARTITIONS"
+    IS_BATCH_PROCESSING_ENABLED = "IS_BATCH_PROCESSING_ENABLED"
 
     def __init__(self, env: EnvType | None = None) -> None:
         super().__init__(env)
@@ -62,6 +120,38 @@ class Follower(Application):
         self.recorder: ProcessRecorder
         self.is_threading_enabled = False
         self.processing_lock = RLock()
+        partitions_envvar = self.env.get(self.PROCESSING_PARTITIONS)
+        if partitions_envvar:
+            self.processing_partitions = int(partitions_envvar)
+        if self.processing_partitions < 1:
+            msg = f"Processing partitions must be at least 1: {partitions_envvar}"
+            raise ValueError(msg)
+        self.partition_locks = [RLock() for _ in range(self.processing_partitions)]
+        self._checked_partitions: Set[str] = set()
+        self.partition_executor: ThreadPoolExecutor | None = None
+        if self.processing_partitions > 1:
+            self.partition_executor = ThreadPoolExecutor(
+                max_workers=self.processing_partitions,
+                thread_name_prefix=f"{self.name}-partition",
+            )
+        batch_processing_envvar = self.env.get(self.IS_BATCH_PROCESSING_ENABLED)
+        if batch_processing_envvar:
+            self.is_batch_processing_enabled = strtobool(batch_processing_envvar)
+        section_size_min_envvar = self.env.get(self.PULL_SECTION_SIZE_MIN)
+        if section_size_min_envvar:
+            self.pull_section_size_min = int(section_size_min_envvar)
+        section_size_max_envvar = self.env.get(self.PULL_SECTION_SIZE_MAX)
+        if section_size_max_envvar:
+            self.pull_section_size_max = int(section_size_max_envvar)
+        max_duration_envvar = self.env.get(self.PULL_SECTION_MAX_DURATION)
+        if max_duration_envvar:
+            self.pull_section_max_duration = float(max_duration_envvar)
+        max_bytes_envvar = self.env.get(self.PULL_SECTION_MAX_BYTES)
+        if max_bytes_envvar:
+            self.pull_section_max_bytes = int(max_bytes_envvar)
+        prefetch_sections_envvar = self.env.get(self.PULL_PREFETCH_SECTIONS)
+        if prefetch_sections_envvar:
+            self.pull_prefetch_sections = int(prefetch_sections_envvar)
 
     def construct_recorder(self) -> ProcessRecorder:
         """
@@ -77,7 +167,36 @@ class Follower(Application):
         of readers and mappers.
         """
         assert isinstance(self.recorder, ProcessRecorder)
-        reader = NotificationLogReader(log, section_size=self.pull_section_size)
+        max_section_size = self.pull_section_size_max
+        if (
+            max_section_size is not None
+            and isinstance(log, LocalNotificationLog)
+            and log.section_size < max_section_size
+        ):
+            # Widen the section size of a copy of the leader's log, so that its
+            # type is kept, and the leader's log is not changed.
+            log = copy(log)
+            log.section_size = max_section_size
+        reader: NotificationLogReader
+        if self.pull_prefetch_sections > 0:
+            reader = PrefetchingNotificationLogReader(
+                log,
+                section_size=self.pull_section_size,
+                prefetch_sections=self.pull_prefetch_sections,
+                min_section_size=self.pull_section_size_min,
+                max_section_size=max_section_size,
+                max_duration=self.pull_section_max_duration,
+                max_bytes=self.pull_section_max_bytes,
+            )
+        else:
+            reader = NotificationLogReader(
+                log,
+                section_size=self.pull_section_size,
+                min_section_size=self.pull_section_size_min,
+                max_section_size=max_section_size,
+                max_duration=self.pull_section_max_duration,
+                max_bytes=self.pull_section_max_bytes,
+            )
         env = self.construct_env(name, self.env)
         factory = self.construct_factory(env)
         mapper = factory.mapper(
@@ -94,15 +213,75 @@ class Follower(Application):
         Pull and process new domain event notifications.
         """
         if start is None:
-            start = self.recorder.max_tracking_id(leader_name) + 1
+            start = self.tracking_position(leader_name) + 1
         for notifications in self.pull_notifications(
             leader_name, start=start, stop=stop
         ):
             notifications_iter = self.filter_received_notifications(notifications)
-            for domain_event, tracking in self.convert_notifications(
-                leader_name, notifications_iter
-            ):
-                self.process_event(domain_event, tracking)
+            self.process_events(
+                self.convert_notifications(leader_name, notifications_iter)
+            )
+
+    def tracking_position(self, leader_name: str) -> int:
+        """
+        Returns the ID of the last notification from the named application
+        before which all notifications have been processed. When processing
+        is partitioned, this is the position that was tracked after the last
+        batch was processed by all the partitions, unless the lowest of the
+        positions of the partitions is greater.
+        """
+        self._check_partitions(leader_name)
+        position = self.recorder.max_tracking_id(leader_name)
+        if self.processing_partitions == 1:
+            return position
+        return max(
+            position,
+            min(
+                self.recorder.max_tracking_id(self.partition_name(leader_name, p))
+                for p in range(self.processing_partitions)
+            ),
+        )
+
+    def _check_partitions(self, leader_name: str) -> None:
+        # The partition of a domain event depends on the number of partitions,
+        # so the tracking records of one number of partitions can't be used to
+        # resume processing with another. Processing that wasn't partitioned
+        # can be resumed in partitions, since its position is exact.
+        if leader_name in self._checked_partitions:
+            return
+        name = f"{leader_name}#partitions"
+        recorded = self.recorder.max_tracking_id(name)
+        if recorded == 0 and self.processing_partitions > 1:
+            with suppress(IntegrityError):
+                self._record(
+                    ProcessingEvent(
+                        tracking=Tracking(
+                            application_name=name,
+                            notification_id=self.processing_partitions,
+                        )
+                    )
+                )
+        elif recorded not in (0, self.processing_partitions):
+            msg = (
+                f"Notifications from {leader_name} have been processed in "
+                f"{recorded} partitions, so can't be processed in "
+                f"{self.processing_partitions}"
+            )
+            raise ProgrammingError(msg)
+        self._checked_partitions.add(leader_name)
+
+    def partition_name(self, leader_name: str, partition: int) -> str:
+        """
+        Returns the application name of the tracking records of the
+        given partition of the notifications of the named application.
+        """
+        return f"{leader_name}#{partition}"
+
+    def partition(self, domain_event: DomainEventProtocol) -> int:
+        """
+        Returns the partition in which the given domain event will be processed.
+        """
+        return domain_event.originator_id.int % self.processing_partitions
 
     def pull_notifications(
         self, leader_name: str, start: int, stop: int | None = None
@@ -131,10 +310,10 @@ class Follower(Application):
         object to an :class:`~eventsourcing.domain.AggregateEvent` object
         paired with a :class:`~eventsourcing.persistence.Tracking` object.
         """
-        mapper = self.mappers[leader_name]
+        notifications = list(notifications)
+        domain_events = self.mappers[leader_name].to_domain_events(notifications)
         processing_jobs = []
-        for notification in notifications:
-            domain_event: DomainEventProtocol = mapper.to_domain_event(notification)
+        for domain_event, notification in zip(domain_events, notifications):
             tracking = Tracking(
                 application_name=leader_name,
                 notification_id=notification.id,
@@ -142,6 +321,134 @@ class Follower(Application):
             processing_jobs.append((domain_event, tracking))
         return processing_jobs
 
+    def process_events(self, processing_jobs: Sequence[ProcessingJob]) -> None:
+        """
+        Processes the given domain events in order, by calling
+        :func:`process_event` for each of the given processing jobs.
+
+        If processing is partitioned, the processing jobs are divided into
+        partitions, their tracking objects are given the names of their
+        partitions, and the partitions are processed concurrently. Domain
+        events that have already been processed in their partition are
+        skipped. After all the partitions have processed their jobs, the
+        position of the last job is tracked with the leader's name. Returns
+        after all the partitions have been processed, raising the first
+        exception that was raised by any partition.
+
+        If batch processing is enabled, the processing jobs (of each partition)
+        that have not already been processed are processed as a batch by
+        :func:`process_batch`.
+        """
+        if self.partition_executor is None:
+            if self.is_batch_processing_enabled:
+                with self.processing_lock:
+                    self.process_batch(self._filter_processed(processing_jobs))
+            else:
+                for domain_event, tracking in processing_jobs:
+                    self.process_event(domain_event, tracking)
+            return
+
+        partitioned_jobs: Dict[int, List[ProcessingJob]] = defaultdict(list)
+        positions: Dict[str, int] = {}
+        for domain_event, tracking in processing_jobs:
+            positions[tracking.application_name] = tracking.notification_id
+            partition = self.partition(domain_event)
+            partition_tracking = Tracking(
+                application_name=self.partition_name(
+                    tracking.application_name, partition
+                ),
+                notification_id=tracking.notification_id,
+            )
+            partitioned_jobs[partition].append((domain_event, partition_tracking))
+        for leader_name in positions:
+            self._check_partitions(leader_name)
+
+        futures = [
+            self.partition_executor.submit(self._process_partition, partition, jobs)
+            for partition, jobs in partitioned_jobs.items()
+        ]
+        wait(futures)
+        for future in futures:
+            future.result()
+
+        # Track the position of the batch, which has now been processed by all
+        # the partitions, including those that had nothing to process.
+        for leader_name, notification_id in positions.items():
+            with suppress(IntegrityError):
+                self._record(
+                    ProcessingEvent(
+                        tracking=Tracking(
+                            application_name=leader_name,
+                            notification_id=notification_id,
+                        )
+                    )
+                )
+
+    def _process_partition(
+        self, partition: int, processing_jobs: List[ProcessingJob]
+    ) -> None:
+        with self.partition_locks[partition]:
+            if self.is_batch_processing_enabled:
+                self.process_batch(self._filter_processed(processing_jobs))
+            else:
+                for domain_event, tracking in processing_jobs:
+                    self._process_event(domain_event, tracking)
+
+    def _filter_processed(
+        self, processing_jobs: Sequence[ProcessingJob]
+    ) -> List[ProcessingJob]:
+        # Since only the last tracking object of a batch is recorded, select
+        # unprocessed jobs by position rather than relying on IntegrityError.
+        # Jobs processed one at a time record their own tracking objects, and
+        # so don't need to be filtered.
+        max_tracking_ids: Dict[str, int] = {}
+        unprocessed_jobs = []
+        for domain_event, tracking in processing_jobs:
+            name = tracking.application_name
+            if name not in max_tracking_ids:
+                max_tracking_ids[name] = self.recorder.max_tracking_id(name)
+            if tracking.notification_id > max_tracking_ids[name]:
+                unprocessed_jobs.append((domain_event, tracking))
+        return unprocessed_jobs
+
+    def process_batch(self, processing_jobs: Sequence[ProcessingJob]) -> None:
+        """
+        Calls :func:`~eventsourcing.system.Follower.policy` with each of the
+        given domain events and the same new
+        :class:`~eventsourcing.application.ProcessingEvent`, created with the
+        last of the given :class:`~eventsourcing.persistence.Tracking` objects,
+        and then records the processing event in one transaction.
+
+        If recording the batch raises an
+        :class:`~eventsourcing.persistence.IntegrityError`, for example because
+        the policy changed the same aggregate more than once, and the batch has
+        not already been recorded, the domain events are processed one at a time.
+        The policy may therefore be called more than once with the same domain
+        event.
+        """
+        for _, group in groupby(processing_jobs, key=lambda j: j[1].application_name):
+            jobs = list(group)
+            if len(jobs) == 1:
+                self._process_event(*jobs[0])
+                continue
+            tracking = jobs[-1][1]
+            processing_event = ProcessingEvent(tracking=tracking)
+            for domain_event, _ in jobs:
+                self.policy(domain_event, processing_event)
+            try:
+                recordings = self._record(processing_event)
+            except IntegrityError:
+                if not self.recorder.has_tracking_id(
+                    tracking.application_name,
+                    tracking.notification_id,
+                ):
+                    for domain_event, job_tracking in jobs:
+                        self._process_event(domain_event, job_tracking)
+            else:
+                self._take_snapshots(processing_event)
+                self.notify(processing_event.events)
+                self._notify(recordings)
+
     # @retry(IntegrityError, max_attempts=50000, wait=0.01)
     def process_event(
         self, domain_event: DomainEventProtocol, tracking: Tracking
@@ -164,24 +471,40 @@ class Follower(Application):
         :func:`~eventsourcing.application.Application.take_snapshots`,
         the new notifications are passed to the
         :func:`~eventsourcing.application.Application.notify` method.
+
+        If processing is partitioned, or batch processing is enabled,
+        the domain event is processed by calling :func:`process_events`.
         """
-        processing_event = ProcessingEvent(tracking=tracking)
+        if self.partition_executor is not None or self.is_batch_processing_enabled:
+            self.process_events([(domain_event, tracking)])
+            return
         with self.processing_lock:
-            self.policy(domain_event, processing_event)
-            try:
-                recordings = self._record(processing_event)
-            except IntegrityError:
-                if self.recorder.has_tracking_id(
-                    tracking.application_name,
-                    tracking.notification_id,
-                ):
-                    pass
-                else:
-                    raise
+            self._process_event(domain_event, tracking)
+
+    def close(self) -> None:
+        if self.partition_executor is not None:
+            self.partition_executor.shutdown()
+        super().close()
+
+    def _process_event(
+        self, domain_event: DomainEventProtocol, tracking: Tracking
+    ) -> None:
+        processing_event = ProcessingEvent(tracking=tracking)
+        self.policy(domain_event, processing_event)
+        try:
+            recordings = self._record(processing_event)
+        except IntegrityError:
+            if self.recorder.has_tracking_id(
+                tracking.application_name,
+                tracking.notification_id,
+            ):
+                pass
             else:
-                self._take_snapshots(processing_event)
-                self.notify(processing_event.events)
-                self._notify(recordings)
+                raise
+        else:
+            self._take_snapshots(processing_event)
+            self.notify(processing_event.events)
+            self._notify(recordings)
 
     @abstractmethod
     def policy(
@@ -630,9 +953,7 @@ class NewSingleThreadedRunner(Runner, RecordingEventReceiver):
                             for follower_name in self.system.leads[leader_name]:
                                 follower = self.apps[follower_name]
                                 assert isinstance(follower, Follower)
-                                start = (
-                                    follower.recorder.max_tracking_id(leader_name) + 1
-                                )
+                                start = follower.tracking_position(leader_name) + 1
                                 stop = recording_event.recordings[0].notification.id - 1
                                 follower.pull_and_process(
                                     leader_name=leader_name,
@@ -1004,8 +1325,8 @@ class PullingThread(Thread):
         self.is_stopping = Event()
         self.has_started = Event()
         self.mapper = self.follower.mappers[self.leader_name]
-        self.previous_max_notification_id = self.follower.recorder.max_tracking_id(
-            application_name=self.leader_name
+        self.previous_max_notification_id = self.follower.tracking_position(
+            self.leader_name
         )
 
     def run(self) -> None:
@@ -1155,8 +1476,7 @@ class ProcessingThread(Thread):
                 self.processing_queue.task_done()
                 if self.is_stopping.is_set() or jobs is None:
                     return
-                for domain_event, tracking in jobs:
-                    self.follower.process_event(domain_event, tracking)
+                self.follower.process_events(jobs)
         except Exception as e:
             self.error = EventProcessingError(str(e))
             self.error.__cause__ = e
@@ -1167,6 +1487,233 @@ class ProcessingThread(Thread):
         self.processing_queue.put(None)
 
 
+class MultiProcessRunner(Runner):
+    """
+    Runs a :class:`System` with one operating system process for each
+    :class:`Follower` in the system definition, so that the policies of
+    different followers can be executed concurrently on different CPU cores.
+
+    Followers pull notifications from their leaders' recorders through the
+    database, so the applications must be configured to use a persistence
+    module with a database that is shared between processes (e.g. PostgreSQL,
+    or SQLite with a file). Leaders prompt followers by sending the leader's
+    name through a :class:`multiprocessing.Queue`.
+    """
+
+    start_method: str | None = None
+
+    def __init__(self, system: System, env: EnvType | None = None):
+        """
+        Initialises runner with the given :class:`System`.
+        """
+        super().__init__(system=system, env=env)
+        self.apps: Dict[str, Application] = {}
+        # All the concrete contexts have a 'Process' class, but BaseContext doesn't.
+        self.context = cast(
+            "DefaultContext", multiprocessing.get_context(self.start_method)
+        )
+        self.has_errored = self.context.Event()
+        self.errors: multiprocessing.Queue[str] = self.context.Queue()
+        self.prompt_queues: Dict[str, multiprocessing.Queue[str | None]] = {}
+        self.processes: Dict[str, BaseProcess] = {}
+
+        # Construct followers. Their tables will be created before the
+        # worker processes start, and they can be used to query state.
+        for follower_name in self.system.followers:
+            follower_class = self.system.follower_cls(follower_name)
+            try:
+                follower = follower_class(env=self.env)
+            except Exception:
+                self.has_errored.set()
+                raise
+            self.apps[follower_name] = follower
+
+        # Construct non-follower leaders.
+        for leader_name in self.system.leaders_only:
+            self.apps[leader_name] = self.system.leader_cls(leader_name)(env=self.env)
+
+        # Construct singles.
+        for name in self.system.singles:
+            single = self.system.get_app_cls(name)(env=self.env)
+            self.apps[name] = single
+
+        # Check the applications are not using in-memory databases.
+        for app in self.apps.values():
+            if not app.factory.is_shared_between_processes():
+                msg = (
+                    f"Application {app.name} can't be run in multiple processes "
+                    "because its database can't be shared between processes"
+                )
+                raise ProgrammingError(msg)
+
+    def start(self) -> None:
+        """
+        Starts the runner.
+
+        A worker process is started for each 'follower' application in
+        the system. Each worker process constructs its follower, and an
+        instance of each application it follows, so that it can pull
+        notifications from the leaders' recorders. The leaders in this
+        process, and the process applications in the worker processes,
+        are setup to prompt their followers' worker processes.
+        """
+        super().start()
+
+        for follower_name in self.system.followers:
+            self.prompt_queues[follower_name] = self.context.Queue()
+
+        # Start the worker processes.
+        workers = []
+        for follower_name in self.system.followers:
+            worker = MultiProcessRunnerWorker(
+                system=self.system,
+                env=self.env,
+                follower_name=follower_name,
+                prompt_queues=self.prompt_queues,
+                has_started=self.context.Event(),
+                has_errored=self.has_errored,
+                errors=self.errors,
+            )
+            process = self.context.Process(target=worker.run, daemon=True)
+            process.start()
+            self.processes[follower_name] = process
+            workers.append(worker)
+
+        # Wait until all the worker processes have started.
+        for worker in workers:
+            while not worker.has_started.wait(timeout=0.1):
+                if self.has_errored.is_set():
+                    return
+
+        # Lead followers from this process.
+        for leader_name in self.system.leaders:
+            leader = cast(Leader, self.apps[leader_name])
+            for follower_name in self.system.leads[leader_name]:
+                prompt_queue = self.prompt_queues[follower_name]
+                leader.lead(MultiProcessRunnerPrompter(prompt_queue))
+
+    def watch_for_errors(self, timeout: float | None = None) -> bool:
+        if self.has_errored.wait(timeout=timeout):
+            self.stop()
+        return self.has_errored.is_set()
+
+    def stop(self) -> None:
+        for prompt_queue in self.prompt_queues.values():
+            prompt_queue.put(None)
+        for process in self.processes.values():
+            process.join(timeout=2)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        for app in self.apps.values():
+            app.close()
+        self.apps.clear()
+        self.reraise_process_errors()
+
+    def reraise_process_errors(self) -> None:
+        if self.has_errored.is_set():
+            try:
+                msg = self.errors.get(timeout=1)
+            except Empty:
+                msg = "Worker process errored"
+            raise EventProcessingError(msg)
+
+    def get(self, cls: Type[TApplication]) -> TApplication:
+        app = self.apps[cls.name]
+        assert isinstance(app, cls)
+        return app
+
+
+class MultiProcessRunnerPrompter(RecordingEventReceiver):
+    """
+    Prompts a :class:`Follower` in a worker process of a
+    :class:`MultiProcessRunner` by putting the name of the
+    leader on the worker process's prompt queue.
+    """
+
+    def __init__(self, prompt_queue: multiprocessing.Queue[str | None]):
+        self.prompt_queue = prompt_queue
+
+    def receive_recording_event(self, recording_event: RecordingEvent) -> None:
+        self.prompt_queue.put(recording_event.application_name)
+
+
+class MultiProcessRunnerWorker:
+    """
+    Runs one :class:`~eventsourcing.system.Follower` application
+    in a worker process of a :class:`MultiProcessRunner`.
+    """
+
+    def __init__(
+        self,
+        system: System,
+        env: EnvType | None,
+        follower_name: str,
+        prompt_queues: Dict[str, multiprocessing.Queue[str | None]],
+        has_started: EventType,
+        has_errored: EventType,
+        errors: multiprocessing.Queue[str],
+    ):
+        self.system = system
+        self.env = env
+        self.follower_name = follower_name
+        self.prompt_queues = prompt_queues
+        self.has_started = has_started
+        self.has_errored = has_errored
+        self.errors = errors
+
+    def run(self) -> None:
+        """
+        Constructs the follower, and then pulls and processes new notifications
+        from each leader, firstly to catch up, and then whenever prompted, until
+        a stop signal is received.
+        """
+        apps: List[Application] = []
+        try:
+            follower = self.system.follower_cls(self.follower_name)(env=self.env)
+            apps.append(follower)
+            for leader_name in self.system.follows[self.follower_name]:
+                leader = self.system.leader_cls(leader_name)(env=self.env)
+                apps.append(leader)
+                follower.follow(leader.name, leader.notification_log)
+            if isinstance(follower, Leader):
+                for name in self.system.leads[self.follower_name]:
+                    follower.lead(MultiProcessRunnerPrompter(self.prompt_queues[name]))
+            self.has_started.set()
+
+            prompted_names: List[str] | None = self.system.follows[self.follower_name]
+            while prompted_names is not None:
+                for name in prompted_names:
+                    follower.pull_and_process(name)
+                prompted_names = self.get_prompted_names()
+        except Exception:
+            self.errors.put(traceback.format_exc())
+            self.has_errored.set()
+        finally:
+            for app in apps:
+                app.close()
+            # Don't wait for prompts to be received by stopped processes.
+            for prompt_queue in self.prompt_queues.values():
+                prompt_queue.cancel_join_thread()
+
+    def get_prompted_names(self) -> List[str] | None:
+        """
+        Blocks until prompted, and then returns the names of the prompting
+        leaders, or None if a stop signal is received.
+        """
+        prompt_queue = self.prompt_queues[self.follower_name]
+        names: List[str] = []
+        name = prompt_queue.get()
+        while name is not None:
+            if name not in names:
+                names.append(name)
+            try:
+                name = prompt_queue.get_nowait()
+            except Empty:
+                return names
+        return None
+
+
 class NotificationLogReader:
     """
     Reads domain event notifications from a notification log.
@@ -1178,15 +1725,41 @@ class NotificationLogReader:
         self,
         notification_log: NotificationLog,
         section_size: int = DEFAULT_SECTION_SIZE,
+        *,
+        min_section_size: int = 1,
+        max_section_size: int | None = None,
+        max_duration: float = 1.0,
+        max_bytes: int | None = None,
     ):
         """
         Initialises a reader with the given notification log,
         and optionally a section size integer which determines
         the requested number of domain event notifications in
         each section retrieved from the notification log.
+
+        If 'max_section_size' is given, the number of notifications requested
+        by :func:`select` is adapted: it is doubled (up to 'max_section_size')
+        after a full list of notifications has been selected and yielded, and
+        processed by the consumer, within 'max_duration' seconds, and it is
+        halved (down to 'min_section_size') if that took longer than
+        'max_duration' seconds, or if the total size of the states of the
+        notifications was more than 'max_bytes'.
         """
+        if max_section_size is not None and not (
+            0 < min_section_size <= max_section_size
+        ):
+            msg = f"Invalid section size bounds: {min_section_size}, {max_section_size}"
+            raise ValueError(msg)
         self.notification_log = notification_log
         self.section_size = section_size
+        self.min_section_size = min_section_size
+        self.max_section_size = max_section_size
+        self.max_duration = max_duration
+        self.max_bytes = max_bytes
+        if max_section_size is not None:
+            self.section_size = min(
+                max(section_size, min_section_size), max_section_size
+            )
 
     def read(self, *, start: int) -> Iterator[Notification]:
         """
@@ -1227,8 +1800,10 @@ class NotificationLogReader:
         from the start position have been yielded.
         """
         while True:
+            started = monotonic()
+            limit = self.section_size
             notifications = self.notification_log.select(
-                start=start, stop=stop, limit=self.section_size, topics=topics
+                start=start, stop=stop, limit=limit, topics=topics
             )
             # Stop if zero notifications.
             if len(notifications) == 0:
@@ -1236,4 +1811,116 @@ class NotificationLogReader:
 
             # Otherwise, yield and continue.
             yield notifications
+            if self.max_section_size is not None:
+                self._adapt_section_size(limit, notifications, monotonic() - started)
             start = notifications[-1].id + 1
+
+    def _adapt_section_size(
+        self, limit: int, notifications: List[Notification], duration: float
+    ) -> None:
+        assert self.max_section_size is not None
+        if duration > self.max_duration or (
+            self.max_bytes is not None
+            and sum(len(n.state) for n in notifications) > self.max_bytes
+        ):
+            self.section_size = max(self.min_section_size, limit // 2)
+        elif len(notifications) == limit:
+            self.section_size = min(self.max_section_size, limit * 2)
+
+
+class PrefetchingNotificationLogReader(NotificationLogReader):
+    """
+    Reads domain event notifications from a notification log, selecting
+    the next lists of notifications in a background thread whilst the
+    consumer is processing the lists that have already been selected.
+    """
+
+    DEFAULT_PREFETCH_SECTIONS = 2
+
+    def __init__(
+        self,
+        notification_log: NotificationLog,
+        section_size: int = NotificationLogReader.DEFAULT_SECTION_SIZE,
+        *,
+        prefetch_sections: int = DEFAULT_PREFETCH_SECTIONS,
+        min_section_size: int = 1,
+        max_section_size: int | None = None,
+        max_duration: float = 1.0,
+        max_bytes: int | None = None,
+    ):
+        """
+        Initialises a reader, as :class:`NotificationLogReader`, with
+        the maximum number of lists of notifications that will be selected
+        ahead of the consumer.
+
+        When the section size is adapted, the duration of each section includes
+        the time spent waiting for the consumer to take a previous list, so that
+        the section size is still reduced when the consumer is slow.
+        """
+        if prefetch_sections < 1:
+            msg = f"Prefetch sections must be at least 1: {prefetch_sections}"
+            raise ValueError(msg)
+        super().__init__(
+            notification_log,
+            section_size,
+            min_section_size=min_section_size,
+            max_section_size=max_section_size,
+            max_duration=max_duration,
+            max_bytes=max_bytes,
+        )
+        self.prefetch_sections = prefetch_sections
+
+    def select(
+        self, *, start: int, stop: int | None = None, topics: Sequence[str] = ()
+    ) -> Iterator[List[Notification]]:
+        """
+        Returns a generator that yields lists of event notifications, as
+        :func:`NotificationLogReader.select`, which are selected by a background
+        thread that is started when the generator is first iterated. Up to
+        'prefetch_sections' lists are held in a bounded queue. An error raised
+        when selecting notifications, including a :class:`BaseException`, is
+        raised by the generator. The background thread is stopped when the
+        generator is exhausted or closed.
+        """
+        selected = super().select(start=start, stop=stop, topics=topics)
+        queue: Queue[List[Notification] | BaseException | None] = Queue(
+            maxsize=self.prefetch_sections
+        )
+        is_stopping = Event()
+
+        def prefetch() -> None:
+            try:
+                for notifications in selected:
+                    if not self._put(queue, notifications, is_stopping):
+                        return
+            except BaseException as e:
+                # Forward all errors, otherwise the consumer would wait forever.
+                self._put(queue, e, is_stopping)
+            else:
+                self._put(queue, None, is_stopping)
+
+        thread = Thread(target=prefetch, daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = queue.get()
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            is_stopping.set()
+            thread.join()
+
+    @staticmethod
+    def _put(
+        queue: Queue[List[Notification] | BaseException | None],
+        item: List[Notification] | BaseException | None,
+        is_stopping: Event,
+    ) -> bool:
+        while not is_stopping.is_set():
+            with suppress(Full):
+                queue.put(item, timeout=0.1)
+                return True
+        return False
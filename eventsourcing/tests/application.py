@@ -11,11 +11,18 @@ from threading import Event, get_ident
 from time import sleep
 from timeit import timeit
 from typing import ClassVar, Dict, Type
-from unittest import TestCase
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import patch
 from uuid import UUID, uuid4
 
-from eventsourcing.application import AggregateNotFoundError, Application
-from eventsourcing.domain import Aggregate
+from eventsourcing.application import (
+    AggregateNotFoundError,
+    Application,
+    AsyncApplication,
+    SizedLRUCache,
+    SnapshotCache,
+)
+from eventsourcing.domain import Aggregate, DeltaSnapshot, ProgrammingError
 from eventsourcing.persistence import (
     InfrastructureFactory,
     IntegrityError,
@@ -23,6 +30,7 @@ from eventsourcing.persistence import (
     Transcoding,
 )
 from eventsourcing.tests.domain import BankAccount, EmailAddress
+from eventsourcing.tests.persistence import tmpfile_uris
 from eventsourcing.utils import get_topic
 
 TIMEIT_FACTOR = int(os.environ.get("TEST_TIMEIT_FACTOR", default=10))
@@ -232,6 +240,121 @@ class BankAccounts(Application):
         pass
 
 
+class AsyncExampleApplicationTestCase(IsolatedAsyncioTestCase):
+    expected_factory_topic: str
+
+    async def test_example_application(self):
+        async with AsyncBankAccounts(env={"IS_SNAPSHOTTING_ENABLED": "y"}) as app:
+            self.assertEqual(get_topic(type(app.factory)), self.expected_factory_topic)
+            max_notification_id = await app.recorder.max_notification_id()
+
+            # Check AccountNotFound exception.
+            with self.assertRaises(BankAccounts.AccountNotFoundError):
+                await app.get_account(uuid4())
+
+            # Open an account.
+            account_id = await app.open_account(
+                full_name="Alice",
+                email_address="alice@example.com",
+            )
+            self.assertTrue(await app.repository.contains(account_id))
+            self.assertFalse(await app.repository.contains(uuid4()))
+
+            # Credit the account.
+            await app.credit_account(account_id, Decimal("10.00"))
+            await app.credit_account(account_id, Decimal("25.00"))
+            self.assertEqual(await app.get_balance(account_id), Decimal("35.00"))
+
+            # Check the notifications.
+            notifications = await app.recorder.select_notifications(
+                max_notification_id + 1, 10
+            )
+            self.assertEqual(len(notifications), 3)
+            self.assertEqual(notifications[0].originator_id, account_id)
+            self.assertEqual(notifications[2].originator_version, 3)
+
+            # Take a snapshot, and check the aggregate is reconstructed from it.
+            assert app.snapshots is not None
+            await app.take_snapshot(account_id, version=2)
+            snapshots = await app.snapshots.get(account_id)
+            self.assertEqual(len(snapshots), 1)
+            self.assertEqual(snapshots[0].originator_version, 2)
+            self.assertEqual(await app.get_balance(account_id), Decimal("35.00"))
+
+            # Check a conflicting save raises an integrity error.
+            account = await app.get_account(account_id)
+            account.append_transaction(Decimal("1.00"))
+            stale = await app.get_account(account_id)
+            stale.append_transaction(Decimal("2.00"))
+            await app.save(account)
+            with self.assertRaises(IntegrityError):
+                await app.save(stale)
+            self.assertEqual(await app.get_balance(account_id), Decimal("36.00"))
+
+    async def test_snapshotting_after_costly_replay(self):
+        env = {"IS_SNAPSHOTTING_ENABLED": "y", "SNAPSHOTTING_REPLAY_THRESHOLD": "1"}
+        async with AsyncBankAccounts(env=env) as app:
+            account_id = await app.open_account("Alice", "alice@example.com")
+            await app.credit_account(account_id, Decimal("10.00"))
+            self.assertEqual(await app.get_balance(account_id), Decimal("10.00"))
+            assert app.snapshots is not None
+            snapshots = await app.snapshots.get(account_id)
+            self.assertEqual(len(snapshots), 1)
+            self.assertEqual(snapshots[0].originator_version, 2)
+
+    async def test_delta_snapshots(self):
+        class MyBankAccounts(AsyncBankAccounts):
+            snapshotting_intervals: ClassVar[Dict[Type[Aggregate], int]] = {
+                BankAccount: 2
+            }
+            snapshot_class = DeltaSnapshot
+
+        async with MyBankAccounts() as app:
+            account_id = await app.open_account("Alice", "alice@example.com")
+            for _ in range(4):
+                await app.credit_account(account_id, Decimal("10.00"))
+            await app.take_snapshot(account_id)
+            assert app.snapshots is not None
+            snapshots = await app.snapshots.get(account_id)
+            self.assertEqual([s.originator_version for s in snapshots], [2, 4, 5])
+            self.assertEqual([s.base_version for s in snapshots], [2, 2, 2])
+            self.assertEqual(await app.get_balance(account_id), Decimal("40.00"))
+
+
+class AsyncBankAccounts(AsyncApplication):
+    is_snapshotting_enabled = True
+
+    def register_transcodings(self, transcoder: Transcoder) -> None:
+        super().register_transcodings(transcoder)
+        transcoder.register(EmailAddressAsStr())
+
+    async def open_account(self, full_name, email_address):
+        account = BankAccount.open(
+            full_name=full_name,
+            email_address=email_address,
+        )
+        await self.save(account)
+        return account.id
+
+    async def credit_account(self, account_id: UUID, amount: Decimal) -> None:
+        account = await self.get_account(account_id)
+        account.append_transaction(amount)
+        await self.save(account)
+
+    async def get_balance(self, account_id: UUID) -> Decimal:
+        account = await self.get_account(account_id)
+        return account.balance
+
+    async def get_account(self, account_id: UUID) -> BankAccount:
+        try:
+            aggregate = await self.repository.get(account_id)
+        except AggregateNotFoundError:
+            raise BankAccounts.AccountNotFoundError(account_id) from None
+        else:
+            assert isinstance(aggregate, BankAccount)
+            return aggregate
+
+
 class ApplicationTestCase(TestCase):
     def test_name(self):
         self.assertEqual(Application.name, "Application")
@@ -344,6 +467,41 @@ class ApplicationTestCase(TestCase):
         app.repository.get(aggregate.id)
         self.assertEqual(aggregate, app.repository.cache.get(aggregate.id))
 
+    def test_application_with_cache_limited_by_size_in_bytes(self):
+        app = BankAccounts(env={"AGGREGATE_CACHE_MAXBYTES": "1000"})
+        self.assertIsInstance(app.repository.cache, SizedLRUCache)
+        self.assertEqual(app.repository.cache.maxbytes, 1000)
+        self.assertIsNone(app.repository.cache.maxsize)
+
+        # Check cached aggregates are sized by their encoded snapshot states.
+        account_id1 = app.open_account("Alice", "alice@example.com")
+        account1 = app.get_account(account_id1)
+        size1 = app.aggregate_size(account1)
+        self.assertGreater(size1, 0)
+        self.assertEqual(app.repository.cache.size, size1)
+        self.assertEqual(app.repository.cache.misses, 1)
+        app.get_account(account_id1)
+        self.assertEqual(app.repository.cache.hits, 1)
+
+        # Check the least recently used aggregates are evicted to fit new ones.
+        account_ids = [
+            app.open_account(f"Bob{i}", "bob@example.com") for i in range(10)
+        ]
+        for account_id in account_ids:
+            app.get_account(account_id)
+        self.assertLessEqual(app.repository.cache.size, 1000)
+        self.assertGreater(app.repository.cache.evictions, 0)
+        with self.assertRaises(KeyError):
+            app.repository.cache.get(account_id1)
+        self.assertEqual(app.repository.cache.get(account_ids[-1]).id, account_ids[-1])
+
+        # Check the number of cached aggregates can also be limited.
+        app = BankAccounts(
+            env={"AGGREGATE_CACHE_MAXBYTES": "1000", "AGGREGATE_CACHE_MAXSIZE": "2"}
+        )
+        self.assertIsInstance(app.repository.cache, SizedLRUCache)
+        self.assertEqual(app.repository.cache.maxsize, 2)
+
     def test_application_fastforward_skipping_during_contention(self):
         app = Application(
             env={
@@ -448,6 +606,277 @@ class ApplicationTestCase(TestCase):
         app.repository.get(aggregate.id)
         self.assertEqual(aggregate, app.repository.cache.get(aggregate.id))
 
+    def test_application_with_cached_aggregates_fastforward_subscribing(self):
+        app = BankAccounts(
+            env={
+                "AGGREGATE_CACHE_MAXSIZE": "10",
+                "AGGREGATE_CACHE_FASTFORWARD_SUBSCRIBING": "y",
+            }
+        )
+        self.assertTrue(app.repository.fastforward_subscribing)
+
+        # Count the queries for new events of cached aggregates.
+        queries = []
+        event_store_get = app.repository.event_store.get
+
+        def get(*args, **kwargs):
+            queries.append(kwargs)
+            return event_store_get(*args, **kwargs)
+
+        app.repository.event_store.get = get
+
+        account_id = app.open_account("Alice", "alice@example.com")
+        app.credit_account(account_id, Decimal("10.00"))
+        self.assertEqual(len(queries), 1)
+
+        # Events recorded by this application are noted when they are recorded.
+        self.assertEqual(app.get_balance(account_id), Decimal("10.00"))
+        self.assertEqual(len(queries), 2)
+
+        # Fresh cached aggregates aren't fast-forwarded.
+        self.assertEqual(app.get_balance(account_id), Decimal("10.00"))
+        self.assertEqual(len(app.repository.get_many([account_id])), 1)
+        self.assertEqual(len(queries), 2)
+
+        app.credit_account(account_id, Decimal("5.00"))
+        self.assertEqual(len(queries), 2)
+        self.assertEqual(app.get_balance(account_id), Decimal("15.00"))
+        self.assertEqual(len(queries), 3)
+
+        # Events recorded otherwise are noted by the subscription.
+        account = app.repository.get(account_id)
+        account.append_transaction(Decimal("1.00"))
+        app.events.put(account.collect_events())
+        for _ in range(100):
+            if app.get_balance(account_id) == Decimal("16.00"):
+                break
+            sleep(0.01)
+        else:
+            self.fail("Cached aggregate wasn't fast-forwarded")
+
+        # Cached aggregates are always fast-forwarded after closing repository.
+        app.repository.close()
+        self.assertFalse(app.repository.fastforward_subscribing)
+        self.assertEqual(app.get_balance(account_id), Decimal("16.00"))
+        self.assertEqual(len(queries), 5)
+        app.close()
+
+    def test_application_with_snapshotting_after_costly_replay(self):
+        app = BankAccounts(env={"SNAPSHOTTING_REPLAY_THRESHOLD": "3"})
+        self.assertEqual(app.repository.replay_snapshotting.threshold, 3)
+        self.assertEqual(app.repository.replay_snapshotting.interval, 60)
+        account_id = app.open_account("Alice", "alice@example.com")
+        for _ in range(3):
+            app.credit_account(account_id, Decimal("10.00"))
+        self.assertEqual(len(list(app.snapshots.get(account_id))), 0)
+
+        # Snapshot is taken when more events than the threshold are replayed.
+        app.credit_account(account_id, Decimal("10.00"))
+        snapshots = list(app.snapshots.get(account_id))
+        self.assertEqual(len(snapshots), 1)
+        self.assertEqual(snapshots[0].originator_version, 4)
+        self.assertEqual(app.get_balance(account_id), Decimal("40.00"))
+
+        # Snapshots of each aggregate are rate limited.
+        for _ in range(4):
+            app.credit_account(account_id, Decimal("10.00"))
+        self.assertEqual(app.get_balance(account_id), Decimal("80.00"))
+        self.assertEqual(len(list(app.snapshots.get(account_id))), 1)
+        app.repository.replay_snapshotting.interval = 0
+        self.assertEqual(app.repository.get_many([account_id])[0].version, 9)
+        snapshots = list(app.snapshots.get(account_id))
+        self.assertEqual(len(snapshots), 2)
+        self.assertEqual(snapshots[1].originator_version, 9)
+
+        # Snapshot is taken when replaying events takes longer than the duration.
+        app = BankAccounts(env={"SNAPSHOTTING_REPLAY_DURATION": "0"})
+        account_id = app.open_account("Alice", "alice@example.com")
+        self.assertEqual(app.get_balance(account_id), Decimal("0.00"))
+        self.assertEqual(len(list(app.snapshots.get(account_id))), 1)
+
+        # The replay of events is also timed by get_many().
+        app = BankAccounts(env={"SNAPSHOTTING_REPLAY_DURATION": "0"})
+        account_id = app.open_account("Alice", "alice@example.com")
+        app.repository.get_many([account_id])
+        self.assertEqual(len(list(app.snapshots.get(account_id))), 1)
+
+    def test_application_with_snapshotting_from_saved_aggregates(self):
+        class MyBankAccounts(BankAccounts):
+            snapshotting_intervals: ClassVar[Dict[Type[Aggregate], int]] = {
+                BankAccount: 2
+            }
+
+        # Snapshots are taken from saved aggregates, without calling get().
+        app = MyBankAccounts()
+        self.assertIsNone(app.snapshotting_worker)
+        account_id = app.open_account("Alice", "alice@example.com")
+        account = app.get_account(account_id)
+        account.append_transaction(Decimal("10.00"))
+        get_calls = []
+        app.repository.get = lambda *args, **_: get_calls.append(args)
+        app.save(account)
+        self.assertEqual(get_calls, [])
+        snapshots = list(app.snapshots.get(account_id))
+        self.assertEqual(len(snapshots), 1)
+        self.assertEqual(snapshots[0].originator_version, 2)
+        del app.repository.get
+
+        # Snapshots are taken by reconstructing aggregates if versions don't match.
+        account = app.get_account(account_id)
+        account.append_transaction(Decimal("10.00"))
+        account.append_transaction(Decimal("10.00"))
+        app.save(account)
+        snapshots = list(app.snapshots.get(account_id))
+        self.assertEqual(len(snapshots), 2)
+        self.assertEqual(snapshots[1].originator_version, 4)
+        self.assertEqual(app.get_balance(account_id), Decimal("30.00"))
+        app.close()
+
+        # Snapshots are taken on a background thread.
+        app = MyBankAccounts(
+            env={"SNAPSHOTTING_IN_BACKGROUND": "y", "SNAPSHOTTING_QUEUE_MAXSIZE": "5"}
+        )
+        assert app.snapshotting_worker is not None
+        self.assertEqual(app.snapshotting_worker.queue.maxsize, 5)
+        account_id = app.open_account("Alice", "alice@example.com")
+        for _ in range(5):
+            app.credit_account(account_id, Decimal("10.00"))
+        app.snapshotting_worker.join()
+        snapshots = list(app.snapshots.get(account_id))
+        self.assertEqual(len(snapshots), 3)
+        self.assertEqual(snapshots[2].originator_version, 6)
+        self.assertEqual(app.snapshotting_worker.discarded, 0)
+        self.assertEqual(app.snapshotting_worker.errors, 0)
+
+        # Errors raised by snapshotting functions are counted and logged.
+        def broken() -> None:
+            msg = "Just testing snapshotting errors"
+            raise ValueError(msg)
+
+        with self.assertLogs("eventsourcing.application", "ERROR") as cm:
+            app.snapshotting_worker.put(broken)
+            app.snapshotting_worker.join()
+        self.assertEqual(app.snapshotting_worker.errors, 1)
+        self.assertIn("Just testing snapshotting errors", cm.output[0])
+        app.close()
+        self.assertFalse(app.snapshotting_worker.thread.is_alive())
+
+    def test_application_with_delta_snapshots(self):
+        class MyBankAccounts(BankAccounts):
+            snapshotting_intervals: ClassVar[Dict[Type[Aggregate], int]] = {
+                BankAccount: 2
+            }
+            snapshot_class = DeltaSnapshot
+
+        app = MyBankAccounts()
+        account_id = app.open_account("Alice", "alice@example.com")
+        for _ in range(6):
+            app.credit_account(account_id, Decimal("10.00"))
+        app.take_snapshot(account_id)
+
+        # The first snapshot is a base, and later snapshots are deltas.
+        snapshots = list(app.snapshots.get(account_id))
+        self.assertEqual([s.originator_version for s in snapshots], [2, 4, 6, 7])
+        self.assertEqual([s.base_version for s in snapshots], [2, 2, 2, 2])
+        self.assertEqual(set(snapshots[3].state), {"balance", "_modified_on"})
+
+        # Aggregates are reconstructed from a delta and its base.
+        get_events = app.events.get
+        gt_args = []
+        app.events.get = lambda *args, **kwargs: (
+            gt_args.append(kwargs["gt"]) or get_events(*args, **kwargs)
+        )
+        self.assertEqual(app.get_balance(account_id), Decimal("60.00"))
+        self.assertEqual(gt_args, [7])
+        account = app.repository.get_many([account_id])[0]
+        self.assertEqual(account.balance, Decimal("60.00"))
+        self.assertEqual(account.version, 7)
+
+        # New base snapshots are taken after the rebasing interval.
+        app = MyBankAccounts()
+        account_id = app.open_account("Alice", "alice@example.com")
+        with patch.object(DeltaSnapshot, "rebasing_interval", 4):
+            for _ in range(7):
+                app.credit_account(account_id, Decimal("10.00"))
+        snapshots = list(app.snapshots.get(account_id))
+        self.assertEqual([s.base_version for s in snapshots], [2, 2, 6, 6])
+        self.assertEqual(app.get_balance(account_id), Decimal("70.00"))
+
+    def test_application_with_snapshotting_retention(self):
+        class MyBankAccounts(BankAccounts):
+            snapshotting_intervals: ClassVar[Dict[Type[Aggregate], int]] = {
+                BankAccount: 2
+            }
+
+        # Only the latest snapshots are kept.
+        app = MyBankAccounts(env={"SNAPSHOTTING_RETENTION": "2"})
+        self.assertEqual(app.repository.snapshotting_retention, 2)
+        account_id = app.open_account("Alice", "alice@example.com")
+        for _ in range(7):
+            app.credit_account(account_id, Decimal("10.00"))
+        snapshots = list(app.snapshots.get(account_id))
+        self.assertEqual([s.originator_version for s in snapshots], [6, 8])
+        app.credit_account(account_id, Decimal("10.00"))
+        app.take_snapshot(account_id)
+        snapshots = list(app.snapshots.get(account_id))
+        self.assertEqual([s.originator_version for s in snapshots], [8, 9])
+        self.assertEqual(app.get_balance(account_id), Decimal("80.00"))
+
+        # The base snapshot of a delta snapshot is kept.
+        MyBankAccounts.snapshot_class = DeltaSnapshot
+        app = MyBankAccounts(env={"SNAPSHOTTING_RETENTION": "1"})
+        account_id = app.open_account("Alice", "alice@example.com")
+        for _ in range(7):
+            app.credit_account(account_id, Decimal("10.00"))
+        snapshots = list(app.snapshots.get(account_id))
+        self.assertEqual([s.originator_version for s in snapshots], [2, 8])
+        self.assertEqual(app.get_balance(account_id), Decimal("70.00"))
+
+        # Snapshots taken in the background are also deleted.
+        del MyBankAccounts.snapshot_class
+        app = MyBankAccounts(
+            env={"SNAPSHOTTING_RETENTION": "1", "SNAPSHOTTING_IN_BACKGROUND": "y"}
+        )
+        account_id = app.open_account("Alice", "alice@example.com")
+        for _ in range(3):
+            app.credit_account(account_id, Decimal("10.00"))
+        app.snapshotting_worker.join()
+        snapshots = list(app.snapshots.get(account_id))
+        self.assertEqual([s.originator_version for s in snapshots], [4])
+        app.close()
+
+    def test_application_compact_snapshots(self):
+        app = BankAccounts()
+        account_ids = [app.open_account("Alice", "alice@example.com") for _ in range(3)]
+        for account_id in account_ids:
+            app.take_snapshot(account_id)
+            for _ in range(3):
+                app.credit_account(account_id, Decimal("10.00"))
+                app.take_snapshot(account_id)
+
+        # The latest snapshot of each aggregate is kept by default.
+        self.assertEqual(app.compact_snapshots(batch_size=5), 9)
+        for account_id in account_ids:
+            snapshots = list(app.snapshots.get(account_id))
+            self.assertEqual([s.originator_version for s in snapshots], [4])
+
+        # The number of snapshots given by SNAPSHOTTING_RETENTION are kept.
+        app = BankAccounts(env={"SNAPSHOTTING_RETENTION": "2"})
+        account_id = app.open_account("Alice", "alice@example.com")
+        app.take_snapshot(account_id)
+        for _ in range(3):
+            app.credit_account(account_id, Decimal("10.00"))
+            app.take_snapshot(account_id)
+        self.assertEqual(app.compact_snapshots(), 0)
+        snapshots = list(app.snapshots.get(account_id))
+        self.assertEqual([s.originator_version for s in snapshots], [3, 4])
+
+        # Check delta snapshots can't be compacted, since their bases would be.
+        with patch.object(BankAccounts, "snapshot_class", DeltaSnapshot):
+            app = BankAccounts()
+            with self.assertRaises(ProgrammingError):
+                app.compact_snapshots()
+
     def test_application_with_deepcopy_from_cache_arg(self):
         app = Application(
             env={
@@ -481,6 +910,119 @@ class ApplicationTestCase(TestCase):
         aggregate.version = 101
         self.assertEqual(app.repository.cache.get(aggregate.id).version, 101)
 
+    def test_application_with_copy_on_write_from_cache(self):
+        app = BankAccounts(
+            env={
+                "AGGREGATE_CACHE_MAXSIZE": "10",
+                "DEEPCOPY_FROM_AGGREGATE_CACHE": "copy-on-write",
+            }
+        )
+        self.assertTrue(app.repository.deepcopy_from_cache)
+        self.assertTrue(app.repository.copy_on_write)
+
+        account_id = app.open_account("Alice", "alice@example.com")
+        app.credit_account(account_id, Decimal("10.00"))
+        cached = app.repository.cache.get(account_id)
+
+        # Aggregates got from the cache share values with the cached aggregate.
+        account1 = app.repository.get(account_id)
+        self.assertIsNot(account1, cached)
+        self.assertEqual(account1, cached)
+        self.assertIs(account1.email_address, cached.email_address)
+        self.assertEqual(account1.pending_events, [])
+
+        # Values are copied before an aggregate is mutated by triggering events.
+        account1.append_transaction(Decimal("5.00"))
+        self.assertIsNot(account1.email_address, cached.email_address)
+        self.assertEqual(account1.email_address, cached.email_address)
+        self.assertEqual(account1.balance, Decimal("15.00"))
+        self.assertEqual(cached.balance, Decimal("10.00"))
+        self.assertEqual(cached.version, 2)
+        self.assertEqual(len(account1.pending_events), 1)
+
+        # Values are copied before the cached aggregate is fast-forwarded.
+        account2 = app.repository.get(account_id)
+        self.assertIs(account2.email_address, cached.email_address)
+        app.save(account1)
+        account3 = app.repository.get(account_id)
+        self.assertIs(app.repository.cache.get(account_id), cached)
+        self.assertIsNot(account2.email_address, cached.email_address)
+        self.assertEqual(account2.balance, Decimal("10.00"))
+        self.assertEqual(account2.version, 2)
+        self.assertEqual(account3.balance, Decimal("15.00"))
+        self.assertEqual(account3.version, 3)
+
+        # Aggregates got from the cache by get_many() also share values.
+        account4 = app.repository.get_many([account_id])[0]
+        self.assertIsNot(account4, cached)
+        self.assertIs(account4.email_address, cached.email_address)
+
+        # Values aren't copied again when the cached aggregate is fast-forwarded
+        # after the only other aggregate that shared them has copied them.
+        del account2, account3, account4
+        account5 = app.repository.get(account_id)
+        cached = app.repository.cache.get(account_id)
+        email_address = cached.email_address
+        self.assertEqual(
+            cached.__dict__["_pending_events"].sharing, {id(cached), id(account5)}
+        )
+        account5.append_transaction(Decimal("1.00"))
+        self.assertIsNot(account5.email_address, email_address)
+        app.save(account5)
+        account6 = app.repository.get(account_id)
+        self.assertEqual(account6.balance, Decimal("16.00"))
+        self.assertIs(app.repository.cache.get(account_id), cached)
+        self.assertIs(cached.email_address, email_address)
+
+    def test_application_with_aggregate_cache_in_sqlite_database(self):
+        uris = tmpfile_uris()
+        cache_uri = next(uris)
+        app = BankAccounts(env={"AGGREGATE_CACHE_SQLITE_DBNAME": cache_uri})
+        self.assertIsInstance(app.repository.cache, SnapshotCache)
+
+        # Aggregates are cached as snapshots.
+        account_id = app.open_account("Alice", "alice@example.com")
+        with self.assertRaises(KeyError):
+            app.repository.cache.get(account_id)
+        self.assertEqual(app.get_balance(account_id), Decimal("0.00"))
+        cached = app.repository.cache.get(account_id)
+        self.assertEqual(cached.version, 1)
+        self.assertIsNot(app.repository.cache.get(account_id), cached)
+
+        # Cached aggregates are fast-forwarded, and put back in the cache.
+        app.credit_account(account_id, Decimal("10.00"))
+        self.assertEqual(app.repository.cache.get(account_id).version, 1)
+        self.assertEqual(app.get_balance(account_id), Decimal("10.00"))
+        self.assertEqual(app.repository.cache.get(account_id).version, 2)
+        accounts = app.repository.get_many([account_id])
+        self.assertEqual(accounts[0].balance, Decimal("10.00"))
+
+        # Aggregates got from the cache are not shared.
+        account = app.get_account(account_id)
+        account.append_transaction(Decimal("5.00"))
+        self.assertEqual(app.get_balance(account_id), Decimal("10.00"))
+
+        # The cache can be shared by different application objects.
+        app2 = BankAccounts(env={"AGGREGATE_CACHE_SQLITE_DBNAME": cache_uri})
+        account = app2.repository.cache.get(account_id)
+        self.assertEqual(account.balance, Decimal("10.00"))
+
+        # Older cached versions are deleted.
+        recorder = app.repository.cache.event_store.recorder
+        self.assertEqual(len(recorder.select_events(account_id)), 1)
+
+        # Aggregates can be evicted from the cache.
+        account = app.repository.cache.get(account_id, evict=True)
+        self.assertEqual(account.balance, Decimal("10.00"))
+        with self.assertRaises(KeyError):
+            app2.repository.cache.get(account_id)
+
+        # The cache's database connections are closed with the application.
+        with patch.object(app.repository.cache.factory, "close") as close:
+            app.close()
+        close.assert_called_once()
+        app2.close()
+
     def test_application_log(self):
         # Check the old 'log' attribute presents the 'notification log' object.
         app = Application()
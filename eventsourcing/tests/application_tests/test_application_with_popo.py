@@ -1,6 +1,7 @@
 from eventsourcing.tests.application import (
     TIMEIT_FACTOR,
     ApplicationTestCase,
+    AsyncExampleApplicationTestCase,
     ExampleApplicationTestCase,
 )
 
@@ -18,5 +19,10 @@ class TestExampleApplicationWithPOPO(ExampleApplicationTestCase):
     expected_factory_topic = "eventsourcing.popo:Factory"
 
 
+class TestAsyncExampleApplicationWithPOPO(AsyncExampleApplicationTestCase):
+    expected_factory_topic = "eventsourcing.popo:Factory"
+
+
 del ApplicationTestCase
+del AsyncExampleApplicationTestCase
 del ExampleApplicationTestCase
@@ -5,6 +5,7 @@ from eventsourcing.postgres import PostgresDatastore
 from eventsourcing.tests.application import (
     TIMEIT_FACTOR,
     ApplicationTestCase,
+    AsyncExampleApplicationTestCase,
     ExampleApplicationTestCase,
 )
 from eventsourcing.tests.postgres_utils import drop_postgres_table
@@ -35,6 +36,8 @@ class WithPostgres(TestCase):
         )
         drop_postgres_table(db, "public.bankaccounts_events")
         drop_postgres_table(db, "public.bankaccounts_snapshots")
+        drop_postgres_table(db, "public.asyncbankaccounts_events")
+        drop_postgres_table(db, "public.asyncbankaccounts_snapshots")
         db.close()
 
     def tearDown(self) -> None:
@@ -47,6 +50,8 @@ class WithPostgres(TestCase):
         )
         drop_postgres_table(db, "public.bankaccounts_events")
         drop_postgres_table(db, "public.bankaccounts_snapshots")
+        drop_postgres_table(db, "public.asyncbankaccounts_events")
+        drop_postgres_table(db, "public.asyncbankaccounts_snapshots")
 
         del os.environ["PERSISTENCE_MODULE"]
         del os.environ["CREATE_TABLE"]
@@ -70,6 +75,13 @@ class TestExampleApplicationWithPostgres(ExampleApplicationTestCase, WithPostgre
     expected_factory_topic = "eventsourcing.postgres:Factory"
 
 
+class TestAsyncExampleApplicationWithPostgres(
+    AsyncExampleApplicationTestCase, WithPostgres
+):
+    expected_factory_topic = "eventsourcing.postgres:Factory"
+
+
 del ApplicationTestCase
+del AsyncExampleApplicationTestCase
 del ExampleApplicationTestCase
 del WithPostgres
@@ -4,6 +4,7 @@ from unittest import TestCase
 from eventsourcing.tests.application import (
     TIMEIT_FACTOR,
     ApplicationTestCase,
+    AsyncExampleApplicationTestCase,
     ExampleApplicationTestCase,
 )
 from eventsourcing.tests.persistence import tmpfile_uris
@@ -66,7 +67,20 @@ class TestExampleApplicationWithSQLiteInMemory(
     expected_factory_topic = "eventsourcing.sqlite:Factory"
 
 
+class TestAsyncExampleApplicationWithSQLiteFile(
+    AsyncExampleApplicationTestCase, WithSQLiteFile
+):
+    expected_factory_topic = "eventsourcing.sqlite:Factory"
+
+
+class TestAsyncExampleApplicationWithSQLiteInMemory(
+    AsyncExampleApplicationTestCase, WithSQLiteInMemory
+):
+    expected_factory_topic = "eventsourcing.sqlite:Factory"
+
+
 del ApplicationTestCase
+del AsyncExampleApplicationTestCase
 del ExampleApplicationTestCase
 del WithSQLiteFile
 del WithSQLiteInMemory
@@ -1,6 +1,6 @@
 from unittest import TestCase
 
-from eventsourcing.application import Cache, LRUCache
+from eventsourcing.application import Cache, LRUCache, SizedLRUCache
 
 
 class TestCache(TestCase):
@@ -132,3 +132,88 @@ class TestLRUCache(TestCase):
 
         evicted = cache.put(7, 7)
         self.assertEqual(evicted, (4, 4))
+
+
+class TestSizedLRUCache(TestCase):
+    def test_put_get(self):
+        cache = SizedLRUCache(maxbytes=10, sizer=len)
+
+        with self.assertRaises(KeyError):
+            cache.get(1)
+        self.assertEqual(cache.misses, 1)
+
+        evicted = cache.put(1, "aaaa")
+        self.assertEqual(evicted, (None, None))
+        self.assertEqual(cache.get(1), "aaaa")
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.size, 4)
+
+        evicted = cache.put(2, "bbbb")
+        self.assertEqual(evicted, (None, None))
+        self.assertEqual(cache.size, 8)
+
+        # Check the least recently used values are evicted to fit the new value.
+        self.assertEqual(cache.get(1), "aaaa")
+        evicted = cache.put(3, "ccc")
+        self.assertEqual(evicted, (2, "bbbb"))
+        self.assertEqual(cache.size, 7)
+        self.assertEqual(cache.evictions, 1)
+        with self.assertRaises(KeyError):
+            cache.get(2)
+
+        # Check replacing a value updates the total size.
+        evicted = cache.put(1, "a")
+        self.assertEqual(evicted, (None, None))
+        self.assertEqual(cache.size, 4)
+
+        # Check putting a value makes it the most recently used.
+        evicted = cache.put(4, "dddddddd")
+        self.assertEqual(evicted, (3, "ccc"))
+        self.assertEqual(cache.size, 9)
+        self.assertEqual(cache.evictions, 2)
+
+        # Check more than one value can be evicted.
+        evicted = cache.put(5, "eeeeeeeeee")
+        self.assertEqual(evicted, (4, "dddddddd"))
+        self.assertEqual(cache.size, 10)
+        self.assertEqual(cache.evictions, 4)
+        self.assertEqual(cache.get(5), "eeeeeeeeee")
+
+        # Check a value larger than the limit is not cached.
+        evicted = cache.put(6, "fffffffffff")
+        self.assertEqual(evicted, (None, None))
+        with self.assertRaises(KeyError):
+            cache.get(6)
+        self.assertEqual(cache.get(5), "eeeeeeeeee")
+
+        # Check evicting a value by getting it updates the total size.
+        self.assertEqual(cache.get(5, evict=True), "eeeeeeeeee")
+        self.assertEqual(cache.size, 0)
+        with self.assertRaises(KeyError):
+            cache.get(5, evict=True)
+
+        self.assertEqual(cache.hits, 5)
+        self.assertEqual(cache.misses, 4)
+
+    def test_values_that_cannot_be_sized_are_not_cached(self):
+        def sizer(value):
+            if value == "b":
+                msg = "Can't size value"
+                raise ValueError(msg)
+            return len(value)
+
+        cache = SizedLRUCache(maxbytes=10, sizer=sizer)
+        cache.put(1, "a")
+        self.assertEqual(cache.size, 1)
+        cache.put(1, "b")
+        with self.assertRaises(KeyError):
+            cache.get(1)
+        self.assertEqual(cache.size, 0)
+
+    def test_maxsize(self):
+        cache = SizedLRUCache(maxbytes=100, sizer=len, maxsize=2)
+        cache.put(1, "a")
+        cache.put(2, "b")
+        self.assertEqual(cache.put(3, "c"), (1, "a"))
+        self.assertEqual(cache.size, 2)
+        self.assertEqual(cache.evictions, 1)
@@ -1,11 +1,26 @@
 from itertools import chain
+from threading import active_count
+from time import sleep
 from unittest.case import TestCase
 from uuid import uuid4
 
 from eventsourcing.application import LocalNotificationLog
 from eventsourcing.persistence import StoredEvent
 from eventsourcing.sqlite import SQLiteDatastore, SQLiteProcessRecorder
-from eventsourcing.system import NotificationLogReader
+from eventsourcing.system import (
+    NotificationLogReader,
+    PrefetchingNotificationLogReader,
+)
+
+
+class CountingNotificationLog(LocalNotificationLog):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.select_count = 0
+
+    def select(self, *args, **kwargs):
+        self.select_count += 1
+        return super().select(*args, **kwargs)
 
 
 class TestNotificationLogReader(TestCase):
@@ -124,3 +139,124 @@ class TestNotificationLogReader(TestCase):
 
         notifications = list(chain(*reader.select(start=10)))
         self.assertEqual(len(notifications), 0)
+
+    def test_select_with_adaptive_section_size(self):
+        recorder = SQLiteProcessRecorder(SQLiteDatastore(":memory:"))
+        recorder.create_table()
+        notification_log = LocalNotificationLog(recorder, section_size=100)
+
+        # Write 60 events.
+        originator_id = uuid4()
+        recorder.insert_events([
+            StoredEvent(
+                originator_id=originator_id,
+                originator_version=i,
+                topic="topic",
+                state=b"state",
+            )
+            for i in range(60)
+        ])
+
+        # Check section size grows when sections are full.
+        reader = NotificationLogReader(
+            notification_log, section_size=2, max_section_size=16
+        )
+        lengths = [len(n) for n in reader.select(start=1)]
+        self.assertEqual(lengths, [2, 4, 8, 16, 16, 14])
+        self.assertEqual(reader.section_size, 16)
+
+        # Check section size shrinks when processing takes too long.
+        reader = NotificationLogReader(
+            notification_log,
+            section_size=8,
+            min_section_size=2,
+            max_section_size=16,
+            max_duration=0,
+        )
+        lengths = [len(n) for n in reader.select(start=1, stop=20)]
+        self.assertEqual(lengths, [8, 4, 2, 2, 2, 2])
+        self.assertEqual(reader.section_size, 2)
+
+        # Check section size shrinks when sections are too big.
+        reader = NotificationLogReader(
+            notification_log, section_size=8, max_section_size=16, max_bytes=9
+        )
+        lengths = [len(n) for n in reader.select(start=1, stop=16)]
+        self.assertEqual(lengths, [8, 4, 2, 1, 1])
+
+        # Check section size is limited by the bounds.
+        reader = NotificationLogReader(
+            notification_log, section_size=100, max_section_size=16
+        )
+        self.assertEqual(reader.section_size, 16)
+
+        # Check the bounds are validated.
+        with self.assertRaises(ValueError):
+            NotificationLogReader(
+                notification_log, min_section_size=20, max_section_size=16
+            )
+
+    def test_select_with_prefetching(self):
+        recorder = SQLiteProcessRecorder(SQLiteDatastore(":memory:"))
+        recorder.create_table()
+        notification_log = CountingNotificationLog(recorder, section_size=5)
+
+        # Check nothing is selected from an empty log.
+        reader = PrefetchingNotificationLogReader(notification_log, section_size=5)
+        self.assertEqual(reader.prefetch_sections, 2)
+        self.assertEqual(list(reader.select(start=1)), [])
+
+        # Write 23 events.
+        originator_id = uuid4()
+        recorder.insert_events([
+            StoredEvent(
+                originator_id=originator_id,
+                originator_version=i,
+                topic="topic",
+                state=b"state",
+            )
+            for i in range(23)
+        ])
+
+        # Check all notifications are selected in order.
+        notifications = list(chain(*reader.select(start=1)))
+        self.assertEqual([n.id for n in notifications], list(range(1, 24)))
+        notifications = list(chain(*reader.select(start=7, stop=18)))
+        self.assertEqual([n.id for n in notifications], list(range(7, 19)))
+
+        # Check no more than 'prefetch_sections' lists are selected ahead.
+        num_threads = active_count()
+        notification_log.select_count = 0
+        selected = reader.select(start=1)
+        self.assertEqual([n.id for n in next(selected)], [1, 2, 3, 4, 5])
+        sleep(0.2)
+        # One list yielded, two lists in the queue, and one waiting to be put.
+        self.assertEqual(notification_log.select_count, 4)
+
+        # Check the background thread stops when the generator is closed.
+        selected.close()
+        self.assertEqual(active_count(), num_threads)
+
+        # Check errors selecting notifications are raised by the generator.
+        reader = PrefetchingNotificationLogReader(notification_log, section_size=10)
+        with self.assertRaises(ValueError):
+            list(reader.select(start=1))
+        self.assertEqual(active_count(), num_threads)
+
+        # Check other base exceptions are also raised by the generator.
+        class StopSelecting(BaseException):
+            pass
+
+        def select(*_, **__):
+            raise StopSelecting
+
+        notification_log.select = select
+        reader = PrefetchingNotificationLogReader(notification_log, section_size=5)
+        with self.assertRaises(StopSelecting):
+            list(reader.select(start=1))
+        self.assertEqual(active_count(), num_threads)
+        del notification_log.select
+
+        # Check prefetch sections is validated.
+        with self.assertRaises(ValueError):
+            PrefetchingNotificationLogReader(notification_log, prefetch_sections=0)
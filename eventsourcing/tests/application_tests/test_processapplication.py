@@ -1,12 +1,19 @@
 from unittest.case import TestCase
+from unittest.mock import patch
+from uuid import NAMESPACE_URL, uuid5
 
-from eventsourcing.application import RecordingEvent
+from eventsourcing.application import (
+    AggregateNotFoundError,
+    LocalNotificationLog,
+    RecordingEvent,
+)
 from eventsourcing.dispatch import singledispatchmethod
-from eventsourcing.domain import AggregateEvent
-from eventsourcing.persistence import Transcoder
+from eventsourcing.domain import Aggregate, AggregateEvent, event
+from eventsourcing.persistence import ProgrammingError, Tracking, Transcoder
 from eventsourcing.system import (
     Follower,
     Leader,
+    PrefetchingNotificationLogReader,
     ProcessApplication,
     ProcessingEvent,
     RecordingEventReceiver,
@@ -71,6 +78,233 @@ class TestProcessApplication(TestCase):
         # Check we have actually processed the second event.
         self.assertEqual(email_process.recorder.max_tracking_id(BankAccounts.name), 2)
 
+    def test_pull_and_process_with_partitions(self):
+        accounts = BankAccounts()
+        email_process = EmailProcess(env={"PROCESSING_PARTITIONS": "3"})
+        self.assertEqual(email_process.processing_partitions, 3)
+        email_process.follow(
+            accounts.name,
+            accounts.notification_log,
+        )
+
+        for i in range(10):
+            accounts.open_account(f"Alice{i}", "alice@example.com")
+
+        email_process.pull_and_process(BankAccounts.name)
+        self.assertEqual(email_process.recorder.max_notification_id(), 10)
+
+        # Check each notification is tracked in its partition.
+        notifications = accounts.recorder.select_notifications(start=1, limit=10)
+        max_tracking_ids = [0, 0, 0]
+        for notification in notifications:
+            domain_event = accounts.mapper.to_domain_event(notification)
+            partition = email_process.partition(domain_event)
+            partition_name = email_process.partition_name(BankAccounts.name, partition)
+            self.assertEqual(partition_name, f"{BankAccounts.name}#{partition}")
+            self.assertTrue(
+                email_process.recorder.has_tracking_id(partition_name, notification.id)
+            )
+            max_tracking_ids[partition] = notification.id
+        # Check the position of the batch is tracked with the leader's name,
+        # so that partitions with nothing to process don't hold it back.
+        self.assertLess(min(max_tracking_ids), 10)
+        self.assertEqual(email_process.recorder.max_tracking_id(BankAccounts.name), 10)
+        self.assertEqual(email_process.tracking_position(BankAccounts.name), 10)
+
+        # Check reprocessing changes nothing (skips processed notifications).
+        email_process.pull_and_process(BankAccounts.name, start=1)
+        self.assertEqual(email_process.recorder.max_notification_id(), 10)
+
+        # Check process_event() also processes in the partition.
+        accounts.open_account("Bob", "bob@example.com")
+        notification = accounts.recorder.select_notifications(start=11, limit=1)[0]
+        domain_event = accounts.mapper.to_domain_event(notification)
+        # Check a single job isn't filtered by querying the tracking position.
+        with patch.object(
+            email_process.recorder, "max_tracking_id", side_effect=AssertionError
+        ):
+            email_process.process_event(
+                domain_event, Tracking(BankAccounts.name, notification.id)
+            )
+        partition_name = email_process.partition_name(
+            BankAccounts.name, email_process.partition(domain_event)
+        )
+        self.assertEqual(email_process.recorder.max_tracking_id(partition_name), 11)
+        self.assertEqual(email_process.recorder.max_notification_id(), 11)
+
+        email_process.close()
+
+        # Check errors raised by the policy in a partition are raised.
+        class BrokenEmailProcess(EmailProcess):
+            def policy(self, domain_event, processing_event):
+                raise ValueError
+
+        broken_process = BrokenEmailProcess(env={"PROCESSING_PARTITIONS": "3"})
+        broken_process.follow(accounts.name, accounts.notification_log)
+        with self.assertRaises(ValueError):
+            broken_process.pull_and_process(BankAccounts.name)
+        broken_process.close()
+
+    def test_pull_and_process_with_batch_processing(self):
+        accounts = BankAccounts()
+        email_process = EmailProcess(env={"IS_BATCH_PROCESSING_ENABLED": "y"})
+        self.assertTrue(email_process.is_batch_processing_enabled)
+        email_process.follow(accounts.name, accounts.notification_log)
+
+        for i in range(5):
+            accounts.open_account(f"Alice{i}", "alice@example.com")
+
+        email_process.pull_and_process(BankAccounts.name)
+        self.assertEqual(email_process.recorder.max_notification_id(), 5)
+
+        # Check only the last tracking object of the batch was recorded.
+        self.assertEqual(email_process.recorder.max_tracking_id(BankAccounts.name), 5)
+        self.assertTrue(email_process.recorder.has_tracking_id(BankAccounts.name, 5))
+        self.assertFalse(email_process.recorder.has_tracking_id(BankAccounts.name, 4))
+
+        # Check reprocessing changes nothing (skips processed notifications).
+        email_process.pull_and_process(BankAccounts.name, start=1)
+        self.assertEqual(email_process.recorder.max_notification_id(), 5)
+
+        # Check process_event() skips processed notifications.
+        notification = accounts.recorder.select_notifications(start=3, limit=1)[0]
+        email_process.process_event(
+            accounts.mapper.to_domain_event(notification),
+            Tracking(BankAccounts.name, notification.id),
+        )
+        self.assertEqual(email_process.recorder.max_notification_id(), 5)
+
+    def test_batch_processing_falls_back_to_processing_one_at_a_time(self):
+        accounts = BankAccounts()
+        counter_process = AccountsCounter(env={"IS_BATCH_PROCESSING_ENABLED": "y"})
+        counter_process.follow(accounts.name, accounts.notification_log)
+
+        for i in range(3):
+            accounts.open_account(f"Alice{i}", "alice@example.com")
+
+        # The policy changes the same aggregate in each call, so the batch
+        # conflicts with itself, and the events are processed one at a time.
+        counter_process.pull_and_process(BankAccounts.name)
+        self.assertEqual(counter_process.get_count(), 3)
+        for notification_id in range(1, 4):
+            self.assertTrue(
+                counter_process.recorder.has_tracking_id(
+                    BankAccounts.name, notification_id
+                )
+            )
+
+    def test_pull_and_process_with_partitions_and_batch_processing(self):
+        accounts = BankAccounts()
+        email_process = EmailProcess(
+            env={"PROCESSING_PARTITIONS": "3", "IS_BATCH_PROCESSING_ENABLED": "y"}
+        )
+        email_process.follow(accounts.name, accounts.notification_log)
+
+        for i in range(10):
+            accounts.open_account(f"Alice{i}", "alice@example.com")
+
+        email_process.pull_and_process(BankAccounts.name)
+        self.assertEqual(email_process.recorder.max_notification_id(), 10)
+
+        email_process.pull_and_process(BankAccounts.name, start=1)
+        self.assertEqual(email_process.recorder.max_notification_id(), 10)
+        email_process.close()
+
+    def test_pull_and_process_with_adaptive_section_size(self):
+        accounts = BankAccounts()
+        email_process = EmailProcess(
+            env={"PULL_SECTION_SIZE_MIN": "5", "PULL_SECTION_SIZE_MAX": "40"}
+        )
+        email_process.follow(accounts.name, accounts.notification_log)
+        reader = email_process.readers[accounts.name]
+        self.assertEqual(reader.min_section_size, 5)
+        self.assertEqual(reader.max_section_size, 40)
+        self.assertEqual(reader.section_size, 10)
+
+        # Check the leader's log section size doesn't limit the reader.
+        self.assertEqual(accounts.notification_log.section_size, 10)
+        self.assertEqual(reader.notification_log.section_size, 40)
+
+        # Check the type of the leader's log is kept.
+        class MyNotificationLog(LocalNotificationLog):
+            pass
+
+        log = MyNotificationLog(accounts.recorder, section_size=10)
+        email_process.follow("other", log)
+        self.assertIsInstance(
+            email_process.readers["other"].notification_log, MyNotificationLog
+        )
+        self.assertEqual(log.section_size, 10)
+
+        for i in range(50):
+            accounts.open_account(f"Alice{i}", "alice@example.com")
+
+        email_process.pull_and_process(BankAccounts.name)
+        self.assertEqual(email_process.recorder.max_notification_id(), 50)
+        self.assertEqual(reader.section_size, 40)
+
+    def test_pull_and_process_with_prefetching(self):
+        accounts = BankAccounts()
+        email_process = EmailProcess(env={"PULL_PREFETCH_SECTIONS": "3"})
+        email_process.follow(accounts.name, accounts.notification_log)
+        reader = email_process.readers[accounts.name]
+        self.assertIsInstance(reader, PrefetchingNotificationLogReader)
+        self.assertEqual(reader.prefetch_sections, 3)
+
+        for i in range(35):
+            accounts.open_account(f"Alice{i}", "alice@example.com")
+
+        email_process.pull_and_process(BankAccounts.name)
+        self.assertEqual(email_process.recorder.max_notification_id(), 35)
+        self.assertEqual(email_process.recorder.max_tracking_id(accounts.name), 35)
+
+        # Check readers don't prefetch by default.
+        email_process = EmailProcess()
+        email_process.follow(accounts.name, accounts.notification_log)
+        reader = email_process.readers[accounts.name]
+        self.assertNotIsInstance(reader, PrefetchingNotificationLogReader)
+
+    def test_number_of_processing_partitions_can_not_be_changed(self):
+        accounts = BankAccounts()
+        env = {
+            "PERSISTENCE_MODULE": "eventsourcing.sqlite",
+            "SQLITE_DBNAME": "file:partitions?mode=memory&cache=shared",
+        }
+
+        # Process without partitions.
+        email_process1 = EmailProcess(env=env)
+        email_process1.follow(accounts.name, accounts.notification_log)
+        for i in range(5):
+            accounts.open_account(f"Alice{i}", "alice@example.com")
+        email_process1.pull_and_process(BankAccounts.name)
+
+        # Check processing can be resumed in partitions.
+        email_process2 = EmailProcess(env={**env, "PROCESSING_PARTITIONS": "3"})
+        email_process2.follow(accounts.name, accounts.notification_log)
+        self.assertEqual(email_process2.tracking_position(BankAccounts.name), 5)
+        for i in range(5):
+            accounts.open_account(f"Bob{i}", "bob@example.com")
+        email_process2.pull_and_process(BankAccounts.name)
+        self.assertEqual(email_process2.recorder.max_notification_id(), 10)
+        self.assertEqual(email_process2.tracking_position(BankAccounts.name), 10)
+
+        # Check the number of partitions can't then be changed.
+        email_process3 = EmailProcess(env={**env, "PROCESSING_PARTITIONS": "2"})
+        email_process3.follow(accounts.name, accounts.notification_log)
+        with self.assertRaises(ProgrammingError):
+            email_process3.pull_and_process(BankAccounts.name)
+        email_process4 = EmailProcess(env=env)
+        email_process4.follow(accounts.name, accounts.notification_log)
+        with self.assertRaises(ProgrammingError):
+            email_process4.pull_and_process(BankAccounts.name)
+
+        for app in [email_process1, email_process2, email_process3, email_process4]:
+            app.close()
+
+    def test_processing_partitions_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            EmailProcess(env={"PROCESSING_PARTITIONS": "0"})
+
 
 class EmailProcess(ProcessApplication):
     def register_transcodings(self, transcoder: Transcoder) -> None:
@@ -99,6 +333,51 @@ class EmailProcess(ProcessApplication):
         processing_event.collect_events(notification)
 
 
+class AccountsCounter(ProcessApplication):
+    counter_id = uuid5(NAMESPACE_URL, "/counters/accounts")
+
+    def register_transcodings(self, transcoder: Transcoder) -> None:
+        super().register_transcodings(transcoder)
+        transcoder.register(EmailAddressAsStr())
+
+    @singledispatchmethod
+    def policy(
+        self,
+        domain_event: AggregateEvent,
+        processing_event: ProcessingEvent,
+    ):
+        """Default policy"""
+
+    @policy.register
+    def _(
+        self,
+        domain_event: BankAccount.Opened,
+        processing_event: ProcessingEvent,
+    ):
+        try:
+            counter = self.repository.get(self.counter_id)
+        except AggregateNotFoundError:
+            counter = Counter()
+        counter.increment()
+        processing_event.collect_events(counter)
+
+    def get_count(self) -> int:
+        return self.repository.get(self.counter_id).count
+
+
+class Counter(Aggregate):
+    def __init__(self):
+        self.count = 0
+
+    @staticmethod
+    def create_id():
+        return AccountsCounter.counter_id
+
+    @event("Incremented")
+    def increment(self):
+        self.count += 1
+
+
 class PromptForwarder(RecordingEventReceiver):
     def __init__(self, application: Follower):
         self.application = application
@@ -446,6 +446,73 @@ class TestRepository(TestCase):
         with self.assertRaises(AggregateNotFoundError):
             repository.get(aggregate.id, projector_func=lambda _, __: None)
 
+    def test_get_many(self):
+        transcoder = JSONTranscoder()
+        transcoder.register(UUIDAsHex())
+        transcoder.register(DecimalAsStr())
+        transcoder.register(DatetimeAsISO())
+
+        event_recorder = SQLiteAggregateRecorder(SQLiteDatastore(":memory:"))
+        event_recorder.create_table()
+        event_store = EventStore(
+            mapper=Mapper(transcoder=transcoder),
+            recorder=event_recorder,
+        )
+        snapshot_recorder = SQLiteAggregateRecorder(
+            SQLiteDatastore(":memory:"), events_table_name="snapshots"
+        )
+        snapshot_recorder.create_table()
+        snapshot_store = EventStore(
+            mapper=Mapper(transcoder=transcoder),
+            recorder=snapshot_recorder,
+        )
+
+        # Write some aggregates, and take a snapshot of one of them.
+        aggregate1 = Aggregate()
+        aggregate2 = Aggregate()
+        aggregate2.trigger_event(Aggregate.Event)
+        event_store.put(aggregate1.collect_events() + aggregate2.collect_events())
+        snapshot_store.put([Snapshot.take(aggregate2)])
+        aggregate2.trigger_event(Aggregate.Event)
+        event_store.put(aggregate2.collect_events())
+
+        for cache_maxsize in [None, 10]:
+            repository = Repository(
+                event_store,
+                snapshot_store=snapshot_store,
+                cache_maxsize=cache_maxsize,
+            )
+
+            # Get nothing.
+            self.assertEqual(repository.get_many([]), [])
+
+            # Get aggregates in order of given IDs.
+            aggregates = repository.get_many([aggregate2.id, aggregate1.id])
+            self.assertEqual(aggregates, [aggregate2, aggregate1])
+
+            # Get aggregates twice, with one of them now in the cache.
+            aggregates = repository.get_many([aggregate1.id, aggregate2.id])
+            self.assertEqual(aggregates, [aggregate1, aggregate2])
+            self.assertIsNot(aggregates[0], aggregate1)
+
+            # Check cached aggregates are fast-forwarded.
+            aggregate1.trigger_event(Aggregate.Event)
+            event_store.put(aggregate1.collect_events())
+            aggregates = repository.get_many([aggregate1.id, aggregate2.id])
+            self.assertEqual(aggregates[0].version, aggregate1.version)
+            self.assertEqual(aggregates, [aggregate1, aggregate2])
+
+            # Check cached aggregates are copied.
+            if cache_maxsize:
+                self.assertIsNot(
+                    repository.get_many([aggregate1.id])[0],
+                    repository.get_many([aggregate1.id])[0],
+                )
+
+            # Check aggregate not found error is raised for unknown IDs.
+            with self.assertRaises(AggregateNotFoundError):
+                repository.get_many([aggregate1.id, uuid4()])
+
     def test_fastforward_lock(self):
         repository = Repository(
             EventStore(
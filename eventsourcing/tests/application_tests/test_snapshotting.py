@@ -1,7 +1,7 @@
 from decimal import Decimal
 from unittest import TestCase
 
-from eventsourcing.domain import Snapshot
+from eventsourcing.domain import DeltaSnapshot, ProgrammingError, Snapshot
 from eventsourcing.persistence import (
     DatetimeAsISO,
     DecimalAsStr,
@@ -66,3 +66,53 @@ class TestSnapshotting(TestCase):
         # Check copy has correct attribute values.
         assert copy.id == account.id
         assert copy.balance == Decimal("65.00")
+
+    def test_delta_snapshots(self):
+        account = BankAccount.open(
+            full_name="Alice",
+            email_address="alice@example.com",
+        )
+        account.append_transaction(Decimal("10.00"))
+
+        # Without a base snapshot, a base snapshot is taken.
+        base = DeltaSnapshot.take(account)
+        self.assertFalse(base.is_delta)
+        self.assertEqual(base.base_version, 2)
+        self.assertEqual(base.state, Snapshot.take(account).state)
+
+        # With a base snapshot, only changed attributes are included.
+        account.append_transaction(Decimal("25.00"))
+        account.foo = "bar"
+        del account.is_closed
+        delta = DeltaSnapshot.take(account, base=base)
+        self.assertTrue(delta.is_delta)
+        self.assertEqual(delta.base_version, 2)
+        self.assertEqual(delta.originator_version, 3)
+        self.assertEqual(set(delta.state), {"balance", "foo", "_modified_on"})
+        self.assertEqual(delta.deleted, ["is_closed"])
+
+        # Delta snapshots must be composed with their base snapshot.
+        with self.assertRaises(ProgrammingError):
+            delta.mutate(None)
+        with self.assertRaises(ProgrammingError):
+            delta.compose(delta)
+        composed = delta.compose(base)
+        self.assertFalse(composed.is_delta)
+        copy = composed.mutate(None)
+        self.assertEqual(copy.version, 3)
+        self.assertEqual(copy.balance, Decimal("35.00"))
+        self.assertEqual(copy.foo, "bar")
+        self.assertFalse(hasattr(copy, "is_closed"))
+        self.assertEqual(copy.full_name, "Alice")
+
+        # A new base snapshot is taken after the rebasing interval.
+        class MyDeltaSnapshot(DeltaSnapshot):
+            rebasing_interval = 2
+
+        account.is_closed = False
+        account.append_transaction(Decimal("30.00"))
+        self.assertFalse(MyDeltaSnapshot.take(account, base=base).is_delta)
+        self.assertTrue(DeltaSnapshot.take(account, base=base).is_delta)
+
+        # A delta snapshot can't be taken from a delta snapshot.
+        self.assertFalse(DeltaSnapshot.take(account, base=delta).is_delta)
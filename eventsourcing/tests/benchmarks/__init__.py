@@ -0,0 +1,145 @@
+"""
+Repeatable benchmarks of the library's hot paths.
+
+Run all the benchmarks, and save the results as JSON::
+
+    $ python -m eventsourcing.tests.benchmarks --output benchmarks.json
+
+Run the benchmarks again, for example after an upgrade, and compare
+the results with the saved results::
+
+    $ python -m eventsourcing.tests.benchmarks --compare benchmarks.json
+
+The benchmarks that use PostgreSQL are skipped if a database can't
+be connected to with the same environment variables that configure
+the PostgreSQL module (defaults are the same as the library's tests).
+"""
+
+from __future__ import annotations
+
+import platform
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from statistics import mean, median
+from timeit import Timer
+from typing import Any, Callable, ContextManager, Dict, Iterator, Sequence
+
+from eventsourcing import __version__
+
+Operation = Callable[[], Any]
+
+
+class BenchmarkSkippedError(Exception):
+    """
+    Raised by a scenario that can't be run in the current environment.
+    """
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """
+    A named scenario, which is a context manager that sets up and tears
+    down whatever is needed to repeatedly call the operation it provides.
+    """
+
+    name: str
+    scenario: Callable[[], ContextManager[Operation]]
+    number: int
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str, number: int = 100
+) -> Callable[[Callable[[], Iterator[Operation]]], Callable[[], Iterator[Operation]]]:
+    """
+    Registers a generator function, which yields an operation, as a
+    benchmark scenario. The operation will be called 'number' times in
+    each round of timings, unless another number is given when running.
+    """
+
+    def decorator(
+        scenario: Callable[[], Iterator[Operation]],
+    ) -> Callable[[], Iterator[Operation]]:
+        if name in BENCHMARKS:
+            msg = f"Benchmark already registered: {name}"
+            raise ValueError(msg)
+        BENCHMARKS[name] = Benchmark(name, contextmanager(scenario), number)
+        return scenario
+
+    return decorator
+
+
+def run_benchmark(
+    bm: Benchmark, number: int | None = None, repeat: int = 5
+) -> Dict[str, Any]:
+    """
+    Times the operation of a benchmark scenario, after a warm up, in 'repeat'
+    rounds of 'number' calls, and returns the durations per call in seconds.
+    """
+    number = number or bm.number
+    try:
+        with bm.scenario() as operation:
+            timer = Timer(operation)
+            timer.timeit(max(1, number // 10))
+            durations = [t / number for t in timer.repeat(repeat, number)]
+    except BenchmarkSkippedError as e:
+        return {"skipped": str(e)}
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min": min(durations),
+        "median": median(durations),
+        "mean": mean(durations),
+        "ops_per_second": 1 / min(durations),
+    }
+
+
+def run_benchmarks(
+    names: Sequence[str] = (),
+    number: int | None = None,
+    repeat: int = 5,
+    report: Callable[[str, Dict[str, Any]], None] | None = None,
+) -> Dict[str, Any]:
+    """
+    Runs the registered benchmarks whose names contain any of the given
+    names, or all the registered benchmarks if no names are given. Returns
+    a JSON-serializable dict with the results and details of the platform.
+    """
+    # Register the library's benchmark scenarios.
+    import eventsourcing.tests.benchmarks.scenarios  # noqa: F401
+
+    results: Dict[str, Any] = {}
+    for name, bm in BENCHMARKS.items():
+        if names and not any(n in name for n in names):
+            continue
+        results[name] = run_benchmark(bm, number=number, repeat=repeat)
+        if report is not None:
+            report(name, results[name])
+    return {
+        "created_at": datetime.now(tz=timezone.utc).isoformat(),
+        "eventsourcing_version": __version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": results,
+    }
+
+
+def compare_results(
+    baseline: Dict[str, Any], results: Dict[str, Any], threshold: float = 0.1
+) -> Dict[str, float]:
+    """
+    Returns the ratio of the current to the baseline minimum duration per call
+    of each benchmark that is more than 'threshold' slower than the baseline.
+    """
+    regressions: Dict[str, float] = {}
+    for name, result in results["benchmarks"].items():
+        baseline_result = baseline["benchmarks"].get(name)
+        if not baseline_result or "min" not in baseline_result or "min" not in result:
+            continue
+        ratio = result["min"] / baseline_result["min"]
+        if ratio > 1 + threshold:
+            regressions[name] = ratio
+    return regressions
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import json
+import sys
+from argparse import ArgumentParser
+from typing import Any, Dict, List
+
+from eventsourcing.tests.benchmarks import compare_results, run_benchmarks
+
+
+def report(name: str, result: Dict[str, Any]) -> None:
+    if "skipped" in result:
+        print(f"{name:<48} skipped: {result['skipped']}")
+    else:
+        print(
+            f"{name:<48} {1000000 * result['min']:10.1f} μs per call, "
+            f"{result['ops_per_second']:10.0f} calls per second"
+        )
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = ArgumentParser(
+        prog="python -m eventsourcing.tests.benchmarks",
+        description="Runs the library's benchmarks.",
+    )
+    parser.add_argument(
+        "names",
+        nargs="*",
+        help="only run benchmarks with names that contain any of these strings",
+    )
+    parser.add_argument(
+        "--number", type=int, help="number of calls in each round of timings"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="number of rounds of timings"
+    )
+    parser.add_argument("--output", help="path of file to write results as JSON")
+    parser.add_argument("--compare", help="path of file with baseline results")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="fraction by which a benchmark may be slower than the baseline",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        args.names, number=args.number, repeat=args.repeat, report=report
+    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare_results(baseline, results, threshold=args.threshold)
+        for name, ratio in regressions.items():
+            print(f"{name} is {ratio:.2f} times slower than baseline")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
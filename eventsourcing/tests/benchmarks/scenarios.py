@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from decimal import Decimal
+from functools import lru_cache, partial
+from tempfile import TemporaryDirectory
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, Dict, Iterator, Type
+
+from eventsourcing.persistence import PersistenceError
+from eventsourcing.system import (
+    MultiProcessRunner,
+    MultiThreadedRunner,
+    NewMultiThreadedRunner,
+    NewSingleThreadedRunner,
+    Runner,
+    SingleThreadedRunner,
+    System,
+)
+from eventsourcing.tests.application import BankAccounts
+from eventsourcing.tests.application_tests.test_processapplication import EmailProcess
+from eventsourcing.tests.benchmarks import (
+    BenchmarkSkippedError,
+    Operation,
+    benchmark,
+)
+
+if TYPE_CHECKING:  # pragma: nocover
+    from eventsourcing.application import Application
+    from eventsourcing.system import Follower
+
+NUM_CREDITS = 100
+
+POSTGRES_ENV = {
+    "POSTGRES_DBNAME": "eventsourcing",
+    "POSTGRES_HOST": "127.0.0.1",
+    "POSTGRES_PORT": "5432",
+    "POSTGRES_USER": "eventsourcing",
+    "POSTGRES_PASSWORD": "eventsourcing",
+}
+
+MAPPER_ENVS: Dict[str, Dict[str, str]] = {
+    "json": {},
+    "msgpack": {"TRANSCODER_TOPIC": "eventsourcing.msgpack:MsgPackTranscoder"},
+    "zlib": {"COMPRESSOR_TOPIC": "eventsourcing.compressor:ZlibCompressor"},
+    "aes": {"CIPHER_TOPIC": "eventsourcing.cipher:AESCipher"},
+    "zlib+aes": {
+        "COMPRESSOR_TOPIC": "eventsourcing.compressor:ZlibCompressor",
+        "CIPHER_TOPIC": "eventsourcing.cipher:AESCipher",
+    },
+}
+
+RUNNER_CLASSES = [
+    SingleThreadedRunner,
+    NewSingleThreadedRunner,
+    MultiThreadedRunner,
+    NewMultiThreadedRunner,
+    MultiProcessRunner,
+]
+
+
+class BenchmarkAccounts(BankAccounts):
+    is_snapshotting_enabled = False
+
+
+def _postgres_env() -> Dict[str, str]:
+    env = {key: os.environ.get(key, value) for key, value in POSTGRES_ENV.items()}
+    error = _check_postgres(**env)
+    if error:
+        raise BenchmarkSkippedError(error)
+    return env
+
+
+@lru_cache(maxsize=None)
+def _check_postgres(**env: str) -> str:
+    # Only try to connect once, since failing to connect takes a while.
+    try:
+        from eventsourcing.postgres import PostgresDatastore
+    except ImportError as e:
+        return str(e)
+    datastore = PostgresDatastore(
+        env["POSTGRES_DBNAME"],
+        env["POSTGRES_HOST"],
+        env["POSTGRES_PORT"],
+        env["POSTGRES_USER"],
+        env["POSTGRES_PASSWORD"],
+    )
+    try:
+        with datastore.transaction(commit=False) as curs:
+            curs.execute("SELECT 1")
+    except PersistenceError as e:
+        return f"Couldn't connect to PostgreSQL: {e}"
+    finally:
+        datastore.close()
+    return ""
+
+
+def _drop_postgres_tables(env: Dict[str, str]) -> None:
+    from eventsourcing.postgres import PostgresDatastore
+    from eventsourcing.tests.postgres_utils import drop_postgres_table
+
+    datastore = PostgresDatastore(
+        env["POSTGRES_DBNAME"],
+        env["POSTGRES_HOST"],
+        env["POSTGRES_PORT"],
+        env["POSTGRES_USER"],
+        env["POSTGRES_PASSWORD"],
+    )
+    drop_postgres_table(datastore, "benchmarkaccounts_events")
+    drop_postgres_table(datastore, "benchmarkaccounts_snapshots")
+    datastore.close()
+
+
+@contextmanager
+def _persistence_env(persistence_module: str) -> Iterator[Dict[str, str]]:
+    if persistence_module == "popo":
+        yield {"PERSISTENCE_MODULE": "eventsourcing.popo"}
+    elif persistence_module == "sqlite":
+        with TemporaryDirectory() as dirname:
+            yield {
+                "PERSISTENCE_MODULE": "eventsourcing.sqlite",
+                "SQLITE_DBNAME": os.path.join(dirname, "benchmarks.db"),
+            }
+    else:
+        env = dict(_postgres_env())
+        env["PERSISTENCE_MODULE"] = "eventsourcing.postgres"
+        _drop_postgres_tables(env)
+        try:
+            yield env
+        finally:
+            _drop_postgres_tables(env)
+
+
+@contextmanager
+def _application(
+    persistence_module: str, env: Dict[str, str] | None = None
+) -> Iterator[BenchmarkAccounts]:
+    with _persistence_env(persistence_module) as app_env:
+        app_env.update(env or {})
+        app = BenchmarkAccounts(env=app_env)
+        try:
+            yield app
+        finally:
+            app.close()
+
+
+def save_account(persistence_module: str) -> Iterator[Operation]:
+    with _application(persistence_module) as app:
+        yield partial(app.open_account, "Alice", "alice@example.com")
+
+
+def get_account(persistence_module: str, env: Dict[str, str]) -> Iterator[Operation]:
+    with _application(persistence_module, env) as app:
+        account_id = app.open_account("Alice", "alice@example.com")
+        for _ in range(NUM_CREDITS):
+            app.credit_account(account_id, Decimal("1.00"))
+        if app.snapshots is not None:
+            app.take_snapshot(account_id)
+        yield partial(app.get_account, account_id)
+
+
+def save_and_get_account(env: Dict[str, str]) -> Iterator[Operation]:
+    env = dict(env)
+    try:
+        if "TRANSCODER_TOPIC" in env:
+            import eventsourcing.msgpack  # noqa: F401
+        if "CIPHER_TOPIC" in env:
+            from eventsourcing.cipher import AESCipher
+
+            env["CIPHER_KEY"] = AESCipher.create_key(16)
+    except ImportError as e:
+        raise BenchmarkSkippedError(str(e)) from e
+
+    with _application("popo", env) as app:
+
+        def operation() -> None:
+            app.get_account(app.open_account("Alice", "alice@example.com"))
+
+        yield operation
+
+
+def _wait_until_processed(
+    leader: Application, follower: Follower, timeout: float = 10.0
+) -> None:
+    max_notification_id = leader.recorder.max_notification_id()
+    deadline = monotonic() + timeout
+    while follower.recorder.max_tracking_id(leader.name) < max_notification_id:
+        if monotonic() > deadline:
+            msg = f"Timed out waiting for {follower.name} to process {leader.name}"
+            raise TimeoutError(msg)
+        sleep(0.0001)
+
+
+@contextmanager
+def _runner_env(runner_class: Type[Runner]) -> Iterator[Dict[str, str]]:
+    if not issubclass(runner_class, MultiProcessRunner):
+        yield {"PERSISTENCE_MODULE": "eventsourcing.popo"}
+        return
+    # Worker processes need a database that is shared between processes.
+    with TemporaryDirectory() as dirname:
+        env = {"PERSISTENCE_MODULE": "eventsourcing.sqlite"}
+        for app_class in [BenchmarkAccounts, EmailProcess]:
+            env[f"{app_class.name.upper()}_SQLITE_DBNAME"] = os.path.join(
+                dirname, f"{app_class.name.lower()}.db"
+            )
+        yield env
+
+
+def run_system(runner_class: Type[Runner]) -> Iterator[Operation]:
+    with _runner_env(runner_class) as env:
+        runner = runner_class(
+            System(pipes=[[BenchmarkAccounts, EmailProcess]]), env=env
+        )
+        runner.start()
+        try:
+            accounts = runner.get(BenchmarkAccounts)
+            emails = runner.get(EmailProcess)
+
+            def operation() -> None:
+                for _ in range(10):
+                    accounts.open_account("Alice", "alice@example.com")
+                _wait_until_processed(accounts, emails)
+
+            yield operation
+        finally:
+            runner.stop()
+
+
+for _module in ["popo", "sqlite", "postgres"]:
+    benchmark(f"application.save[{_module}]")(partial(save_account, _module))
+    benchmark(f"application.get[{_module}]")(partial(get_account, _module, {}))
+    benchmark(f"application.get.snapshot[{_module}]")(
+        partial(get_account, _module, {"IS_SNAPSHOTTING_ENABLED": "y"})
+    )
+    benchmark(f"application.get.cache[{_module}]")(
+        partial(get_account, _module, {"AGGREGATE_CACHE_MAXSIZE": "100"})
+    )
+
+for _name, _env in MAPPER_ENVS.items():
+    benchmark(f"application.save_and_get[{_name}]")(partial(save_and_get_account, _env))
+
+for _runner_class in RUNNER_CLASSES:
+    benchmark(f"runner.throughput[{_runner_class.__name__}]", number=10)(
+        partial(run_system, _runner_class)
+    )
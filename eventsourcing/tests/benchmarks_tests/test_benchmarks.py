@@ -0,0 +1,109 @@
+import json
+import os
+from contextlib import redirect_stdout
+from io import StringIO
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from eventsourcing.tests.benchmarks import (
+    BENCHMARKS,
+    BenchmarkSkippedError,
+    benchmark,
+    compare_results,
+    run_benchmark,
+    run_benchmarks,
+)
+from eventsourcing.tests.benchmarks.__main__ import main
+
+
+class TestBenchmarks(TestCase):
+    def test_run_benchmark(self):
+        calls = []
+
+        @benchmark("test.run_benchmark", number=3)
+        def scenario():
+            calls.append("setup")
+            yield lambda: calls.append("call")
+            calls.append("teardown")
+
+        self.addCleanup(BENCHMARKS.pop, "test.run_benchmark")
+
+        result = run_benchmark(BENCHMARKS["test.run_benchmark"], repeat=2)
+        self.assertEqual(result["number"], 3)
+        self.assertEqual(result["repeat"], 2)
+        self.assertLessEqual(result["min"], result["median"])
+        self.assertEqual(result["ops_per_second"], 1 / result["min"])
+        self.assertEqual(calls, ["setup"] + ["call"] * 7 + ["teardown"])
+
+        # Check names are unique.
+        with self.assertRaises(ValueError):
+            benchmark("test.run_benchmark")(scenario)
+
+    def test_skipped_benchmark(self):
+        @benchmark("test.skipped_benchmark")
+        def scenario():
+            msg = "Not available"
+            raise BenchmarkSkippedError(msg)
+            yield
+
+        self.addCleanup(BENCHMARKS.pop, "test.skipped_benchmark")
+
+        result = run_benchmark(BENCHMARKS["test.skipped_benchmark"])
+        self.assertEqual(result, {"skipped": "Not available"})
+
+    def test_run_benchmarks(self):
+        results = run_benchmarks(number=1, repeat=1)
+        self.assertEqual(list(results["benchmarks"]), list(BENCHMARKS))
+        for name, result in results["benchmarks"].items():
+            self.assertTrue("min" in result or "skipped" in result, name)
+        self.assertEqual(json.loads(json.dumps(results)), results)
+
+        # Check benchmarks can be selected by name.
+        results = run_benchmarks(["[popo]", "[json]"], number=1, repeat=1)
+        self.assertEqual(
+            sorted(results["benchmarks"]),
+            [
+                "application.get.cache[popo]",
+                "application.get.snapshot[popo]",
+                "application.get[popo]",
+                "application.save[popo]",
+                "application.save_and_get[json]",
+            ],
+        )
+
+    def test_compare_results(self):
+        baseline = {
+            "benchmarks": {
+                "a": {"min": 1.0},
+                "b": {"min": 1.0},
+                "c": {"skipped": "Not available"},
+            }
+        }
+        results = {
+            "benchmarks": {
+                "a": {"min": 1.05},
+                "b": {"min": 1.5},
+                "c": {"min": 1.0},
+                "d": {"min": 1.0},
+            }
+        }
+        self.assertEqual(compare_results(baseline, results), {"b": 1.5})
+        self.assertEqual(compare_results(baseline, results, threshold=0.6), {})
+
+    def test_main(self):
+        with TemporaryDirectory() as dirname:
+            path = os.path.join(dirname, "benchmarks.json")
+            args = ["application.save[popo]", "--number=2", "--repeat=1"]
+            with redirect_stdout(StringIO()) as stdout:
+                self.assertEqual(main([*args, f"--output={path}"]), 0)
+            self.assertIn("application.save[popo]", stdout.getvalue())
+
+            # Check a regression is detected.
+            with open(path) as f:
+                baseline = json.load(f)
+            baseline["benchmarks"]["application.save[popo]"]["min"] /= 100
+            with open(path, "w") as f:
+                json.dump(baseline, f)
+            with redirect_stdout(StringIO()) as stdout:
+                self.assertEqual(main([*args, f"--compare={path}"]), 1)
+            self.assertIn("times slower than baseline", stdout.getvalue())
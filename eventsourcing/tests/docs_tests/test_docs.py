@@ -65,6 +65,7 @@ class TestDocs(TestCase):
             "CIPHER_KEY",
             "COMPRESSOR_TOPIC",
             "AGGREGATE_CACHE_MAXSIZE",
+            "AGGREGATE_CACHE_MAXBYTES",
         ]
         for key in keys:
             with contextlib.suppress(KeyError):
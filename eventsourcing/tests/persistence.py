@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import traceback
 import zlib
@@ -10,8 +11,8 @@ from tempfile import NamedTemporaryFile
 from threading import Event, Thread, get_ident
 from time import sleep
 from timeit import timeit
-from typing import Any, Dict, List
-from unittest import TestCase
+from typing import Any, Dict, List, Sequence
+from unittest import IsolatedAsyncioTestCase, TestCase
 from uuid import UUID, uuid4
 
 from eventsourcing.cipher import AESCipher
@@ -20,6 +21,8 @@ from eventsourcing.domain import DomainEvent
 from eventsourcing.persistence import (
     AggregateRecorder,
     ApplicationRecorder,
+    AsyncAggregateRecorder,
+    AsyncApplicationRecorder,
     DatetimeAsISO,
     DecimalAsStr,
     InfrastructureFactory,
@@ -176,6 +179,241 @@ class AggregateRecorderTestCase(TestCase, ABC):
             [stored_event4],
         )
 
+    def test_iter_events(self) -> None:
+        # Construct the recorder.
+        recorder = self.create_recorder()
+
+        # Iterate over stored events, expect nothing.
+        originator_id = uuid4()
+        self.assertEqual(list(recorder.iter_events(originator_id, page_size=2)), [])
+
+        # Write some stored events.
+        stored_events = [
+            StoredEvent(
+                originator_id=originator_id,
+                originator_version=self.INITIAL_VERSION + i,
+                topic=f"topic{i}",
+                state=f"state{i}".encode(),
+            )
+            for i in range(5)
+        ]
+        recorder.insert_events(stored_events)
+
+        # Check we get the same as from select_events() with any page size.
+        for page_size in [1, 2, 3, 5, 6]:
+            for kwargs in [
+                {},
+                {"desc": True},
+                {"gt": self.INITIAL_VERSION},
+                {"lte": self.INITIAL_VERSION + 3},
+                {"limit": 3},
+                {"desc": True, "limit": 4},
+                {"gt": self.INITIAL_VERSION, "lte": self.INITIAL_VERSION + 3},
+                {"desc": True, "lte": self.INITIAL_VERSION + 3, "limit": 2},
+            ]:
+                self.assertEqual(
+                    list(
+                        recorder.iter_events(
+                            originator_id, page_size=page_size, **kwargs
+                        )
+                    ),
+                    recorder.select_events(originator_id, **kwargs),
+                    (page_size, kwargs),
+                )
+
+        # Check we can write whilst iterating, and stop part way through.
+        events_iter = recorder.iter_events(originator_id, page_size=2)
+        self.assertEqual(next(events_iter), stored_events[0])
+        recorder.insert_events([
+            StoredEvent(
+                originator_id=uuid4(),
+                originator_version=self.INITIAL_VERSION,
+                topic="topic",
+                state=b"state",
+            )
+        ])
+        self.assertEqual(list(events_iter), stored_events[1:])
+        events_iter.close()
+
+        # Check page size must be positive.
+        with self.assertRaises(ValueError):
+            list(recorder.iter_events(originator_id, page_size=0))
+
+    def test_select_events_many(self) -> None:
+        # Construct the recorder.
+        recorder = self.create_recorder()
+
+        # Select events of no aggregates.
+        self.assertEqual(recorder.select_events_many([]), {})
+
+        # Write some stored events for two aggregates.
+        originator_id1 = uuid4()
+        originator_id2 = uuid4()
+        originator_id3 = uuid4()
+        recorder.insert_events([
+            StoredEvent(
+                originator_id=originator_id,
+                originator_version=self.INITIAL_VERSION + i,
+                topic=f"topic{i}",
+                state=f"state{i}".encode(),
+            )
+            for originator_id in [originator_id1, originator_id2]
+            for i in range(4)
+        ])
+        originator_ids = [originator_id1, originator_id2, originator_id3]
+
+        # Check we get the same as from select_events() for each aggregate.
+        for gt_versions in [
+            None,
+            {},
+            {originator_id1: self.INITIAL_VERSION},
+            {
+                originator_id1: self.INITIAL_VERSION + 1,
+                originator_id2: self.INITIAL_VERSION + 3,
+                originator_id3: self.INITIAL_VERSION,
+            },
+        ]:
+            for kwargs in [
+                {},
+                {"desc": True},
+                {"limit": 2},
+                {"desc": True, "limit": 1},
+            ]:
+                events = recorder.select_events_many(
+                    originator_ids, gt_versions=gt_versions, **kwargs
+                )
+                self.assertEqual(list(events), originator_ids)
+                for originator_id in originator_ids:
+                    self.assertEqual(
+                        events[originator_id],
+                        recorder.select_events(
+                            originator_id,
+                            gt=(gt_versions or {}).get(originator_id),
+                            **kwargs,
+                        ),
+                        (gt_versions, kwargs),
+                    )
+
+    def test_bulk_insert_events(self) -> None:
+        # Construct the recorder.
+        recorder = self.create_recorder()
+
+        # Write many stored events from a generator.
+        originator_id1 = uuid4()
+        originator_id2 = uuid4()
+        stored_events = [
+            StoredEvent(
+                originator_id=originator_id,
+                originator_version=self.INITIAL_VERSION + i,
+                topic=f"topic{i}",
+                state=f"state{i}".encode(),
+            )
+            for originator_id in [originator_id1, originator_id2]
+            for i in range(100)
+        ]
+        recorder.bulk_insert_events(s for s in stored_events)
+
+        # Check the stored events were recorded.
+        self.assertEqual(recorder.select_events(originator_id1), stored_events[:100])
+        self.assertEqual(recorder.select_events(originator_id2), stored_events[100:])
+
+        # Check nothing is recorded if a stored event conflicts.
+        originator_id3 = uuid4()
+        stored_event = StoredEvent(
+            originator_id=originator_id3,
+            originator_version=self.INITIAL_VERSION,
+            topic="topic1",
+            state=b"state1",
+        )
+        with self.assertRaises(IntegrityError):
+            recorder.bulk_insert_events([stored_event, stored_events[0]])
+        self.assertEqual(recorder.select_events(originator_id3), [])
+
+        # Check writing no stored events is okay.
+        recorder.bulk_insert_events([])
+
+    def test_delete_events(self) -> None:
+        # Construct the recorder.
+        recorder = self.create_recorder()
+
+        # Write some stored events for two aggregates.
+        originator_id1 = uuid4()
+        originator_id2 = uuid4()
+        stored_events = [
+            StoredEvent(
+                originator_id=originator_id,
+                originator_version=self.INITIAL_VERSION + i,
+                topic=f"topic{i}",
+                state=f"state{i}".encode(),
+            )
+            for originator_id in [originator_id1, originator_id2]
+            for i in range(6)
+        ]
+        recorder.insert_events(stored_events)
+
+        # Delete stored events with versions less than a given version.
+        recorder.delete_events(originator_id1, lt=self.INITIAL_VERSION + 1)
+        self.assertEqual(recorder.select_events(originator_id1), stored_events[1:6])
+
+        # Delete all except the last stored events.
+        recorder.delete_events(originator_id1, keep=4)
+        self.assertEqual(recorder.select_events(originator_id1), stored_events[2:6])
+
+        # Delete all except the last stored events with versions less than lt.
+        recorder.delete_events(originator_id1, lt=self.INITIAL_VERSION + 4, keep=1)
+        self.assertEqual(recorder.select_events(originator_id1), stored_events[4:6])
+
+        # Delete stored events with versions greater than a given version.
+        recorder.delete_events(originator_id2, gt=self.INITIAL_VERSION + 3)
+        self.assertEqual(recorder.select_events(originator_id2), stored_events[6:10])
+        recorder.delete_events(
+            originator_id2, gt=self.INITIAL_VERSION, lt=self.INITIAL_VERSION + 3
+        )
+        self.assertEqual(
+            recorder.select_events(originator_id2),
+            [stored_events[6], stored_events[9]],
+        )
+
+        # Check the stored events of other aggregates are not deleted.
+        self.assertEqual(recorder.select_events(originator_id1), stored_events[4:6])
+
+    def test_compact_events(self) -> None:
+        # Construct the recorder.
+        recorder = self.create_recorder()
+
+        # Check compacting an empty table is okay.
+        self.assertEqual(recorder.compact_events(keep=1), 0)
+
+        # Write some stored events for three aggregates.
+        originator_ids = [uuid4(), uuid4(), uuid4()]
+        stored_events = {
+            originator_id: [
+                StoredEvent(
+                    originator_id=originator_id,
+                    originator_version=self.INITIAL_VERSION + i,
+                    topic=f"topic{i}",
+                    state=f"state{i}".encode(),
+                )
+                for i in range(num_events)
+            ]
+            for originator_id, num_events in zip(originator_ids, [1, 5, 10])
+        }
+        for events in stored_events.values():
+            recorder.insert_events(events)
+
+        # Delete all except the last five stored events of each aggregate,
+        # in batches that divide the aggregates exactly.
+        self.assertEqual(recorder.compact_events(keep=5, batch_size=3), 5)
+
+        # Delete all except the last two stored events of each aggregate,
+        # in batches that don't divide the aggregates exactly.
+        self.assertEqual(recorder.compact_events(keep=2, batch_size=2), 6)
+        for originator_id, events in stored_events.items():
+            self.assertEqual(recorder.select_events(originator_id), events[-2:])
+
+        # Check compacting again doesn't delete anything.
+        self.assertEqual(recorder.compact_events(keep=2), 0)
+
     def test_performance(self) -> None:
         # Construct the recorder.
         recorder = self.create_recorder()
@@ -385,6 +623,140 @@ class ApplicationRecorderTestCase(TestCase, ABC):
         self.assertEqual(notifications[0].id, max_notification_id + 1)
         self.assertEqual(notifications[1].id, max_notification_id + 2)
 
+    def test_bulk_insert_events(self) -> None:
+        # Construct the recorder.
+        recorder = self.create_recorder()
+
+        max_notification_id = recorder.max_notification_id()
+
+        # Write many stored events from a generator.
+        originator_id = uuid4()
+        stored_events = [
+            StoredEvent(
+                originator_id=originator_id,
+                originator_version=self.INITIAL_VERSION + i,
+                topic=f"topic{i}",
+                state=f"state{i}".encode(),
+            )
+            for i in range(100)
+        ]
+        notification_ids = recorder.bulk_insert_events(s for s in stored_events)
+
+        # Check the notification IDs were issued in order.
+        assert notification_ids is not None
+        self.assertIsInstance(notification_ids, list)
+        self.assertEqual(
+            notification_ids,
+            list(range(max_notification_id + 1, max_notification_id + 101)),
+        )
+        notifications = recorder.select_notifications(max_notification_id + 1, 200)
+        self.assertEqual([n.id for n in notifications], list(notification_ids))
+        self.assertEqual(
+            [(n.originator_id, n.originator_version) for n in notifications],
+            [(s.originator_id, s.originator_version) for s in stored_events],
+        )
+        self.assertEqual(recorder.max_notification_id(), max_notification_id + 100)
+
+        # Check nothing is recorded if a stored event conflicts.
+        with self.assertRaises(IntegrityError):
+            recorder.bulk_insert_events(stored_events[-1:])
+        self.assertEqual(recorder.max_notification_id(), max_notification_id + 100)
+
+        # Check writing no stored events returns no notification IDs.
+        self.assertEqual(recorder.bulk_insert_events([]) or [], [])
+
+    def test_select_notifications_with_topics(self) -> None:
+        # Construct the recorder.
+        recorder = self.create_recorder()
+
+        max_notification_id = recorder.max_notification_id()
+
+        # Write stored events with interleaved topics.
+        originator_id = uuid4()
+        recorder.insert_events([
+            StoredEvent(
+                originator_id=originator_id,
+                originator_version=self.INITIAL_VERSION + i,
+                topic=f"topic{i % 5}",
+                state=f"state{i}".encode(),
+            )
+            for i in range(50)
+        ])
+
+        def select_ids(
+            start: int, limit: int, stop: int | None = None, topics: Sequence[str] = ()
+        ) -> List[int]:
+            notifications = recorder.select_notifications(
+                max_notification_id + start,
+                limit,
+                stop=None if stop is None else max_notification_id + stop,
+                topics=topics,
+            )
+            return [n.id - max_notification_id for n in notifications]
+
+        # Check notifications are selected in order, from the start position.
+        self.assertEqual(select_ids(1, 5, topics=["topic0"]), [1, 6, 11, 16, 21])
+        self.assertEqual(select_ids(2, 3, topics=["topic0"]), [6, 11, 16])
+        self.assertEqual(select_ids(48, 5, topics=["topic0"]), [])
+
+        # Check notifications with different topics are merged in order.
+        self.assertEqual(
+            select_ids(1, 6, topics=["topic3", "topic0"]), [1, 4, 6, 9, 11, 14]
+        )
+        self.assertEqual(
+            select_ids(30, 10, topics=["topic1", "topic2", "topic1"]),
+            [32, 33, 37, 38, 42, 43, 47, 48],
+        )
+
+        # Check the stop position is respected.
+        self.assertEqual(
+            select_ids(1, 10, stop=12, topics=["topic1", "topic4"]), [2, 5, 7, 10, 12]
+        )
+
+        # Check unknown topics select nothing.
+        self.assertEqual(select_ids(1, 10, topics=["other"]), [])
+
+    def test_subscribe(self) -> None:
+        recorder = self.create_recorder()
+        max_notification_id = recorder.max_notification_id()
+
+        def insert(topic: str = "topic") -> None:
+            recorder.insert_events([
+                StoredEvent(
+                    originator_id=uuid4(),
+                    originator_version=self.INITIAL_VERSION,
+                    topic=topic,
+                    state=b"state",
+                )
+            ])
+
+        insert()
+        insert()
+
+        with recorder.subscribe(gt=max_notification_id) as subscription:
+            # Check the existing notifications are returned.
+            self.assertEqual(next(subscription).id, max_notification_id + 1)
+            self.assertEqual(next(subscription).id, max_notification_id + 2)
+
+            # Check a new notification is returned after it is recorded.
+            thread = Thread(target=insert, kwargs={"topic": "other"}, daemon=True)
+            timer = Thread(target=lambda: (sleep(0.1), thread.start()), daemon=True)
+            timer.start()
+            self.assertEqual(next(subscription).id, max_notification_id + 3)
+
+            # Check stopping the subscription from another thread stops iteration.
+            stopper = Thread(target=lambda: (sleep(0.1), subscription.stop()))
+            stopper.start()
+            self.assertEqual(list(subscription), [])
+            self.assertTrue(subscription.is_stopped)
+            stopper.join()
+
+        # Check notifications can be filtered by topic.
+        with recorder.subscribe(
+            gt=max_notification_id, topics=["other"]
+        ) as subscription:
+            self.assertEqual(next(subscription).id, max_notification_id + 3)
+
     def test_concurrent_no_conflicts(self) -> None:
         print(self)
 
@@ -734,6 +1106,206 @@ class ProcessRecorderTestCase(TestCase, ABC):
         )
 
 
+class AsyncAggregateRecorderTestCase(IsolatedAsyncioTestCase, ABC):
+    INITIAL_VERSION = 1
+
+    @abstractmethod
+    async def create_recorder(self) -> AsyncAggregateRecorder:
+        """"""
+
+    async def test_insert_and_select(self) -> None:
+        # Construct the recorder.
+        recorder = await self.create_recorder()
+
+        # Select stored events, expect empty list.
+        originator_id = uuid4()
+        self.assertEqual(await recorder.select_events(originator_id), [])
+
+        # Write two stored events.
+        stored_events = [
+            StoredEvent(
+                originator_id=originator_id,
+                originator_version=self.INITIAL_VERSION + i,
+                topic=f"topic{i}",
+                state=f"state{i}".encode(),
+            )
+            for i in range(3)
+        ]
+        await recorder.insert_events(stored_events[:2])
+
+        # Select stored events, expect two events.
+        self.assertEqual(await recorder.select_events(originator_id), stored_events[:2])
+
+        # Check a conflict raises an integrity error, and nothing is inserted.
+        with self.assertRaises(IntegrityError):
+            await recorder.insert_events(stored_events[1:])
+        self.assertEqual(await recorder.select_events(originator_id), stored_events[:2])
+
+        # Write the third stored event.
+        await recorder.insert_events(stored_events[2:])
+
+        # Check the selection arguments work.
+        self.assertEqual(
+            await recorder.select_events(originator_id, gt=self.INITIAL_VERSION),
+            stored_events[1:],
+        )
+        self.assertEqual(
+            await recorder.select_events(originator_id, lte=self.INITIAL_VERSION + 1),
+            stored_events[:2],
+        )
+        self.assertEqual(
+            await recorder.select_events(originator_id, desc=True, limit=1),
+            stored_events[2:],
+        )
+
+        # Check concurrent inserts of different aggregates all succeed.
+        originator_ids = [uuid4() for _ in range(10)]
+        await asyncio.gather(*[
+            recorder.insert_events([
+                StoredEvent(
+                    originator_id=_id,
+                    originator_version=self.INITIAL_VERSION,
+                    topic="topic",
+                    state=b"state",
+                )
+            ])
+            for _id in originator_ids
+        ])
+        for _id in originator_ids:
+            self.assertEqual(len(await recorder.select_events(_id)), 1)
+
+    async def test_delete_and_compact_events(self) -> None:
+        # Construct the recorder.
+        recorder = await self.create_recorder()
+
+        # Write some stored events for two aggregates.
+        originator_ids = [uuid4(), uuid4()]
+        stored_events = {
+            originator_id: [
+                StoredEvent(
+                    originator_id=originator_id,
+                    originator_version=self.INITIAL_VERSION + i,
+                    topic=f"topic{i}",
+                    state=f"state{i}".encode(),
+                )
+                for i in range(5)
+            ]
+            for originator_id in originator_ids
+        }
+        for events in stored_events.values():
+            await recorder.insert_events(events)
+
+        # Delete stored events of one aggregate.
+        originator_id = originator_ids[0]
+        events = stored_events[originator_id]
+        await recorder.delete_events(
+            originator_id, gt=self.INITIAL_VERSION, lt=self.INITIAL_VERSION + 3
+        )
+        self.assertEqual(
+            await recorder.select_events(originator_id),
+            [events[0], events[3], events[4]],
+        )
+
+        # Delete all except the last two stored events of each aggregate.
+        self.assertEqual(await recorder.compact_events(keep=2, batch_size=1), 4)
+        for originator_id, events in stored_events.items():
+            self.assertEqual(await recorder.select_events(originator_id), events[-2:])
+
+
+class AsyncApplicationRecorderTestCase(IsolatedAsyncioTestCase, ABC):
+    INITIAL_VERSION = 1
+
+    @abstractmethod
+    async def create_recorder(self) -> AsyncApplicationRecorder:
+        """"""
+
+    async def test_insert_select(self) -> None:
+        # Construct the recorder.
+        recorder = await self.create_recorder()
+
+        max_notification_id = await recorder.max_notification_id()
+        self.assertEqual(
+            await recorder.select_notifications(max_notification_id + 1, 10), []
+        )
+
+        # Write two stored events.
+        stored_event1 = StoredEvent(
+            originator_id=uuid4(),
+            originator_version=self.INITIAL_VERSION,
+            topic="topic1",
+            state=b"state1",
+        )
+        stored_event2 = StoredEvent(
+            originator_id=uuid4(),
+            originator_version=self.INITIAL_VERSION,
+            topic="topic2",
+            state=b"state2",
+        )
+        notification_ids = await recorder.insert_events([stored_event1, stored_event2])
+        self.assertEqual(
+            notification_ids, [max_notification_id + 1, max_notification_id + 2]
+        )
+        self.assertEqual(await recorder.max_notification_id(), max_notification_id + 2)
+
+        # Select notifications.
+        notifications = await recorder.select_notifications(max_notification_id + 1, 10)
+        self.assertEqual(len(notifications), 2)
+        self.assertEqual(notifications[0].id, max_notification_id + 1)
+        self.assertEqual(notifications[0].originator_id, stored_event1.originator_id)
+        self.assertEqual(notifications[0].topic, "topic1")
+        self.assertEqual(notifications[0].state, b"state1")
+        self.assertEqual(notifications[1].id, max_notification_id + 2)
+
+        # Select notifications with limit, stop and topics.
+        notifications = await recorder.select_notifications(max_notification_id + 1, 1)
+        self.assertEqual([n.id for n in notifications], [max_notification_id + 1])
+        notifications = await recorder.select_notifications(
+            max_notification_id + 1, 10, stop=max_notification_id + 1
+        )
+        self.assertEqual([n.id for n in notifications], [max_notification_id + 1])
+        notifications = await recorder.select_notifications(
+            max_notification_id + 1, 10, topics=["topic2"]
+        )
+        self.assertEqual([n.id for n in notifications], [max_notification_id + 2])
+
+    async def test_concurrent_inserts(self) -> None:
+        # Construct the recorder.
+        recorder = await self.create_recorder()
+        max_notification_id = await recorder.max_notification_id()
+
+        # Insert events concurrently.
+        num_inserts = 20
+        results = await asyncio.gather(*[
+            recorder.insert_events([
+                StoredEvent(
+                    originator_id=uuid4(),
+                    originator_version=self.INITIAL_VERSION,
+                    topic="topic",
+                    state=b"state",
+                )
+                for _ in range(2)
+            ])
+            for _ in range(num_inserts)
+        ])
+
+        # Check the notification IDs are contiguous and not interleaved.
+        for notification_ids in results:
+            assert notification_ids is not None
+            self.assertEqual(notification_ids[1], notification_ids[0] + 1)
+        self.assertEqual(
+            sorted(i for ids in results if ids for i in ids),
+            list(
+                range(
+                    max_notification_id + 1, max_notification_id + 1 + 2 * num_inserts
+                )
+            ),
+        )
+        notifications = await recorder.select_notifications(
+            max_notification_id + 1, 100
+        )
+        self.assertEqual(len(notifications), 2 * num_inserts)
+
+
 class NonInterleavingNotificationIDsBaseCase(ABC, TestCase):
     insert_num = 1000
 
@@ -839,6 +1411,20 @@ class InfrastructureFactoryTestCase(ABC, TestCase):
         self.transcoder.register(DecimalAsStr())
         self.transcoder.register(DatetimeAsISO())
 
+    def test_create_transcoder(self):
+        # Create default transcoder.
+        transcoder = self.factory.transcoder()
+        self.assertIsInstance(transcoder, JSONTranscoder)
+
+        # Create transcoder from topic.
+        try:
+            from eventsourcing.msgpack import MsgPackTranscoder
+        except ImportError:  # pragma: nocover
+            self.skipTest("msgpack is not installed")
+        self.env[self.factory.TRANSCODER_TOPIC] = get_topic(MsgPackTranscoder)
+        transcoder = self.factory.transcoder()
+        self.assertIsInstance(transcoder, MsgPackTranscoder)
+
     def test_createmapper(self):
         # Want to construct:
         #  - application recorder
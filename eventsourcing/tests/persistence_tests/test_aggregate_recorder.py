@@ -0,0 +1,51 @@
+from unittest import IsolatedAsyncioTestCase
+from unittest.case import TestCase
+from uuid import uuid4
+
+from eventsourcing.persistence import (
+    AggregateRecorder,
+    AsyncAggregateRecorder,
+    ProgrammingError,
+)
+
+
+class MyAggregateRecorder(AggregateRecorder):
+    def insert_events(self, stored_events, **kwargs):
+        return None
+
+    def select_events(self, originator_id, **kwargs):
+        return []
+
+
+class MyAsyncAggregateRecorder(AsyncAggregateRecorder):
+    async def insert_events(self, stored_events, **kwargs):
+        return None
+
+    async def select_events(self, originator_id, **kwargs):
+        return []
+
+
+class TestAggregateRecorderWithoutSnapshotRetention(TestCase):
+    def test_delete_and_compact_events_raise_programming_error(self):
+        recorder = MyAggregateRecorder()
+
+        with self.assertRaises(ProgrammingError) as cm:
+            recorder.delete_events(uuid4())
+        self.assertEqual(
+            cm.exception.args[0],
+            "Snapshot retention is not supported by MyAggregateRecorder",
+        )
+
+        with self.assertRaises(ProgrammingError):
+            recorder.compact_events(keep=1)
+
+
+class TestAsyncAggregateRecorderWithoutSnapshotRetention(IsolatedAsyncioTestCase):
+    async def test_delete_and_compact_events_raise_programming_error(self):
+        recorder = MyAsyncAggregateRecorder()
+
+        with self.assertRaises(ProgrammingError):
+            await recorder.delete_events(uuid4())
+
+        with self.assertRaises(ProgrammingError):
+            await recorder.compact_events(keep=1)
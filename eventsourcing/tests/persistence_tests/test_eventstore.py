@@ -1,5 +1,6 @@
 from decimal import Decimal
 from unittest.case import TestCase
+from unittest.mock import patch
 
 from eventsourcing.persistence import (
     DatetimeAsISO,
@@ -9,7 +10,11 @@ from eventsourcing.persistence import (
     Mapper,
     UUIDAsHex,
 )
-from eventsourcing.sqlite import SQLiteAggregateRecorder, SQLiteDatastore
+from eventsourcing.sqlite import (
+    SQLiteAggregateRecorder,
+    SQLiteApplicationRecorder,
+    SQLiteDatastore,
+)
 from eventsourcing.tests.application import EmailAddressAsStr
 from eventsourcing.tests.domain import BankAccount
 
@@ -51,12 +56,22 @@ class TestEventStore(TestCase):
         event_store.put(pending)
 
         # Get domain events.
-        domain_events = event_store.get(account.id)
+        with patch.object(
+            event_store.mapper,
+            "to_domain_events",
+            wraps=event_store.mapper.to_domain_events,
+        ) as to_domain_events:
+            domain_events = event_store.get(account.id)
 
-        # Reconstruct the bank account.
-        copy = None
-        for domain_event in domain_events:
-            copy = domain_event.mutate(copy)
+            # Check stored events are converted lazily.
+            self.assertNotIsInstance(domain_events, list)
+            to_domain_events.assert_not_called()
+
+            # Reconstruct the bank account.
+            copy = None
+            for domain_event in domain_events:
+                copy = domain_event.mutate(copy)
+            to_domain_events.assert_called_once()
 
         # Check copy has correct attribute values.
         self.assertEqual(copy.id, account.id)
@@ -70,3 +85,73 @@ class TestEventStore(TestCase):
 
         self.assertEqual(last_event.originator_id, account.id)
         assert type(last_event) is BankAccount.TransactionAppended
+
+    def test_get_with_page_size(self):
+        # Open an account, and credit the account.
+        account = BankAccount.open(
+            full_name="Alice",
+            email_address="alice@example.com",
+        )
+        for i in range(10):
+            account.append_transaction(Decimal(f"{i}.00"))
+        pending = account.collect_events()
+
+        # Construct event store with page size.
+        transcoder = JSONTranscoder()
+        transcoder.register(UUIDAsHex())
+        transcoder.register(DecimalAsStr())
+        transcoder.register(DatetimeAsISO())
+        transcoder.register(EmailAddressAsStr())
+        recorder = SQLiteAggregateRecorder(SQLiteDatastore(":memory:"))
+        event_store = EventStore(
+            mapper=Mapper(transcoder),
+            recorder=recorder,
+            page_size=3,
+        )
+        recorder.create_table()
+        event_store.put(pending)
+
+        # Check events are retrieved lazily.
+        domain_events = event_store.get(account.id)
+        self.assertNotIsInstance(domain_events, list)
+        self.assertEqual(list(domain_events), pending)
+
+        # Check other arguments are respected.
+        self.assertEqual(list(event_store.get(account.id, desc=True)), pending[::-1])
+        self.assertEqual(list(event_store.get(account.id, gt=2, lte=9)), pending[2:9])
+        self.assertEqual(list(event_store.get(account.id, limit=4)), pending[:4])
+
+        # Reconstruct the bank account.
+        copy = None
+        for domain_event in event_store.get(account.id):
+            copy = domain_event.mutate(copy)
+        self.assertEqual(copy.balance, Decimal("45.00"))
+
+    def test_put_bulk(self):
+        # Open an account, and credit the account.
+        account = BankAccount.open(
+            full_name="Alice",
+            email_address="alice@example.com",
+        )
+        for i in range(10):
+            account.append_transaction(Decimal(f"{i}.00"))
+        pending = account.collect_events()
+
+        # Construct event store with page size.
+        transcoder = JSONTranscoder()
+        transcoder.register(UUIDAsHex())
+        transcoder.register(DecimalAsStr())
+        transcoder.register(DatetimeAsISO())
+        transcoder.register(EmailAddressAsStr())
+        recorder = SQLiteApplicationRecorder(SQLiteDatastore(":memory:"))
+        event_store = EventStore(
+            mapper=Mapper(transcoder),
+            recorder=recorder,
+            page_size=3,
+        )
+        recorder.create_table()
+
+        # Store pending events from a generator.
+        notification_ids = event_store.put_bulk(e for e in pending)
+        self.assertEqual(list(notification_ids), list(range(1, 12)))
+        self.assertEqual(list(event_store.get(account.id)), pending)
@@ -1,6 +1,11 @@
 from unittest.case import TestCase
 
-from eventsourcing.persistence import InfrastructureFactory
+from eventsourcing.persistence import InfrastructureFactory, ProgrammingError
+from eventsourcing.popo import (
+    POPOAggregateRecorder,
+    POPOApplicationRecorder,
+    POPOProcessRecorder,
+)
 from eventsourcing.utils import Environment, get_topic
 
 
@@ -19,3 +24,25 @@ class TestInfrastructureFactoryErrors(TestCase):
                     env={InfrastructureFactory.PERSISTENCE_MODULE: get_topic(object)}
                 )
             )
+
+    def test_async_recorders_raise_programming_error_if_not_supported(self):
+        class SyncOnlyFactory(InfrastructureFactory):
+            def aggregate_recorder(self, purpose="events"):
+                return POPOAggregateRecorder()
+
+            def application_recorder(self):
+                return POPOApplicationRecorder()
+
+            def process_recorder(self):
+                return POPOProcessRecorder()
+
+        factory = SyncOnlyFactory(Environment())
+
+        with self.assertRaises(ProgrammingError) as cm:
+            factory.async_aggregate_recorder()
+        self.assertEqual(
+            cm.exception.args[0], "SyncOnlyFactory does not support asyncio"
+        )
+
+        with self.assertRaises(ProgrammingError):
+            factory.async_application_recorder()
@@ -11,10 +11,17 @@ from eventsourcing.persistence import (
     DecimalAsStr,
     JSONTranscoder,
     Mapper,
+    StoredEvent,
     UUIDAsHex,
 )
 from eventsourcing.tests.domain import BankAccount
-from eventsourcing.utils import Environment
+from eventsourcing.utils import (
+    Environment,
+    _topic_cache,
+    clear_topic_cache,
+    get_topic,
+    register_topic,
+)
 
 
 class TestMapper(TestCase):
@@ -80,6 +87,188 @@ class TestMapper(TestCase):
 
         self.assertIn(len(stored_event.state), range(129, 143))
 
+    def test_to_stored_events_and_to_domain_events(self):
+        # Construct transcoder.
+        transcoder = JSONTranscoder()
+        transcoder.register(UUIDAsHex())
+        transcoder.register(DecimalAsStr())
+        transcoder.register(DatetimeAsISO())
+
+        # Construct mapper with compressor.
+        mapper = Mapper(transcoder=transcoder, compressor=ZlibCompressor())
+
+        # Create domain events of different types.
+        originator_id = uuid4()
+        domain_events = [
+            AggregateEvent(
+                originator_id=originator_id,
+                originator_version=1,
+                timestamp=AggregateEvent.create_timestamp(),
+            ),
+            BankAccount.TransactionAppended(
+                originator_id=originator_id,
+                originator_version=2,
+                timestamp=BankAccount.TransactionAppended.create_timestamp(),
+                amount=Decimal("10.00"),
+            ),
+            BankAccount.TransactionAppended(
+                originator_id=originator_id,
+                originator_version=3,
+                timestamp=BankAccount.TransactionAppended.create_timestamp(),
+                amount=Decimal("20.00"),
+            ),
+        ]
+
+        # Map to stored events.
+        stored_events = mapper.to_stored_events(domain_events)
+        self.assertEqual(
+            stored_events, [mapper.to_stored_event(e) for e in domain_events]
+        )
+
+        # Map to domain events.
+        copies = mapper.to_domain_events(stored_events)
+        self.assertEqual(copies, domain_events)
+
+        # Check empty batches.
+        self.assertEqual(mapper.to_stored_events([]), [])
+        self.assertEqual(mapper.to_domain_events([]), [])
+
+    def test_to_domain_events_upcasts_old_versions(self):
+        class MyEvent(AggregateEvent):
+            class_version = 3
+            a: int
+            b: int
+            c: int
+
+            @staticmethod
+            def upcast_v1_v2(state):
+                state["b"] = 2
+
+            @staticmethod
+            def upcast_v2_v3(state):
+                state["c"] = 3
+
+        transcoder = JSONTranscoder()
+        transcoder.register(UUIDAsHex())
+        transcoder.register(DatetimeAsISO())
+        mapper = Mapper(transcoder=transcoder)
+
+        # Construct stored events with old and current class versions.
+        originator_id = uuid4()
+        topic = get_topic(MyEvent)
+        timestamp = DatetimeAsISO().encode(MyEvent.create_timestamp())
+        stored_events = [
+            StoredEvent(
+                originator_id=originator_id,
+                originator_version=1,
+                topic=topic,
+                state=transcoder.encode({"timestamp": timestamp, "a": 1}),
+            ),
+            StoredEvent(
+                originator_id=originator_id,
+                originator_version=2,
+                topic=topic,
+                state=transcoder.encode(
+                    {"timestamp": timestamp, "a": 1, "b": 1, "class_version": 2}
+                ),
+            ),
+            StoredEvent(
+                originator_id=originator_id,
+                originator_version=3,
+                topic=topic,
+                state=transcoder.encode(
+                    {"timestamp": timestamp, "a": 1, "b": 1, "c": 1, "class_version": 3}
+                ),
+            ),
+            StoredEvent(
+                originator_id=originator_id,
+                originator_version=4,
+                topic=topic,
+                state=transcoder.encode({"timestamp": timestamp, "a": 1}),
+            ),
+        ]
+
+        domain_events = mapper.to_domain_events(stored_events)
+        self.assertEqual(
+            [(e.a, e.b, e.c) for e in domain_events],
+            [(1, 2, 3), (1, 1, 3), (1, 1, 1), (1, 2, 3)],
+        )
+        self.assertEqual(
+            domain_events, [mapper.to_domain_event(s) for s in stored_events]
+        )
+
+    def test_codecs_are_cached_and_renewed_when_topic_cache_changes(self):
+        class MyEvent1(AggregateEvent):
+            pass
+
+        class MyEvent2(AggregateEvent):
+            class_version = 2
+
+            @staticmethod
+            def upcast_v1_v2(state):
+                state["a"] = 1
+
+        transcoder = JSONTranscoder()
+        transcoder.register(UUIDAsHex())
+        transcoder.register(DatetimeAsISO())
+        mapper = Mapper(transcoder=transcoder)
+
+        domain_event = MyEvent1(
+            originator_id=uuid4(),
+            originator_version=1,
+            timestamp=MyEvent1.create_timestamp(),
+        )
+        topic = get_topic(MyEvent1)
+        stored_event = mapper.to_stored_event(domain_event)
+        self.assertEqual(stored_event.topic, topic)
+
+        # Check the codec for the topic is reused.
+        copy = mapper.to_domain_event(stored_event)
+        self.assertIsInstance(copy, MyEvent1)
+        codec = mapper._codecs_by_topic[topic]
+        mapper.to_domain_events([stored_event])
+        self.assertIs(mapper._codecs_by_topic[topic], codec)
+
+        # Check the codec is renewed when the topic resolves to another class.
+        del _topic_cache[topic]
+        register_topic(topic, MyEvent2)
+        try:
+            copy = mapper.to_domain_event(stored_event)
+            self.assertIsInstance(copy, MyEvent2)
+            self.assertEqual(copy.a, 1)
+            self.assertIsNot(mapper._codecs_by_topic[topic], codec)
+        finally:
+            clear_topic_cache()
+
+    def test_batch_methods_use_overridden_single_event_methods(self):
+        class MyMapper(Mapper):
+            def to_stored_event(self, domain_event):
+                self.num_stored += 1
+                return super().to_stored_event(domain_event)
+
+            def to_domain_event(self, stored_event):
+                self.num_domain += 1
+                return super().to_domain_event(stored_event)
+
+        transcoder = JSONTranscoder()
+        transcoder.register(UUIDAsHex())
+        transcoder.register(DatetimeAsISO())
+        mapper = MyMapper(transcoder=transcoder)
+        mapper.num_stored = 0
+        mapper.num_domain = 0
+
+        domain_events = [
+            AggregateEvent(
+                originator_id=uuid4(),
+                originator_version=1,
+                timestamp=AggregateEvent.create_timestamp(),
+            )
+        ]
+        copies = mapper.to_domain_events(mapper.to_stored_events(domain_events))
+        self.assertEqual(copies, domain_events)
+        self.assertEqual(mapper.num_stored, 1)
+        self.assertEqual(mapper.num_domain, 1)
+
     def test_from_domain_event_gives_deprecated_warning(self):
         # Construct transcoder.
         transcoder = JSONTranscoder()
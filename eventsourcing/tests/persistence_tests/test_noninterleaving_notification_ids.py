@@ -66,4 +66,11 @@ class TestNonInterleavingPostgres(NonInterleavingNotificationIDsBaseCase):
         return recorder
 
 
+class TestNonInterleavingPostgresGapTolerant(TestNonInterleavingPostgres):
+    def create_recorder(self) -> ApplicationRecorder:
+        recorder = PostgresApplicationRecorder(self.datastore, gap_tolerant=True)
+        recorder.create_table()
+        return recorder
+
+
 del NonInterleavingNotificationIDsBaseCase
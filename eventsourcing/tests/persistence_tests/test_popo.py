@@ -2,6 +2,8 @@ from uuid import uuid4
 
 from eventsourcing.persistence import StoredEvent, Tracking
 from eventsourcing.popo import (
+    AsyncPOPOAggregateRecorder,
+    AsyncPOPOApplicationRecorder,
     Factory,
     POPOAggregateRecorder,
     POPOApplicationRecorder,
@@ -10,6 +12,8 @@ from eventsourcing.popo import (
 from eventsourcing.tests.persistence import (
     AggregateRecorderTestCase,
     ApplicationRecorderTestCase,
+    AsyncAggregateRecorderTestCase,
+    AsyncApplicationRecorderTestCase,
     InfrastructureFactoryTestCase,
     ProcessRecorderTestCase,
 )
@@ -100,6 +104,16 @@ class TestPOPOProcessRecorder(ProcessRecorderTestCase):
         )
 
 
+class TestAsyncPOPOAggregateRecorder(AsyncAggregateRecorderTestCase):
+    async def create_recorder(self):
+        return AsyncPOPOAggregateRecorder()
+
+
+class TestAsyncPOPOApplicationRecorder(AsyncApplicationRecorderTestCase):
+    async def create_recorder(self):
+        return AsyncPOPOApplicationRecorder()
+
+
 class TestPOPOInfrastructureFactory(InfrastructureFactoryTestCase):
     def setUp(self) -> None:
         self.env = Environment("TestCase")
@@ -120,5 +134,7 @@ class TestPOPOInfrastructureFactory(InfrastructureFactoryTestCase):
 
 del AggregateRecorderTestCase
 del ApplicationRecorderTestCase
+del AsyncAggregateRecorderTestCase
+del AsyncApplicationRecorderTestCase
 del ProcessRecorderTestCase
 del InfrastructureFactoryTestCase
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import sys
 from threading import Event, Thread
-from time import sleep
+from time import sleep, time
 from typing import List
 from unittest import TestCase, skipIf
 from uuid import uuid4
@@ -26,15 +26,21 @@ from eventsourcing.persistence import (
     Tracking,
 )
 from eventsourcing.postgres import (
+    AsyncPostgresAggregateRecorder,
+    AsyncPostgresApplicationRecorder,
+    AsyncPostgresDatastore,
     Factory,
     PostgresAggregateRecorder,
     PostgresApplicationRecorder,
     PostgresDatastore,
     PostgresProcessRecorder,
+    PostgresSubscription,
 )
 from eventsourcing.tests.persistence import (
     AggregateRecorderTestCase,
     ApplicationRecorderTestCase,
+    AsyncAggregateRecorderTestCase,
+    AsyncApplicationRecorderTestCase,
     InfrastructureFactoryTestCase,
     ProcessRecorderTestCase,
 )
@@ -74,6 +80,26 @@ class TestPostgresDatastore(TestCase):
         with datastore.get_connection() as conn:
             self.assertIsInstance(conn, Connection)
 
+    def test_connect(self):
+        datastore = PostgresDatastore(
+            dbname="eventsourcing",
+            host="127.0.0.1",
+            port="5432",
+            user="eventsourcing",
+            password="eventsourcing",  # noqa: S106
+            connect_timeout=7,
+        )
+        # Check the pool and connect() use the same connection arguments.
+        self.assertIs(datastore.pool.kwargs, datastore.connect_kwargs)
+        self.assertEqual(datastore.connect_kwargs["connect_timeout"], 7)
+        conn = datastore.connect()
+        try:
+            self.assertIsInstance(conn, Connection)
+            self.assertTrue(conn.autocommit)
+            self.assertEqual(conn.info.get_parameters()["connect_timeout"], "7")
+        finally:
+            conn.close()
+
     def test_context_manager_converts_exceptions_and_conditionally_calls_close(self):
         cases = [
             (InterfaceError, psycopg.InterfaceError(), True),
@@ -542,6 +568,298 @@ class TestPostgresApplicationRecorderWithSchema(
     pass
 
 
+class TestPostgresApplicationRecorderGapTolerant(TestPostgresApplicationRecorder):
+    def create_recorder(
+        self, table_name=EVENTS_TABLE_NAME
+    ) -> PostgresApplicationRecorder:
+        if self.datastore.schema:
+            table_name = f"{self.datastore.schema}.{table_name}"
+        recorder = PostgresApplicationRecorder(
+            self.datastore, events_table_name=table_name, gap_tolerant=True
+        )
+        recorder.create_table()
+        return recorder
+
+    def test_insert_lock_timeout_actually_works(self):
+        self.skipTest("Table isn't locked when gap tolerant")
+
+    def test_uncommitted_transaction_does_not_block_writers_or_skip_readers(self):
+        recorder = self.create_recorder()
+        max_notification_id = recorder.max_notification_id()
+
+        stored_event1 = StoredEvent(
+            originator_id=uuid4(),
+            originator_version=1,
+            topic="topic1",
+            state=b"state1",
+        )
+        stored_event2 = StoredEvent(
+            originator_id=uuid4(),
+            originator_version=1,
+            topic="topic2",
+            state=b"state2",
+        )
+
+        conn: Connection
+        with self.datastore.get_connection() as conn, conn.transaction():
+            # Insert a stored event, but don't commit yet.
+            with conn.cursor() as curs:
+                recorder._insert_stored_events(curs, [stored_event1])
+
+            # Check another writer isn't blocked.
+            notification_ids = recorder.insert_events([stored_event2])
+            self.assertEqual(notification_ids, [max_notification_id + 2])
+
+            # Check the committed stored event isn't selected, because
+            # a stored event with a lower notification ID isn't committed.
+            self.assertEqual(
+                recorder.select_notifications(max_notification_id + 1, 10), []
+            )
+            self.assertEqual(recorder.max_notification_id(), max_notification_id)
+
+        # Check both stored events are selected after the transaction commits.
+        notifications = recorder.select_notifications(max_notification_id + 1, 10)
+        self.assertEqual(
+            [n.id for n in notifications],
+            [max_notification_id + 1, max_notification_id + 2],
+        )
+        self.assertEqual(recorder.max_notification_id(), max_notification_id + 2)
+
+    def test_lock_is_released_after_integrity_error(self):
+        recorder = self.create_recorder()
+        stored_event1 = StoredEvent(
+            originator_id=uuid4(),
+            originator_version=1,
+            topic="topic1",
+            state=b"state1",
+        )
+        recorder.insert_events([stored_event1])
+        with self.assertRaises(IntegrityError):
+            recorder.insert_events([stored_event1])
+
+        # Check the lock isn't still held by a pooled connection.
+        with self.datastore.transaction(commit=False) as curs:
+            curs.execute("SELECT COUNT(*) FROM pg_locks WHERE locktype = 'advisory'")
+            row = curs.fetchone()
+            assert row is not None
+            self.assertEqual(row["count"], 0)
+
+    def test_transaction_id_column_is_added_to_existing_table(self):
+        # Create a table without the column.
+        table_name = EVENTS_TABLE_NAME
+        if self.datastore.schema:
+            table_name = f"{self.datastore.schema}.{table_name}"
+        PostgresApplicationRecorder(
+            self.datastore, events_table_name=table_name
+        ).create_table()
+        stored_event1 = StoredEvent(
+            originator_id=uuid4(),
+            originator_version=1,
+            topic="topic1",
+            state=b"state1",
+        )
+        PostgresApplicationRecorder(
+            self.datastore, events_table_name=table_name
+        ).insert_events([stored_event1])
+
+        # Check the column is added, and existing stored events are selected.
+        recorder = self.create_recorder()
+        notifications = recorder.select_notifications(1, 10)
+        self.assertEqual(
+            [n.originator_id for n in notifications], [stored_event1.originator_id]
+        )
+
+        # Check the table isn't locked by altering it again, by creating the
+        # table whilst another transaction has read from the table.
+        conn: Connection
+        with self.datastore.get_connection() as conn, conn.transaction():
+            with conn.cursor() as curs:
+                curs.execute(f"SELECT * FROM {table_name}")
+            thread = Thread(target=recorder.create_table, daemon=True)
+            thread.start()
+            thread.join(timeout=5)
+            self.assertFalse(thread.is_alive())
+
+
+class TestPostgresApplicationRecorderGapTolerantWithSchema(
+    WithSchema, TestPostgresApplicationRecorderGapTolerant
+):
+    pass
+
+
+class TestPostgresApplicationRecorderWithGroupCommit(TestPostgresApplicationRecorder):
+    def create_recorder(
+        self, table_name=EVENTS_TABLE_NAME
+    ) -> PostgresApplicationRecorder:
+        if self.datastore.schema:
+            table_name = f"{self.datastore.schema}.{table_name}"
+        recorder = PostgresApplicationRecorder(
+            self.datastore,
+            events_table_name=table_name,
+            group_commit=True,
+            group_commit_window=0.001,
+        )
+        recorder.create_table()
+        return recorder
+
+    def test_group_commit_concurrent_callers(self):
+        recorder = self.create_recorder()
+        max_notification_id = recorder.max_notification_id()
+
+        # Record an event that will conflict with some of the calls.
+        conflicting_event = StoredEvent(
+            originator_id=uuid4(),
+            originator_version=1,
+            topic="topic",
+            state=b"state",
+        )
+        recorder.insert_events([conflicting_event])
+
+        num_threads = 20
+        results: List[List[int] | Exception] = [[] for _ in range(num_threads)]
+
+        def insert(i: int) -> None:
+            stored_events = [
+                StoredEvent(
+                    originator_id=uuid4(),
+                    originator_version=1,
+                    topic="topic",
+                    state=b"state",
+                )
+                for _ in range(3)
+            ]
+            if i % 5 == 0:
+                stored_events.append(conflicting_event)
+            try:
+                results[i] = list(recorder.insert_events(stored_events) or [])
+            except IntegrityError as e:
+                results[i] = e
+
+        threads = [Thread(target=insert, args=(i,)) for i in range(num_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        # Check conflicting calls failed, and only conflicting calls.
+        notification_ids: List[int] = []
+        for i, result in enumerate(results):
+            if i % 5 == 0:
+                self.assertIsInstance(result, IntegrityError)
+            else:
+                assert isinstance(result, list)
+                self.assertEqual(len(result), 3)
+                self.assertEqual(result, list(range(result[0], result[0] + 3)))
+                notification_ids.extend(result)
+
+        # Check each caller received the notification IDs of its own events.
+        notifications = recorder.select_notifications(max_notification_id + 2, 100)
+        self.assertEqual(len(notifications), 3 * (num_threads - num_threads // 5))
+        self.assertEqual(sorted(notification_ids), sorted(n.id for n in notifications))
+
+
+class TestPostgresApplicationRecorderWithListenNotify(TestPostgresApplicationRecorder):
+    def create_recorder(
+        self, table_name=EVENTS_TABLE_NAME
+    ) -> PostgresApplicationRecorder:
+        if self.datastore.schema:
+            table_name = f"{self.datastore.schema}.{table_name}"
+        recorder = PostgresApplicationRecorder(
+            self.datastore, events_table_name=table_name, listen_notify=True
+        )
+        recorder.create_table()
+        return recorder
+
+    def test_subscription_is_woken_by_other_datastores(self):
+        recorder1 = self.create_recorder()
+        # Use another datastore, as if the writer were in another process.
+        datastore2 = PostgresDatastore(
+            "eventsourcing",
+            "127.0.0.1",
+            "5432",
+            "eventsourcing",
+            "eventsourcing",
+            schema=self.datastore.schema,
+        )
+        recorder2 = PostgresApplicationRecorder(
+            datastore2,
+            events_table_name=recorder1.events_table_name,
+            listen_notify=True,
+        )
+        max_notification_id = recorder1.max_notification_id()
+
+        with recorder1.subscribe(gt=max_notification_id) as subscription:
+            self.assertIsInstance(subscription, PostgresSubscription)
+            # Don't poll, so that only a notification can wake it.
+            subscription.poll_interval = 10
+
+            def insert():
+                sleep(0.1)
+                recorder2.insert_events([StoredEvent(uuid4(), 1, "topic", b"state")])
+
+            thread = Thread(target=insert)
+            thread.start()
+            started = time()
+            self.assertEqual(next(subscription).id, max_notification_id + 1)
+            self.assertLess(time() - started, 1)
+            thread.join()
+
+        # Check the connection is closed when the context is exited.
+        self.assertIsNone(subscription._connection)
+        datastore2.close()
+
+    def test_channel_name_is_bounded(self):
+        recorder = self.create_recorder()
+        self.assertLessEqual(len(recorder.channel_name), 63)
+        self.assertIn(recorder.channel_name, recorder.listen_statement)
+        self.assertIn(recorder.channel_name, recorder.notify_statement)
+
+
+class TestPostgresApplicationRecorderWithListenNotifyWithSchema(
+    WithSchema, TestPostgresApplicationRecorderWithListenNotify
+):
+    pass
+
+
+class TestPostgresApplicationRecorderWithTopicIndex(TestPostgresApplicationRecorder):
+    def create_recorder(
+        self, table_name=EVENTS_TABLE_NAME
+    ) -> PostgresApplicationRecorder:
+        if self.datastore.schema:
+            table_name = f"{self.datastore.schema}.{table_name}"
+        recorder = PostgresApplicationRecorder(
+            self.datastore, events_table_name=table_name, topic_index=True
+        )
+        recorder.create_table()
+        return recorder
+
+    def test_select_notifications_with_topics_uses_topic_index(self):
+        recorder = self.create_recorder()
+        statement, params = recorder._construct_select_notifications_statement(
+            1, 10, None, ["topic1", "topic2"]
+        )
+        with self.datastore.transaction(commit=False) as curs:
+            curs.execute("SET LOCAL enable_seqscan = off")
+            curs.execute("EXPLAIN " + statement, params)
+            plan = "\n".join(row["QUERY PLAN"] for row in curs.fetchall())
+        self.assertIn(recorder.topic_index_name, plan)
+
+    def test_topic_index_name_is_bounded(self):
+        recorder = self.create_recorder()
+        self.assertLessEqual(len(recorder.topic_index_name), 63)
+        self.assertTrue(recorder.topic_index_name.endswith("_topic_idx"))
+        other = self.create_recorder(EVENTS_TABLE_NAME[:-1] + "x")
+        self.assertNotEqual(recorder.topic_index_name, other.topic_index_name)
+        self.assertLessEqual(len(other.topic_index_name), 63)
+        drop_postgres_table(self.datastore, other.events_table_name)
+
+
+class TestPostgresApplicationRecorderWithTopicIndexWithSchema(
+    WithSchema, TestPostgresApplicationRecorderWithTopicIndex
+):
+    pass
+
+
 class TestPostgresApplicationRecorderErrors(SetupPostgresDatastore, TestCase):
     def create_recorder(self, table_name=EVENTS_TABLE_NAME):
         return PostgresApplicationRecorder(self.datastore, events_table_name=table_name)
@@ -651,6 +969,21 @@ class TestPostgresProcessRecorder(SetupPostgresDatastore, ProcessRecorderTestCas
                 tracking_table_name="n" + TRACKING_TABLE_NAME,
             )
 
+    def test_bulk_insert_events_raises_programming_error_with_tracking(self):
+        recorder = self.create_recorder()
+        stored_event = StoredEvent(
+            originator_id=uuid4(),
+            originator_version=0,
+            topic="topic1",
+            state=b"state1",
+        )
+        with self.assertRaises(ProgrammingError):
+            recorder.bulk_insert_events(
+                [stored_event], tracking=Tracking("upstream", 1)
+            )
+        self.assertEqual(recorder.max_tracking_id("upstream"), 0)
+        self.assertEqual(recorder.max_notification_id(), 0)
+
     def test_retry_max_tracking_id_after_closing_connection(self):
         # This checks connection is recreated after InterfaceError.
 
@@ -677,6 +1010,18 @@ class TestPostgresProcessRecorder(SetupPostgresDatastore, ProcessRecorderTestCas
         self.assertEqual(notification_id, 1)
 
 
+class TestPostgresProcessRecorderGapTolerant(TestPostgresProcessRecorder):
+    def create_recorder(self):
+        recorder = PostgresProcessRecorder(
+            datastore=self.datastore,
+            events_table_name=EVENTS_TABLE_NAME,
+            tracking_table_name=TRACKING_TABLE_NAME,
+            gap_tolerant=True,
+        )
+        recorder.create_table()
+        return recorder
+
+
 class TestPostgresProcessRecorderWithSchema(WithSchema, TestPostgresProcessRecorder):
     pass
 
@@ -702,6 +1047,48 @@ class TestPostgresProcessRecorderErrors(SetupPostgresDatastore, TestCase):
             recorder.max_tracking_id("upstream")
 
 
+class SetupAsyncPostgresDatastore(SetupPostgresDatastore):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.async_datastore = AsyncPostgresDatastore(
+            "eventsourcing",
+            "127.0.0.1",
+            "5432",
+            "eventsourcing",
+            "eventsourcing",
+            pool_size=10,
+            max_overflow=10,
+            pool_timeout=30,
+            schema=self.schema,
+        )
+
+    async def asyncTearDown(self) -> None:
+        await self.async_datastore.close()
+        await super().asyncTearDown()
+
+
+class TestAsyncPostgresAggregateRecorder(
+    SetupAsyncPostgresDatastore, AsyncAggregateRecorderTestCase
+):
+    async def create_recorder(self) -> AsyncPostgresAggregateRecorder:
+        recorder = AsyncPostgresAggregateRecorder(
+            datastore=self.async_datastore, events_table_name=EVENTS_TABLE_NAME
+        )
+        await recorder.create_table()
+        return recorder
+
+
+class TestAsyncPostgresApplicationRecorder(
+    SetupAsyncPostgresDatastore, AsyncApplicationRecorderTestCase
+):
+    async def create_recorder(self) -> AsyncPostgresApplicationRecorder:
+        recorder = AsyncPostgresApplicationRecorder(
+            datastore=self.async_datastore, events_table_name=EVENTS_TABLE_NAME
+        )
+        await recorder.create_table()
+        return recorder
+
+
 class TestPostgresInfrastructureFactory(InfrastructureFactoryTestCase):
     def test_create_application_recorder(self):
         super().test_create_application_recorder()
@@ -819,6 +1206,103 @@ class TestPostgresInfrastructureFactory(InfrastructureFactoryTestCase):
         self.factory = Factory(self.env)
         self.assertEqual(self.factory.datastore.pool.max_waiting, 8)
 
+    def test_gap_tolerant_is_disabled_by_default(self):
+        self.assertTrue(Factory.POSTGRES_GAP_TOLERANT not in self.env)
+        self.factory = Factory(self.env)
+        recorder = self.factory.application_recorder()
+        assert isinstance(recorder, PostgresApplicationRecorder)
+        self.assertFalse(recorder.gap_tolerant)
+
+    def test_gap_tolerant_is_enabled(self):
+        self.env[Factory.POSTGRES_GAP_TOLERANT] = "y"
+        self.factory = Factory(self.env)
+        recorder = self.factory.application_recorder()
+        assert isinstance(recorder, PostgresApplicationRecorder)
+        self.assertTrue(recorder.gap_tolerant)
+        recorder = self.factory.process_recorder()
+        assert isinstance(recorder, PostgresProcessRecorder)
+        self.assertTrue(recorder.gap_tolerant)
+
+    def test_listen_notify_is_disabled_by_default(self):
+        self.assertTrue(Factory.POSTGRES_LISTEN_NOTIFY not in self.env)
+        self.factory = Factory(self.env)
+        recorder = self.factory.application_recorder()
+        assert isinstance(recorder, PostgresApplicationRecorder)
+        self.assertFalse(recorder.listen_notify)
+
+    def test_listen_notify_is_enabled(self):
+        self.env[Factory.POSTGRES_LISTEN_NOTIFY] = "y"
+        self.factory = Factory(self.env)
+        recorder = self.factory.application_recorder()
+        assert isinstance(recorder, PostgresApplicationRecorder)
+        self.assertTrue(recorder.listen_notify)
+        recorder = self.factory.process_recorder()
+        assert isinstance(recorder, PostgresProcessRecorder)
+        self.assertTrue(recorder.listen_notify)
+
+    def test_topic_index_is_disabled_by_default(self):
+        self.assertTrue(Factory.POSTGRES_TOPIC_INDEX not in self.env)
+        self.factory = Factory(self.env)
+        recorder = self.factory.application_recorder()
+        assert isinstance(recorder, PostgresApplicationRecorder)
+        self.assertFalse(recorder.topic_index)
+
+    def test_topic_index_is_enabled(self):
+        self.env[Factory.POSTGRES_TOPIC_INDEX] = "y"
+        self.factory = Factory(self.env)
+        recorder = self.factory.application_recorder()
+        assert isinstance(recorder, PostgresApplicationRecorder)
+        self.assertTrue(recorder.topic_index)
+        recorder = self.factory.process_recorder()
+        assert isinstance(recorder, PostgresProcessRecorder)
+        self.assertTrue(recorder.topic_index)
+
+    def test_options_are_only_passed_to_recorder_classes_when_set(self):
+        class MyApplicationRecorder(PostgresApplicationRecorder):
+            def __init__(self, datastore, events_table_name="stored_events"):
+                super().__init__(datastore, events_table_name)
+
+        class MyProcessRecorder(PostgresProcessRecorder):
+            def __init__(self, datastore, events_table_name, tracking_table_name):
+                super().__init__(datastore, events_table_name, tracking_table_name)
+
+        class MyFactory(Factory):
+            application_recorder_class = MyApplicationRecorder
+            process_recorder_class = MyProcessRecorder
+
+        self.factory = MyFactory(self.env)
+        recorder = self.factory.application_recorder()
+        self.assertIsInstance(recorder, MyApplicationRecorder)
+        recorder = self.factory.process_recorder()
+        self.assertIsInstance(recorder, MyProcessRecorder)
+
+    def test_group_commit_is_disabled_by_default(self):
+        self.assertTrue(Factory.POSTGRES_GROUP_COMMIT not in self.env)
+        self.factory = Factory(self.env)
+        recorder = self.factory.application_recorder()
+        assert isinstance(recorder, PostgresApplicationRecorder)
+        self.assertFalse(recorder.group_commit)
+        self.assertEqual(recorder.group_commit_window, 0)
+
+    def test_group_commit_is_enabled(self):
+        self.env[Factory.POSTGRES_GROUP_COMMIT] = "y"
+        self.env[Factory.POSTGRES_GROUP_COMMIT_WINDOW] = "0.002"
+        self.factory = Factory(self.env)
+        recorder = self.factory.application_recorder()
+        assert isinstance(recorder, PostgresApplicationRecorder)
+        self.assertTrue(recorder.group_commit)
+        self.assertEqual(recorder.group_commit_window, 0.002)
+
+    def test_environment_error_raised_when_group_commit_window_not_a_float(self):
+        self.env[Factory.POSTGRES_GROUP_COMMIT_WINDOW] = "abc"
+        with self.assertRaises(EnvironmentError) as cm:
+            Factory(self.env)
+        self.assertEqual(
+            cm.exception.args[0],
+            "Postgres environment value for key 'POSTGRES_GROUP_COMMIT_WINDOW' "
+            "is invalid. If set, a float or empty string is expected: 'abc'",
+        )
+
     def test_lock_timeout_is_zero_by_default(self):
         self.assertTrue(Factory.POSTGRES_LOCK_TIMEOUT not in self.env)
         self.factory = Factory(self.env)
@@ -1053,8 +1537,11 @@ class TestPostgresInfrastructureFactory(InfrastructureFactoryTestCase):
 
 del AggregateRecorderTestCase
 del ApplicationRecorderTestCase
+del AsyncAggregateRecorderTestCase
+del AsyncApplicationRecorderTestCase
 del ProcessRecorderTestCase
 del InfrastructureFactoryTestCase
 del SetupPostgresDatastore
+del SetupAsyncPostgresDatastore
 del WithSchema
 del TestConnectionPool
@@ -1,5 +1,8 @@
 import sqlite3
+import sys
 from sqlite3 import Connection
+from threading import Thread
+from time import sleep, time
 from unittest import TestCase
 from unittest.mock import Mock
 from uuid import uuid4
@@ -18,17 +21,23 @@ from eventsourcing.persistence import (
     StoredEvent,
 )
 from eventsourcing.sqlite import (
+    AsyncSQLiteAggregateRecorder,
+    AsyncSQLiteApplicationRecorder,
+    AsyncSQLiteDatastore,
     Factory,
     SQLiteAggregateRecorder,
     SQLiteApplicationRecorder,
     SQLiteConnectionPool,
     SQLiteDatastore,
     SQLiteProcessRecorder,
+    SQLiteSubscription,
     SQLiteTransaction,
 )
 from eventsourcing.tests.persistence import (
     AggregateRecorderTestCase,
     ApplicationRecorderTestCase,
+    AsyncAggregateRecorderTestCase,
+    AsyncApplicationRecorderTestCase,
     InfrastructureFactoryTestCase,
     ProcessRecorderTestCase,
     tmpfile_uris,
@@ -176,6 +185,33 @@ class TestSQLiteAggregateRecorder(AggregateRecorderTestCase):
         recorder.create_table()
         return recorder
 
+    def test_select_events_many_with_more_ids_than_sqlite_variables(self):
+        recorder = self.create_recorder()
+        if sys.version_info >= (3, 11):  # pragma: nocover
+            # Apply the limit of SQLite before version 3.32.
+            with recorder.datastore.get_connection(commit=False) as conn:
+                conn._sqlite_conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+        originator_ids = [uuid4() for _ in range(1000)]
+        recorder.insert_events([
+            StoredEvent(
+                originator_id=originator_id,
+                originator_version=version,
+                topic="topic",
+                state=b"state",
+            )
+            for originator_id in originator_ids
+            for version in (1, 2)
+        ])
+        gt_versions = {originator_id: 1 for originator_id in originator_ids}
+        results = recorder.select_events_many(
+            originator_ids, gt_versions=gt_versions, limit=1
+        )
+        self.assertEqual(list(results), originator_ids)
+        self.assertEqual(
+            {tuple(s.originator_version for s in r) for r in results.values()},
+            {(2,)},
+        )
+
 
 class TestSQLiteAggregateRecorderErrors(TestCase):
     def test_raises_operational_error_when_creating_table_fails(self):
@@ -210,6 +246,48 @@ class TestSQLiteApplicationRecorder(ApplicationRecorderTestCase):
         self.db_uri = ":memory:"
         super().test_insert_select()
 
+    def test_bulk_insert_events(self):
+        self.db_uri = ":memory:"
+        super().test_bulk_insert_events()
+
+    def test_select_notifications_with_topics(self):
+        self.db_uri = ":memory:"
+        super().test_select_notifications_with_topics()
+
+    def test_subscribe(self):
+        self.db_uri = ":memory:"
+        super().test_subscribe()
+
+    def test_subscribe_file_based(self):
+        self.uris = tmpfile_uris()
+        self.db_uri = next(self.uris)
+        super().test_subscribe()
+
+    def test_subscription_is_woken_by_other_connections(self):
+        self.uris = tmpfile_uris()
+        self.db_uri = next(self.uris)
+        recorder1 = self.create_recorder()
+        recorder2 = self.create_recorder()
+
+        with recorder1.subscribe() as subscription:
+            self.assertIsInstance(subscription, SQLiteSubscription)
+            # Don't poll, so that only "PRAGMA data_version" can wake it.
+            subscription.poll_interval = 10
+
+            def insert():
+                sleep(0.1)
+                recorder2.insert_events([StoredEvent(uuid4(), 1, "topic", b"state")])
+
+            thread = Thread(target=insert)
+            thread.start()
+            started = time()
+            self.assertEqual(next(subscription).id, 1)
+            self.assertLess(time() - started, 1)
+            thread.join()
+
+        # Check the connection is closed when the context is exited.
+        self.assertIsNone(subscription._connection)
+
     def test_concurrent_no_conflicts(self):
         self.uris = tmpfile_uris()
         self.db_uri = next(self.uris)
@@ -229,6 +307,29 @@ class TestSQLiteApplicationRecorder(ApplicationRecorderTestCase):
         super().test_concurrent_throughput()
 
 
+class TestSQLiteApplicationRecorderWithTopicIndex(TestSQLiteApplicationRecorder):
+    def create_recorder(self):
+        recorder = SQLiteApplicationRecorder(
+            SQLiteDatastore(db_name=self.db_uri, pool_size=100), topic_index=True
+        )
+        recorder.create_table()
+        return recorder
+
+    def test_select_notifications_with_topics_uses_topic_index(self):
+        self.db_uri = ":memory:"
+        recorder = self.create_recorder()
+        statement, params = recorder._construct_select_notifications_statement(
+            1, 10, None, ["topic1", "topic2"]
+        )
+        with recorder.datastore.transaction(commit=False) as c:
+            c.execute("EXPLAIN QUERY PLAN " + statement, params)
+            plan = [row["detail"] for row in c.fetchall()]
+        searches = [d for d in plan if d.startswith("SEARCH")]
+        self.assertEqual(len(searches), 2)
+        for detail in searches:
+            self.assertIn(f"USING INDEX {recorder.topic_index_name}", detail)
+
+
 class TestSQLiteApplicationRecorderErrors(TestCase):
     def test_insert_raises_operational_error_if_table_not_created(self):
         recorder = SQLiteApplicationRecorder(SQLiteDatastore(":memory:"))
@@ -282,6 +383,24 @@ class TestSQLiteProcessRecorderErrors(TestCase):
             recorder.max_tracking_id("application name")
 
 
+class TestAsyncSQLiteAggregateRecorder(AsyncAggregateRecorderTestCase):
+    async def create_recorder(self):
+        datastore = AsyncSQLiteDatastore(SQLiteDatastore(":memory:"))
+        self.addAsyncCleanup(datastore.close)
+        recorder = AsyncSQLiteAggregateRecorder(datastore)
+        await recorder.create_table()
+        return recorder
+
+
+class TestAsyncSQLiteApplicationRecorder(AsyncApplicationRecorderTestCase):
+    async def create_recorder(self):
+        datastore = AsyncSQLiteDatastore(SQLiteDatastore(":memory:"))
+        self.addAsyncCleanup(datastore.close)
+        recorder = AsyncSQLiteApplicationRecorder(datastore)
+        await recorder.create_table()
+        return recorder
+
+
 class TestSQLiteInfrastructureFactory(InfrastructureFactoryTestCase):
     def expected_factory_class(self):
         return Factory
@@ -307,6 +426,8 @@ class TestSQLiteInfrastructureFactory(InfrastructureFactoryTestCase):
             del self.env[Factory.SQLITE_DBNAME]
         if Factory.SQLITE_LOCK_TIMEOUT in self.env:
             del self.env[Factory.SQLITE_LOCK_TIMEOUT]
+        if Factory.SQLITE_TOPIC_INDEX in self.env:
+            del self.env[Factory.SQLITE_TOPIC_INDEX]
 
     def test_construct_raises_environment_error_when_dbname_missing(self):
         del self.env[Factory.SQLITE_DBNAME]
@@ -328,6 +449,21 @@ class TestSQLiteInfrastructureFactory(InfrastructureFactoryTestCase):
             "is invalid. If set, an int or empty string is expected: 'abc'",
         )
 
+    def test_topic_index(self):
+        factory = Factory(self.env)
+        recorder = factory.application_recorder()
+        assert isinstance(recorder, SQLiteApplicationRecorder)
+        self.assertFalse(recorder.topic_index)
+
+        self.env[Factory.SQLITE_TOPIC_INDEX] = "y"
+        factory = Factory(self.env)
+        recorder = factory.application_recorder()
+        assert isinstance(recorder, SQLiteApplicationRecorder)
+        self.assertTrue(recorder.topic_index)
+        recorder = factory.process_recorder()
+        assert isinstance(recorder, SQLiteProcessRecorder)
+        self.assertTrue(recorder.topic_index)
+
     def test_lock_timeout_value(self):
         factory = Factory(self.env)
         self.assertEqual(factory.datastore.pool.lock_timeout, None)
@@ -343,6 +479,8 @@ class TestSQLiteInfrastructureFactory(InfrastructureFactoryTestCase):
 
 del AggregateRecorderTestCase
 del ApplicationRecorderTestCase
+del AsyncAggregateRecorderTestCase
+del AsyncApplicationRecorderTestCase
 del ProcessRecorderTestCase
 del InfrastructureFactoryTestCase
 del SQLiteConnectionPoolTestCase
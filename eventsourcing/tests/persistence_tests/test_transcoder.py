@@ -1,8 +1,18 @@
-from unittest import skip
+from decimal import Decimal
+from importlib.util import find_spec
+from unittest import skip, skipIf
+from uuid import UUID
 
-from eventsourcing.persistence import JSONTranscoder, UUIDAsHex
+from eventsourcing.persistence import (
+    DatetimeAsISO,
+    DecimalAsStr,
+    JSONTranscoder,
+    UUIDAsHex,
+)
 from eventsourcing.tests.persistence import (
+    CustomType1,
     CustomType1AsDict,
+    CustomType2,
     CustomType2AsDict,
     TranscoderTestCase,
 )
@@ -41,4 +51,113 @@ class TestJSONTranscoder(TranscoderTestCase):
         pass
 
 
+@skipIf(find_spec("msgpack") is None, "msgpack is not installed")
+class TestMsgPackTranscoder(TranscoderTestCase):
+    def construct_transcoder(self):
+        from eventsourcing.msgpack import MsgPackTranscoder
+
+        transcoder = MsgPackTranscoder()
+        transcoder.register(CustomType1AsDict())
+        transcoder.register(CustomType2AsDict())
+        transcoder.register(UUIDAsHex())
+        return transcoder
+
+    def test_str(self):
+        obj = "a"
+        data = self.transcoder.encode(obj)
+        self.assertEqual(data, b"\xa1a")
+        self.assertEqual(obj, self.transcoder.decode(data))
+
+        obj = "🐈 哈哈"
+        data = self.transcoder.encode(obj)
+        self.assertEqual(b"\xab\xf0\x9f\x90\x88 \xe5\x93\x88\xe5\x93\x88", data)
+        self.assertEqual(obj, self.transcoder.decode(data))
+
+    def test_dict(self):
+        # Empty dict.
+        obj = {}
+        data = self.transcoder.encode(obj)
+        self.assertEqual(data, b"\x80")
+        self.assertEqual(obj, self.transcoder.decode(data))
+
+        # Dict with many keys.
+        obj = {"a": 1, "b": 2}
+        data = self.transcoder.encode(obj)
+        self.assertEqual(data, b"\x82\xa1a\x01\xa1b\x02")
+        self.assertEqual(obj, self.transcoder.decode(data))
+
+        # Int in dict in dict in dict.
+        obj = {"a": {"b": {"c": 1}}}
+        data = self.transcoder.encode(obj)
+        self.assertEqual(obj, self.transcoder.decode(data))
+
+        # Int keys.
+        obj = {1: "a"}
+        data = self.transcoder.encode(obj)
+        self.assertEqual(obj, self.transcoder.decode(data))
+
+    def test_nested_custom_type(self):
+        obj = CustomType2(CustomType1(UUID("b2723fe2c01a40d2875ea3aac6a09ff5")))
+        data = self.transcoder.encode(obj)
+        copy = self.transcoder.decode(data)
+        self.assertIsInstance(copy, CustomType2)
+        self.assertIsInstance(copy.value, CustomType1)
+        self.assertIsInstance(copy.value.value, UUID)
+        self.assertEqual(copy.value.value, obj.value.value)
+
+    def test_bytes(self):
+        obj = {"a": b"\x00\x01"}
+        data = self.transcoder.encode(obj)
+        self.assertEqual(obj, self.transcoder.decode(data))
+
+    def test_decodes_data_encoded_by_json_transcoder(self):
+        from eventsourcing.msgpack import MsgPackTranscoder
+
+        json_transcoder = JSONTranscoder()
+        msgpack_transcoder = MsgPackTranscoder()
+        for transcoder in [json_transcoder, msgpack_transcoder]:
+            transcoder.register(UUIDAsHex())
+            transcoder.register(DecimalAsStr())
+            transcoder.register(DatetimeAsISO())
+
+        obj = {
+            "id": UUID("b2723fe2c01a40d2875ea3aac6a09ff5"),
+            "amount": Decimal("10.00"),
+            "items": [1, "a", {"b": None}],
+        }
+
+        # Check old records encoded with JSON can be decoded.
+        old_data = json_transcoder.encode(obj)
+        self.assertEqual(obj, msgpack_transcoder.decode(old_data))
+
+        # Check new records are smaller.
+        new_data = msgpack_transcoder.encode(obj)
+        self.assertLess(len(new_data), len(old_data))
+        self.assertEqual(obj, msgpack_transcoder.decode(new_data))
+
+    @skip("test_tuple(): MsgPackTranscoder converts tuples to lists")
+    def test_tuple(self):
+        pass
+
+    @skip("test_mixed(): MsgPackTranscoder converts tuples to lists")
+    def test_mixed(self):
+        pass
+
+    @skip("test_dict_subclass(): MsgPackTranscoder converts dict subclasses to dict")
+    def test_dict_subclass(self):
+        pass
+
+    @skip("test_list_subclass(): MsgPackTranscoder converts list subclasses to list")
+    def test_list_subclass(self):
+        pass
+
+    @skip("test_str_subclass(): MsgPackTranscoder converts str subclasses to str")
+    def test_str_subclass(self):
+        pass
+
+    @skip("test_int_subclass(): MsgPackTranscoder converts int subclasses to int")
+    def test_int_subclass(self):
+        pass
+
+
 del TranscoderTestCase
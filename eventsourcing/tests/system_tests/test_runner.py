@@ -28,6 +28,7 @@ from eventsourcing.postgres import PostgresDatastore
 from eventsourcing.system import (
     ConvertingThread,
     EventProcessingError,
+    MultiProcessRunner,
     MultiThreadedRunner,
     NewMultiThreadedRunner,
     NewSingleThreadedRunner,
@@ -41,7 +42,7 @@ from eventsourcing.system import (
     SingleThreadedRunner,
     System,
 )
-from eventsourcing.tests.application import BankAccounts
+from eventsourcing.tests.application import BankAccounts, EmailAddressAsStr
 from eventsourcing.tests.application_tests.test_processapplication import EmailProcess
 from eventsourcing.tests.persistence import tmpfile_uris
 from eventsourcing.tests.postgres_utils import drop_postgres_table
@@ -55,6 +56,30 @@ class EmailProcess2(EmailProcess):
     pass
 
 
+class PidLogger(ProcessApplication):
+    """
+    Logs the ID of the operating system process that processed each event.
+    """
+
+    class PidLogged(Aggregate):
+        def __init__(self, pid: int):
+            self.pid = pid
+
+    def register_transcodings(self, transcoder):
+        super().register_transcodings(transcoder)
+        transcoder.register(EmailAddressAsStr())
+
+    def policy(self, _, processing_event):
+        processing_event.collect_events(self.PidLogged(os.getpid()))
+
+    def get_pids(self) -> List[int]:
+        pids = []
+        for notification in self.notification_log.select(start=1, limit=10):
+            domain_event = self.mapper.to_domain_event(notification)
+            pids.append(self.repository.get(domain_event.originator_id).pid)
+        return pids
+
+
 TRunner = TypeVar("TRunner", bound=Runner)
 
 
@@ -516,6 +541,9 @@ class TestMultiThreadedRunner(RunnerTestCase[MultiThreadedRunner]):
             self.runner = None
             raise Exception("Runner errored: " + str(e)) from e
 
+    def assert_error_message(self, error: Exception, msg: str) -> None:
+        self.assertEqual(error.args[0], msg)
+
     class BrokenInitialisation(EmailProcess):
         def __init__(self, *_, **__):
             msg = "Just testing error handling when initialisation is broken"
@@ -605,8 +633,8 @@ class TestMultiThreadedRunner(RunnerTestCase[MultiThreadedRunner]):
         # Check watch_for_errors() raises exception.
         with self.assertRaises(EventProcessingError) as cm:
             self.runner.watch_for_errors(timeout=1)
-        self.assertEqual(
-            cm.exception.args[0],
+        self.assert_error_message(
+            cm.exception,
             "Just testing error handling when processing is broken",
         )
         self.runner = None
@@ -668,6 +696,7 @@ class TestMultiThreadedRunnerWithSQLiteFileBased(TestMultiThreadedRunner):
         os.environ["BROKENPULLING_SQLITE_DBNAME"] = next(uris)
         os.environ["COMMANDS_SQLITE_DBNAME"] = next(uris)
         os.environ["RESULTS_SQLITE_DBNAME"] = next(uris)
+        os.environ["PIDLOGGER_SQLITE_DBNAME"] = next(uris)
 
     def tearDown(self):
         del os.environ["PERSISTENCE_MODULE"]
@@ -680,6 +709,7 @@ class TestMultiThreadedRunnerWithSQLiteFileBased(TestMultiThreadedRunner):
         del os.environ["BROKENPULLING_SQLITE_DBNAME"]
         del os.environ["COMMANDS_SQLITE_DBNAME"]
         del os.environ["RESULTS_SQLITE_DBNAME"]
+        del os.environ["PIDLOGGER_SQLITE_DBNAME"]
         super().tearDown()
 
 
@@ -928,4 +958,93 @@ class TestNewMultiThreadedRunner(TestMultiThreadedRunner):
             raise Exception("Runner errored: " + str(e)) from e
 
 
+class TestMultiProcessRunner(TestMultiThreadedRunnerWithSQLiteFileBased):
+    runner_class = MultiProcessRunner
+
+    def wait_for_runner(self):
+        sleep(0.5)
+        try:
+            self.runner.reraise_process_errors()
+        except Exception as e:
+            self.runner = None
+            raise Exception("Runner errored: " + str(e)) from e
+
+    def assert_error_message(self, error: Exception, msg: str) -> None:
+        # The traceback of the error in the worker process is sent.
+        self.assertTrue(error.args[0].startswith("Traceback"))
+        self.assertTrue(error.args[0].endswith(f"ProgrammingError: {msg}\n"))
+
+    def test_system_with_processing_loop(self):
+        self.skipTest(
+            "Event classes defined in test method can't be resolved by topic "
+            "in worker processes"
+        )
+
+    def test_raises_programming_error_if_using_popo(self):
+        system = System(pipes=[[BankAccounts, EmailProcess]])
+        with self.assertRaises(ProgrammingError):
+            self.runner_class(system, env={"PERSISTENCE_MODULE": "eventsourcing.popo"})
+
+    def test_raises_programming_error_if_using_sqlite_in_memory(self):
+        system = System(pipes=[[BankAccounts, EmailProcess]])
+        with self.assertRaises(ProgrammingError):
+            self.runner_class(
+                system,
+                env={
+                    "PERSISTENCE_MODULE": "eventsourcing.sqlite",
+                    f"{BankAccounts.name.upper()}_SQLITE_DBNAME": ":memory:",
+                },
+            )
+
+    def test_processes_followers_in_other_processes(self):
+        system = System(pipes=[[BankAccounts, EmailProcess, PidLogger]])
+        self.start_runner(system)
+
+        accounts = self.runner.get(BankAccounts)
+        accounts.open_account(
+            full_name="Alice",
+            email_address="alice@example.com",
+        )
+
+        # Check the email process was prompted by the accounts in this
+        # process, and the pid logger was prompted by the email process.
+        self.wait_for_runner()
+        pid_logger = self.runner.get(PidLogger)
+        self.assertEqual(pid_logger.recorder.max_tracking_id(EmailProcess.name), 1)
+        pids = pid_logger.get_pids()
+        self.assertEqual(len(pids), 1)
+        self.assertNotEqual(pids[0], os.getpid())
+
+
+class TestMultiProcessRunnerWithPostgres(TestMultiThreadedRunnerWithPostgres):
+    runner_class = MultiProcessRunner
+
+    def setUp(self):
+        super().setUp()
+        db = PostgresDatastore(
+            os.getenv("POSTGRES_DBNAME"),
+            os.getenv("POSTGRES_HOST"),
+            os.getenv("POSTGRES_PORT"),
+            os.getenv("POSTGRES_USER"),
+            os.getenv("POSTGRES_PASSWORD"),
+        )
+        drop_postgres_table(db, "pidlogger_events")
+        drop_postgres_table(db, "pidlogger_tracking")
+        db.close()
+
+    def wait_for_runner(self):
+        sleep(0.6)
+        TestMultiProcessRunner.wait_for_runner(self)
+
+    assert_error_message = TestMultiProcessRunner.assert_error_message
+
+    test_system_with_processing_loop = (
+        TestMultiProcessRunner.test_system_with_processing_loop
+    )
+
+    test_processes_followers_in_other_processes = (
+        TestMultiProcessRunner.test_processes_followers_in_other_processes
+    )
+
+
 del RunnerTestCase
@@ -1,3 +1,4 @@
+import asyncio
 from typing import cast
 from unittest import TestCase
 
@@ -129,6 +130,30 @@ class TestRetryDecorator(TestCase):
             def f():
                 pass
 
+    def test_coroutine_function(self):
+        self.call_count = 0
+
+        @retry(ValueError, max_attempts=3, wait=0.001, stall=0.001)
+        async def f():
+            self.call_count += 1
+            if self.call_count < 3:
+                raise ValueError
+            return self.call_count
+
+        self.assertEqual(asyncio.run(f()), 3)
+
+        self.call_count = 0
+
+        @retry(ValueError, max_attempts=2)
+        async def g():
+            self.call_count += 1
+            raise ValueError
+
+        with self.assertRaises(ValueError):
+            asyncio.run(g())
+
+        self.assertEqual(self.call_count, 2)
+
 
 class TestStrtobool(TestCase):
     def test_true_values(self):
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import importlib
 import sys
 from functools import wraps
-from inspect import isfunction
+from inspect import iscoroutinefunction, isfunction
 from random import random
 from threading import Lock
 from time import sleep
@@ -155,6 +156,28 @@ def retry(
 
     @no_type_check
     def _retry(func):
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_retry_decorator(*args, **kwargs):
+                if stall:
+                    await asyncio.sleep(stall)
+                attempts = 0
+                while True:
+                    try:
+                        return await func(*args, **kwargs)
+                    except exc:  # noqa: PERF203
+                        attempts += 1
+                        if max_attempts is None or attempts < max_attempts:
+                            await asyncio.sleep(
+                                wait * (1 + 0.1 * (random() - 0.5))  # noqa: S311
+                            )
+                        else:
+                            # Max retries exceeded.
+                            raise
+
+            return async_retry_decorator
+
         @wraps(func)
         def retry_decorator(*args, **kwargs):
             if stall: